@@ -1,4 +1,5 @@
 from pathlib import Path
+import multiprocessing
 import sys
 import argparse
 import traceback
@@ -9,25 +10,32 @@ from infra.config import INPUT_DIR, CHUNKS_DIR
 from infra import config
 
 from processing.video_chunker import chunk_video
-from processing.audio_extractor import extract_audio_from_chunks
+from processing.audio_extractor import (
+    extract_audio_from_chunks,
+    extract_audio_single_pass,
+)
 from processing.audio_rms import calculate_rms_energy, write_rms_to_metadata
 from processing.transcriber import transcribe_audio_chunks
+from processing.transcript_refiner import refine_highlight_transcripts
 from scoring.text_features import count_keyword_hits_per_chunk
 from scoring.score_merger import merge_text_scores_into_chunks
 from scoring.scoring import apply_final_scores_to_chunks
 from highlights.highlight_selector import flag_highlight_chunks
 from scoring.score_logger import log_scores_for_tuning
 from highlights.highlight_merger import merge_adjacent_highlights
+from scoring.dense_scoring import select_window_highlights
 from highlights.highlight_buffer import add_buffers_to_highlights
 from highlights.highlight_filter import filter_short_highlights
 from highlights.clip_extractor import extract_highlight_clips
 from highlights.clip_concatenator import concatenate_clips
 from output.final_encoder import encode_final_video
 from pipeline.reset import reset_derived_state
+from pipeline.streaming import run_streaming_front_end, streaming_supported
 from infra.logger import setup_logger
 from output.cleanup import cleanup_temporary_files
 
 # Chat Processing Imports
+from processing.chat.chat_aggregates import compute_chat_aggregates
 from processing.chat.activity_metrics import compute_messages_per_second
 from processing.chat.baseline_metrics import compute_rolling_baseline
 from processing.chat.spike_detection import detect_chat_spikes
@@ -157,18 +165,26 @@ def run_pipeline(
     chunks = chunk_video(str(input_video), logger)
     step += 1
 
-    report("Extracting audio from chunks")
-    extract_audio_from_chunks(logger, resume)
-    step += 1
-
-    report("Calculating audio RMS energy")
-    rms_results = calculate_rms_energy(logger, resume)
-    write_rms_to_metadata(rms_results)
-    step += 1
-
-    report("Transcribing audio (Whisper)")
-    transcribe_audio_chunks(logger, resume)
-    step += 1
+    if config.ENABLE_STREAMING_PIPELINE and streaming_supported():
+        report("Extracting and transcribing audio (streaming)")
+        run_streaming_front_end(input_video, logger, resume)
+        step += 3
+    else:
+        report("Extracting audio from chunks")
+        if config.AUDIO_SINGLE_PASS_DECODE:
+            extract_audio_single_pass(input_video, logger, resume)
+        else:
+            extract_audio_from_chunks(logger, resume)
+        step += 1
+
+        report("Calculating audio RMS energy")
+        rms_results = calculate_rms_energy(logger, resume)
+        write_rms_to_metadata(rms_results)
+        step += 1
+
+        report("Transcribing audio (Whisper)")
+        transcribe_audio_chunks(logger, resume)
+        step += 1
 
     logger.info(">>> AFTER TRANSCRIPTION — ENTERING SCORING <<<")
 
@@ -190,6 +206,15 @@ def run_pipeline(
 
     report("Selecting highlight chunks")
     flag_highlight_chunks()
+
+    if refine_highlight_transcripts(logger):
+        # Re-score with the refined candidate transcripts
+        count_keyword_hits_per_chunk(logger)
+        merge_text_scores_into_chunks()
+        apply_final_scores_to_chunks()
+        apply_chat_boost_to_chunks(logger, chat_weight)
+        flag_highlight_chunks()
+
     logger.info("STEP %d DONE: selecting highlights", step)
     step += 1
 
@@ -199,7 +224,10 @@ def run_pipeline(
     step += 1
 
     report("Merging adjacent highlights")
-    merge_adjacent_highlights()
+    if config.SCORING_MODE == "window":
+        select_window_highlights(logger, chat_weight)
+    else:
+        merge_adjacent_highlights()
     logger.info("STEP %d DONE: merging highlights", step)
     step += 1
 
@@ -231,6 +259,9 @@ def run_pipeline(
 
 
 def main():
+    # Pool workers are spawned processes, also in a frozen build
+    multiprocessing.freeze_support()
+
     args = parse_args()
     logger = setup_logger()
 
@@ -274,6 +305,7 @@ def main():
         
 
         # Phase 2 – chat metrics
+        compute_chat_aggregates(logger)
         compute_messages_per_second(logger)
         compute_rolling_baseline(logger)
         detect_chat_spikes(logger)
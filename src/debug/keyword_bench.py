@@ -0,0 +1,110 @@
+# src/debug/keyword_bench.py
+#
+# Keyword matching benchmark on synthetic chat and transcripts:
+#
+#   cd src && python -m debug.keyword_bench
+#
+# "scan" is the per-keyword loop the matcher replaced (str.count per
+# category for transcripts, `kw in text` per message for chat).
+
+import json
+import random
+import time
+
+import numpy as np
+
+from infra.config import CHAT_KEYWORDS_PATH, KEYWORDS_PATH
+from processing.keyword_matcher import _flatten_groups, compiled_keyword_groups
+
+CHAT_MESSAGES = 200_000
+DISTINCT_CHAT_MESSAGES = 20_000
+TRANSCRIPTS = 2_000
+TRANSCRIPT_WORDS = 120
+
+FILLER = (
+    "the a and so i you it this that is was what no way chat bro kekw pog "
+    "lol gg man really okay wait why how just go"
+).split()
+
+
+def _texts(rng, phrases, count, length):
+    vocabulary = FILLER + phrases
+    return [
+        " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, length)))
+        for _ in range(count)
+    ]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def bench_chat(rng):
+    groups = compiled_keyword_groups(CHAT_KEYWORDS_PATH)
+    phrases = groups.matcher.phrases
+    keywords = set(phrases)
+
+    distinct = _texts(rng, phrases, DISTINCT_CHAT_MESSAGES, 12)
+    messages = [rng.choice(distinct) for _ in range(CHAT_MESSAGES)]
+
+    def scan():
+        return [sorted(kw for kw in keywords if kw in text) for text in messages]
+
+    def matcher():
+        found_by_text = {}
+        out = []
+        for text in messages:
+            found = found_by_text.get(text)
+            if found is None:
+                found = found_by_text[text] = groups.matcher.present(text)
+            out.append(sorted(phrases[i] for i in found))
+        return out
+
+    scan_time, expected = _timed(scan)
+    matcher_time, result = _timed(matcher)
+    assert result == expected
+
+    return scan_time, matcher_time
+
+
+def bench_transcripts(rng):
+    with open(KEYWORDS_PATH, "r", encoding="utf-8") as f:
+        by_group = _flatten_groups(json.load(f))
+
+    groups = compiled_keyword_groups(KEYWORDS_PATH)
+    texts = _texts(rng, groups.matcher.phrases, TRANSCRIPTS, TRANSCRIPT_WORDS)
+
+    def scan():
+        return [
+            {
+                name: sum(text.count(phrase) for phrase in phrases)
+                for name, phrases in by_group.items()
+            }
+            for text in texts
+        ]
+
+    def matcher():
+        return [groups.count_groups(text) for text in texts]
+
+    scan_time, expected = _timed(scan)
+    matcher_time, result = _timed(matcher)
+    assert result == expected
+
+    return scan_time, matcher_time
+
+
+def main(repeats: int = 3):
+    for name, bench in (("chat", bench_chat), ("transcripts", bench_transcripts)):
+        timings = np.array([bench(random.Random(seed)) for seed in range(repeats)])
+        scan_time, matcher_time = timings.min(axis=0)
+
+        print(
+            f"{name:12s} scan {scan_time:7.3f}s   matcher {matcher_time:7.3f}s   "
+            f"speedup {scan_time / matcher_time:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
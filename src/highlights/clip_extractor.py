@@ -4,6 +4,7 @@ from pathlib import Path
 import shutil
 
 from infra.config import DATA_DIR
+from processing.media_index import load_keyframe_index
 
 
 HIGHLIGHTS_DIR = DATA_DIR / "highlights"
@@ -28,6 +29,8 @@ def extract_highlight_clips(input_video: Path, logger, resume: bool):
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+    keyframe_index = load_keyframe_index(input_video, logger)
+
     extracted = []
 
     for idx, h in enumerate(highlights, start=1):
@@ -41,13 +44,16 @@ def extract_highlight_clips(input_video: Path, logger, resume: bool):
             extracted.append(output_path)
             continue
 
-        start = h["start_time"]
+        # Stream copy can only start on a keyframe: seek to the keyframe
+        # at or before the requested start so the clip keeps its end time
+        start = keyframe_index.keyframe_at_or_before(h["start_time"])
         end = h["end_time"]
         duration = end - start
 
         logger.info(
             f"Clip [{idx}/{total}] extracting "
-            f"{start:.2f}s → {end:.2f}s"
+            f"{start:.2f}s → {end:.2f}s "
+            f"(requested start {h['start_time']:.2f}s)"
         )
 
         command = [
@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+from highlights.timeline_io import load_timeline
 from infra.config import (
     DATA_DIR,
     PRE_BUFFER_SECONDS,
@@ -17,8 +18,7 @@ def add_buffers_to_highlights():
     if not TIMELINE_PATH.exists():
         raise RuntimeError("highlight_timeline.json not found")
 
-    with open(TIMELINE_PATH, "r", encoding="utf-8") as f:
-        highlights = json.load(f)
+    highlights = load_timeline(TIMELINE_PATH)["timeline"]
 
     buffered = []
 
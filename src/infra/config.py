@@ -46,6 +46,10 @@ KEYWORDS_PATH = ASSETS_DIR / "keywords.json"
 CHAT_KEYWORDS_PATH = ASSETS_DIR / "chat_keywords.json"
 HYPE_EMOTES_PATH = ASSETS_DIR / "hype_emotes.json"
 
+# Keyword matching: False counts substrings (as str.count), True only
+# whole-word / whole-phrase matches
+KEYWORD_WORD_BOUNDARY = False
+
 
 # ─────────────────────────────────────────────
 # Runtime Data Directories
@@ -80,13 +84,100 @@ for directory in (
 CHUNK_DURATION_SECONDS = 45
 AUDIO_SAMPLE_RATE = 16000
 
+# Virtual chunking: chunks are logical time ranges over the source video
+# instead of physically remuxed chunk_*.mp4 files
+VIRTUAL_CHUNKING = True
+
+# Audio extraction: decode the source once instead of once per chunk
+AUDIO_SINGLE_PASS_DECODE = True
+
+# Single-pass decode writes one mono AUDIO_SAMPLE_RATE memory-mapped PCM
+# store (data/audio/audio.pcm) instead of per-chunk WAV files
+AUDIO_STORE_ENABLED = True
+
+# Streaming: decode, RMS and transcription overlap per chunk through
+# bounded queues (needs single-pass decode into the audio store)
+ENABLE_STREAMING_PIPELINE = True
+STREAMING_QUEUE_SIZE = 4
+
 # Audio analysis
 SPIKE_THRESHOLD = 1.5
 SILENCE_RMS_THRESHOLD = 1e-4
 
+# Per-second audio spikes: RMS over the mean non-silent RMS of a
+# centered window of this many seconds. 0 = over the whole-VOD median
+# (the per-chunk rule).
+AUDIO_SPIKE_BASELINE_SECONDS = 0
+
+# Frame hop of the whole-VOD RMS envelope (seconds)
+AUDIO_ENVELOPE_HOP_SECONDS = 0.1
+
+# Spectral features (STFT over the audio store, in samples / frames)
+AUDIO_FEATURE_N_FFT = 1024
+AUDIO_FEATURE_HOP = 512
+AUDIO_FEATURE_BLOCK_FRAMES = 8192
+
 # Whisper
 WHISPER_MODEL_NAME = "base"
 
+# Per-word timestamps in transcript segments (slower decode); the text
+# scorer then places keyword hits on the spoken word instead of the segment
+WHISPER_WORD_TIMESTAMPS = False
+
+# Transcription windowing: "chunk" transcribes each analysis chunk,
+# "fixed" packs the VOD into Whisper-sized windows, "speech" packs only
+# speech regions (VAD) into them; segments are mapped back onto chunks
+TRANSCRIPTION_WINDOWING = "speech"
+TRANSCRIPTION_WINDOW_SECONDS = 30
+
+# Cascade transcription: CASCADE_FAST_MODEL_NAME transcribes the whole VOD
+# for scoring; highlight candidates (plus PRE/POST buffers) are then
+# re-transcribed with WHISPER_MODEL_NAME and re-scored
+TRANSCRIPTION_CASCADE = False
+CASCADE_FAST_MODEL_NAME = "tiny"
+
+# Spoken language of the VOD ("auto" = detect once per VOD from the
+# LANGUAGE_DETECTION_SAMPLES most speech-heavy 30 s windows, then pin it)
+TRANSCRIPTION_LANGUAGE = "auto"
+LANGUAGE_DETECTION_SAMPLES = 3
+
+# Transcription backend: "openai-whisper" or "faster-whisper"
+TRANSCRIPTION_BACKEND = "openai-whisper"
+
+# CPU threads used by the backend (0 = library default)
+TRANSCRIPTION_CPU_THREADS = 0
+
+# Parallel transcription (opt-in): worker processes, each with its own
+# model and thread count. 1 transcribes in-process or via the server;
+# 0 derives the worker count from the physical cores. Every worker
+# holds a full model in memory, and the pool bypasses the server.
+TRANSCRIPTION_WORKERS = 1
+TRANSCRIPTION_THREADS_PER_WORKER = 0
+
+# Content-addressed transcript cache (CACHE_DIR/transcripts), shared by
+# all runs and presets; least recently used entries go past the limit
+TRANSCRIPT_CACHE_ENABLED = True
+TRANSCRIPT_CACHE_MAX_MB = 512
+
+# Persistent transcription server: keeps models loaded across runs and
+# serves their requests in order (the UI starts it; CLI runs use it if
+# up and its decode options match theirs)
+TRANSCRIPTION_SERVER_ENABLED = True
+TRANSCRIPTION_SERVER_PORT = 50517
+
+# Voice activity gating: Whisper only sees speech spans (audio store only)
+VAD_ENABLED = True
+VAD_THRESHOLD_RATIO = 3.0      # × noise floor of the RMS envelope
+VAD_MIN_RMS = 0.005
+VAD_MAX_RMS = 0.03             # caps the threshold when there is no quiet floor
+VAD_MIN_SPEECH_SECONDS = 0.5
+VAD_MIN_SILENCE_SECONDS = 1.0  # shorter pauses stay inside a region
+VAD_PAD_SECONDS = 0.3
+
+# faster-whisper (CTranslate2) options
+FASTER_WHISPER_COMPUTE_TYPE = "int8"
+FASTER_WHISPER_BEAM_SIZE = 5
+
 # Phase 1 scoring
 AUDIO_WEIGHT = 0.7
 TEXT_WEIGHT = 0.3
@@ -94,6 +185,17 @@ TEXT_WEIGHT = 0.3
 # Highlight selection
 HIGHLIGHT_THRESHOLD = 0.65
 
+# Window-mode weights of the spectral audio features (0 = unused)
+ONSET_WEIGHT = 0.0
+SPECTRAL_FLUX_WEIGHT = 0.0
+SPECTRAL_CENTROID_WEIGHT = 0.0
+
+# Scoring mode: "chunk" scores fixed chunks, "window" slides a window over
+# dense per-second fused scores so highlights follow the actual moment
+SCORING_MODE = "chunk"
+SCORING_WINDOW_SECONDS = 10
+SCORING_HOP_SECONDS = 1
+
 # Highlight refinement
 MERGE_GAP_SECONDS = 5
 PRE_BUFFER_SECONDS = 5
@@ -133,6 +235,10 @@ for directory in (
 ):
     directory.mkdir(parents=True, exist_ok=True)
 
+# Chat ingest runs every transform in one pass per message. Debug mode
+# runs the stages separately and keeps each stage's output above.
+CHAT_INGEST_DEBUG = False
+
 TWITCH_DOWNLOADER_PATH = INTERNAL_DIR / "tools" / "TwitchDownloaderCLI.exe"
 YT_DLP_PATH = INTERNAL_DIR / "tools" / "yt-dlp.exe"
 
@@ -144,6 +250,11 @@ YT_DLP_PATH = INTERNAL_DIR / "tools" / "yt-dlp.exe"
 CHAT_METRICS_DIR = DATA_DIR / "chat" / "metrics"
 CHAT_METRICS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Per-second chat metrics live in one array file. The legacy per-metric
+# JSON files (messages_per_second, emote_density, repeated_emotes,
+# chat_keyword_hits) are only written when this is on.
+CHAT_METRICS_JSON_VIEWS = False
+
 CHAT_TO_VIDEO_OFFSET_SECONDS = 5
 
 
@@ -191,6 +302,25 @@ CHAT_SMOOTHING_WINDOW_SECONDS = 3
 TIMELINE_PATH = OUTPUT_DIR / "timeline.txt"
 
 
+# ─────────────────────────────────────────────
+# Persistent Caches (survive reset_derived_state)
+# ─────────────────────────────────────────────
+
+CACHE_DIR = DATA_DIR / "cache"
+KEYFRAME_INDEX_DIR = CACHE_DIR / "keyframes"
+FEATURE_CACHE_DIR = CACHE_DIR / "features"
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / "transcripts"
+TRANSCRIPTION_SERVER_KEY_PATH = CACHE_DIR / "transcription_server.key"
+
+for directory in (
+    CACHE_DIR,
+    KEYFRAME_INDEX_DIR,
+    FEATURE_CACHE_DIR,
+    TRANSCRIPT_CACHE_DIR,
+):
+    directory.mkdir(parents=True, exist_ok=True)
+
+
 #presets
 PRESETS_DIR = DATA_DIR / "presets"
 PRESETS_DIR.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,41 @@
+import hashlib
+from pathlib import Path
+
+
+# Bytes hashed from the head, middle and tail of a file
+FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+
+def file_fingerprint(path: Path) -> str:
+    """
+    Fast content fingerprint for multi-GB media files.
+    Hashes the file size plus three sampled blocks (head, middle, tail),
+    so it is independent of the file name, location and mtime.
+    """
+
+    path = Path(path)
+    size = path.stat().st_size
+
+    digest = hashlib.sha1()
+    digest.update(str(size).encode("ascii"))
+
+    with open(path, "rb") as f:
+        for offset, length in _sample_ranges(size):
+            f.seek(offset)
+            digest.update(f.read(length))
+
+    return digest.hexdigest()
+
+
+def _sample_ranges(size: int) -> list[tuple[int, int]]:
+    block = FINGERPRINT_SAMPLE_BYTES
+
+    # Small files are hashed completely
+    if size <= 3 * block:
+        return [(0, size)]
+
+    return [
+        (0, block),
+        (size // 2 - block // 2, block),
+        (size - block, block),
+    ]
@@ -0,0 +1,106 @@
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from infra.config import INPUT_DIR
+from infra.fingerprint import file_fingerprint
+
+
+FINGERPRINT_NAME_RE = re.compile(r"^[0-9a-f]{40}$")
+
+# Buffer used for the streamed copy
+COPY_BUFFER_BYTES = 16 * 1024 * 1024
+
+# Linux FICLONE ioctl (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+
+def stage_input(source: Path, logger) -> Path:
+    """
+    Places an input video into INPUT_DIR under its content fingerprint.
+    Tries hardlink → reflink → streamed copy; a symlink is the last
+    resort (e.g. no space for a copy), since it dangles once the user
+    moves the source. Staging the same VOD again is a no-op.
+    """
+
+    source = Path(source).resolve()
+    if not source.exists():
+        raise FileNotFoundError(source)
+
+    INPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    fingerprint = input_fingerprint(source)
+    staged = INPUT_DIR / f"{fingerprint}{source.suffix.lower()}"
+
+    if staged.exists():
+        logger.info(f"Input already staged: {staged.name}")
+        return staged
+
+    if staged.is_symlink():
+        # Dangling link from a source that was moved or deleted
+        staged.unlink()
+
+    tmp = staged.with_name(f"{staged.name}.partial")
+    if tmp.exists() or tmp.is_symlink():
+        tmp.unlink()
+
+    for method, place in (
+        ("hardlink", _hardlink),
+        ("reflink", _reflink),
+        ("copy", _streamed_copy),
+        ("symlink", _symlink),
+    ):
+        try:
+            place(source, tmp)
+        except OSError as e:
+            logger.info(f"Staging via {method} unavailable: {e}")
+            if tmp.exists() or tmp.is_symlink():
+                tmp.unlink()
+            continue
+
+        tmp.replace(staged)
+        logger.info(f"Staged input via {method}: {source} → {staged.name}")
+        return staged
+
+    raise RuntimeError(f"Failed to stage input video: {source}")
+
+
+def input_fingerprint(path: Path) -> str:
+    """
+    Fingerprint of an input video. Staged inputs carry it in their name,
+    so it is not recomputed for them.
+    """
+
+    path = Path(path)
+
+    if path.parent.resolve() == INPUT_DIR.resolve() and FINGERPRINT_NAME_RE.match(path.stem):
+        return path.stem
+
+    return file_fingerprint(path)
+
+
+def _hardlink(source: Path, target: Path):
+    os.link(source, target)
+
+
+def _reflink(source: Path, target: Path):
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink is only attempted on Linux")
+
+    import fcntl
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _symlink(source: Path, target: Path):
+    os.symlink(source, target)
+
+
+def _streamed_copy(source: Path, target: Path):
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_BYTES)
+
+    shutil.copystat(source, target)
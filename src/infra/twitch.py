@@ -3,22 +3,17 @@ import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from processing.chat.timestamp_normalizer import normalize_chat_timestamps
-from processing.chat.text_normalizer import normalize_chat_text
-from processing.chat.username_stripper import strip_usernames
-from processing.chat.emote_extractor import extract_emotes
-from processing.chat.message_filter import filter_chat_messages
-from processing.chat.final_chat_export import export_final_chat
+from processing.chat.chat_ingest import ingest_chat
 
 from infra.config import (
     TWITCH_DIR,
     TWITCH_VOD_DIR,
     TWITCH_META_DIR,
-    INPUT_DIR,
     TWITCH_CHAT_RAW_DIR,
     TWITCH_DOWNLOADER_PATH,
     YT_DLP_PATH,
 )
+from infra.staging import stage_input
 
 TWITCH_VOD_URL_RE = re.compile(r"(?:twitch\.tv/videos/)(\d+)")
 
@@ -162,21 +157,14 @@ def resolve_twitch_vod(vod_url: str, logger) -> TwitchVODMetadata:
     else:
         logger.info("Using cached Twitch VOD video")
 
-    # ─── Copy into INPUT_DIR for pipeline ─────
-    input_video_path = INPUT_DIR / video_path.name
-    if not input_video_path.exists():
-        input_video_path.write_bytes(video_path.read_bytes())
+    # ─── Stage into INPUT_DIR for pipeline ────
+    input_video_path = stage_input(video_path, logger)
 
     # ─── Download chat replay ─────────────────
     download_twitch_chat(vod_id, logger)
-    normalize_chat_timestamps(vod_id, logger)
-    normalize_chat_text(vod_id, logger)
-    strip_usernames(vod_id, logger)
-    extract_emotes(vod_id, logger)
-    filter_chat_messages(vod_id, logger)
-
-    # Final canonical export
-    export_final_chat(vod_id, logger)
+
+    # Normalize, clean and export the canonical chat in one pass
+    ingest_chat(vod_id, logger)
 
     return TwitchVODMetadata(
         vod_id=vod_id,
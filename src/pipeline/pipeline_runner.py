@@ -1,15 +1,16 @@
 from pathlib import Path
-import shutil
 
 import infra.config as config
 from app.cli import run_pipeline
 from infra.config import INPUT_DIR
 from pipeline.reset import reset_derived_state
 from infra.logger import setup_logger
+from infra.staging import stage_input
 from infra.twitch import resolve_twitch_vod
 from ui.input_modes import InputMode
 
 
+from processing.chat.chat_aggregates import compute_chat_aggregates
 from processing.chat.activity_metrics import compute_messages_per_second
 from processing.chat.baseline_metrics import compute_rolling_baseline
 from processing.chat.spike_detection import detect_chat_spikes
@@ -53,14 +54,13 @@ def run_pipeline_from_ui(
         if not input_video.exists():
             raise FileNotFoundError(input_video)
 
-        INPUT_DIR.mkdir(parents=True, exist_ok=True)
+        staged_input = stage_input(input_video, logger)
 
         # Clear previous inputs
         for f in INPUT_DIR.glob("*.mp4"):
-            f.unlink()
+            if f != staged_input:
+                f.unlink()
 
-        staged_input = INPUT_DIR / input_video.name
-        shutil.copy2(input_video, staged_input)
         input_video = staged_input
 
     elif input_mode == InputMode.TWITCH_URL:
@@ -69,6 +69,7 @@ def run_pipeline_from_ui(
 
         if chat_enabled:
             logger.info("Running chat metrics (UI mode)")
+            compute_chat_aggregates(logger)
             compute_messages_per_second(logger)
             compute_rolling_baseline(logger)
             detect_chat_spikes(logger)
@@ -89,6 +90,7 @@ def run_pipeline_from_ui(
 
         if chat_enabled:
             logger.info("Running chat metrics (UI mode)")
+            compute_chat_aggregates(logger)
             compute_messages_per_second(logger)
             compute_rolling_baseline(logger)
             detect_chat_spikes(logger)
@@ -2,6 +2,7 @@ import shutil
 from pathlib import Path
 
 from infra.config import DATA_DIR
+from processing.audio_store import AUDIO_INDEX_PATH, AUDIO_STORE_PATH
 
 
 DERIVED_DIRS = [
@@ -11,11 +12,32 @@ DERIVED_DIRS = [
     DATA_DIR / "output",
 ]
 
+# Derived files that validate themselves against the input fingerprint:
+# kept by the reset, so a fresh run over the same VOD skips the decode
+# (the extractor rebuilds them for any other input)
+FINGERPRINTED_FILES = [
+    AUDIO_STORE_PATH,
+    AUDIO_INDEX_PATH,
+]
+
 
 def reset_derived_state(resume: bool):
     if resume:
         return
 
     for path in DERIVED_DIRS:
-        if path.exists():
+        if not path.exists():
+            continue
+
+        kept = [f for f in FINGERPRINTED_FILES if f.parent == path and f.exists()]
+        if not kept:
             shutil.rmtree(path)
+            continue
+
+        for child in path.iterdir():
+            if child in kept:
+                continue
+            if child.is_dir() and not child.is_symlink():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
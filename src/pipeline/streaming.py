@@ -0,0 +1,406 @@
+import contextlib
+import queue
+import threading
+from concurrent.futures import as_completed
+
+import numpy as np
+
+import infra.config as config
+from processing.asr_backends import get_backend
+from processing.audio_extractor import (
+    clear_existing_audio,
+    iter_extract_to_store,
+    load_chunk_metadata,
+)
+from processing.audio_rms import (
+    compute_audio_envelope,
+    write_rms_to_metadata,
+)
+from processing.language_detection import known_language, resolve_language
+from processing.audio_store import (
+    INT16_SCALE,
+    open_audio_store,
+    open_partial_audio_store,
+)
+from processing.transcriber import (
+    first_pass_model_name,
+    load_cached_transcript,
+    prepare_transcripts,
+    transcribe_chunk,
+    windowed_transcription_enabled,
+    write_transcript,
+)
+from processing.transcription_pool import TranscriptionPool, open_pool
+from processing.transcription_windows import (
+    TranscriptionWindower,
+    transcribe_window,
+    write_chunk_transcripts,
+)
+from processing.vad import NoiseFloorEstimator, detect_range_speech_regions
+
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+# How often blocked queue calls re-check for cancellation (seconds)
+_POLL_SECONDS = 0.5
+
+
+class _StageFailure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def streaming_supported() -> bool:
+    """
+    Streaming needs chunk-by-chunk decode into the audio store.
+    """
+
+    return config.AUDIO_SINGLE_PASS_DECODE and config.AUDIO_STORE_ENABLED
+
+
+def run_streaming_front_end(input_video, logger, resume: bool):
+    """
+    Audio extraction → RMS → transcription as a producer/consumer chain.
+
+      decode thread ──queue──▶ RMS thread ──queue──▶ transcription (caller)
+
+    Chunk N is transcribed while chunk N+k is still being decoded; the
+    bounded queues (STREAMING_QUEUE_SIZE) pause decoding when Whisper
+    falls behind. Per-chunk resume works as in the sequential stages:
+    the cached store prefix and cached transcripts are reused.
+    """
+
+    config.AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+
+    if not resume:
+        clear_existing_audio()
+
+    prepare_transcripts(logger, resume)
+
+    chunks = load_chunk_metadata()
+    total = len(chunks)
+
+    decoded = queue.Queue(maxsize=config.STREAMING_QUEUE_SIZE)
+    measured = queue.Queue(maxsize=config.STREAMING_QUEUE_SIZE)
+    stop = threading.Event()
+
+    rms_results = {}
+
+    def decode():
+        stream = iter_extract_to_store(input_video, chunks, logger)
+        try:
+            for item in stream:
+                if not _put(decoded, item, stop):
+                    break
+        finally:
+            # Kills ffmpeg if we stopped early
+            stream.close()
+
+    def measure():
+        store = None
+        for stem, entry in _drain(decoded, stop):
+            store = _follow_store(store, stem, entry)
+            rms_results[stem] = _chunk_rms(store.chunk(stem))
+
+            if not _put(measured, (stem, entry), stop):
+                break
+
+    threads = [
+        threading.Thread(
+            target=_run_stage, args=(decode, decoded, stop),
+            name="stream-decode", daemon=True,
+        ),
+        threading.Thread(
+            target=_run_stage, args=(measure, measured, stop),
+            name="stream-rms", daemon=True,
+        ),
+    ]
+
+    logger.info(
+        f"Streaming pipeline: {total} chunks "
+        f"(queue size {config.STREAMING_QUEUE_SIZE})"
+    )
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        _transcribe_stream(measured, stop, total, logger, resume)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+
+    write_rms_to_metadata(rms_results)
+
+    # The whole-VOD envelope backs the dense scores and later VAD runs
+    store = open_audio_store()
+    if store is not None:
+        compute_audio_envelope(store, logger, resume)
+
+    logger.info("Streaming pipeline complete")
+
+
+def _transcribe_stream(measured, stop, total: int, logger, resume: bool):
+    model_name = first_pass_model_name()
+
+    # Worker processes start on the first submitted job, so a fully
+    # cached run never loads a model
+    pool = open_pool(logger, model_name)
+    backend = pool or get_backend(logger, model_name=model_name)
+
+    with pool or contextlib.nullcontext():
+        if windowed_transcription_enabled():
+            _transcribe_stream_windowed(
+                backend, measured, stop, total, logger, resume
+            )
+        else:
+            _transcribe_stream_chunks(
+                backend, measured, stop, total, logger, resume
+            )
+
+
+def _transcribe_stream_chunks(backend, measured, stop, total: int, logger, resume: bool):
+    # Unless configured, the VOD language is detected from the first
+    # chunks that need transcribing; they wait until it is pinned
+    pending = []
+    language = known_language(logger, resume)
+    language_resolved = language is not None
+
+    # Pool jobs still running: future → stem
+    in_flight = {}
+
+    store = None
+    noise_floor = NoiseFloorEstimator()
+
+    def flush():
+        for idx, stem, speech_regions in pending:
+            if isinstance(backend, TranscriptionPool):
+                future = backend.submit_chunk(stem, speech_regions, language)
+                in_flight[future] = stem
+                continue
+
+            logger.info(f"Whisper [{idx}/{total}] transcribing {stem}")
+
+            transcript_data = transcribe_chunk(
+                backend, store, stem, speech_regions, logger, language
+            )
+            write_transcript(stem, transcript_data)
+
+        pending.clear()
+        _collect_chunks(in_flight, logger, wait=False)
+
+    for idx, (stem, entry) in enumerate(_drain(measured, stop), start=1):
+        store = _follow_store(store, stem, entry)
+
+        speech_regions = None
+        if config.VAD_ENABLED:
+            # The whole-VOD envelope is not there yet — gate per chunk,
+            # against the noise floor of every chunk so far (cached ones
+            # included, so the threshold does not depend on the cache)
+            speech_regions = detect_range_speech_regions(
+                store.chunk(stem),
+                store.sample_rate,
+                int(entry["offset"]) / store.sample_rate,
+                noise_floor,
+            )
+
+        if load_cached_transcript(stem) is not None:
+            logger.info(f"Whisper [{idx}/{total}] cache hit: {stem}")
+            continue
+
+        pending.append((idx, stem, speech_regions))
+
+        if not language_resolved and len(pending) >= config.LANGUAGE_DETECTION_SAMPLES:
+            language = resolve_language(
+                backend, store, [_chunk_spans(store, s, r) for _, s, r in pending],
+                logger, resume,
+            )
+            language_resolved = True
+
+        if language_resolved:
+            flush()
+
+    if pending:
+        if not language_resolved:
+            language = resolve_language(
+                backend, store, [_chunk_spans(store, s, r) for _, s, r in pending],
+                logger, resume,
+            )
+        flush()
+
+    _collect_chunks(in_flight, logger, wait=True)
+
+    logger.info("Transcription completed successfully")
+
+
+def _collect_chunks(in_flight: dict, logger, wait: bool):
+    """
+    Writes the transcripts of finished pool jobs (all of them when wait).
+    """
+
+    futures = list(in_flight)
+    if wait:
+        futures = as_completed(futures)
+
+    for future in futures:
+        if not future.done():
+            continue
+
+        stem = in_flight.pop(future)
+        write_transcript(stem, future.result())
+        logger.info(f"Whisper transcribed {stem} ({len(in_flight)} in flight)")
+
+
+def _chunk_spans(store, stem, speech_regions):
+    entry = store.chunks[stem]
+    start = int(entry["offset"]) / store.sample_rate
+    end = start + int(entry["length"]) / store.sample_rate
+
+    if speech_regions is None:
+        return [(start, end)]
+
+    return speech_regions
+
+
+def _transcribe_stream_windowed(backend, measured, stop, total: int, logger, resume: bool):
+    """
+    Feeds arriving chunks into the windower and transcribes each window
+    as soon as it is full, independent of chunk boundaries. Until the
+    VOD language is pinned, finished windows wait and the first ones are
+    used for detection.
+    """
+
+    windower = TranscriptionWindower(config.TRANSCRIPTION_WINDOW_SECONDS)
+    chunk_ranges = {}
+    windows_data = []
+
+    pending = []
+    language = known_language(logger, resume)
+    language_resolved = language is not None
+
+    # Pool jobs still running
+    in_flight = []
+
+    store = None
+    noise_floor = NoiseFloorEstimator()
+
+    def flush():
+        for window in pending:
+            if isinstance(backend, TranscriptionPool):
+                in_flight.append(backend.submit_window(window, language))
+            else:
+                windows_data.append(
+                    transcribe_window(backend, store, window, logger, language)
+                )
+        pending.clear()
+
+        for future in [f for f in in_flight if f.done()]:
+            in_flight.remove(future)
+            windows_data.append(future.result())
+
+    for idx, (stem, entry) in enumerate(_drain(measured, stop), start=1):
+        store = _follow_store(store, stem, entry)
+
+        start = int(entry["offset"]) / store.sample_rate
+        end = start + int(entry["length"]) / store.sample_rate
+        chunk_ranges[stem] = (start, end)
+
+        if config.TRANSCRIPTION_WINDOWING == "speech" and config.VAD_ENABLED:
+            spans = detect_range_speech_regions(
+                store.chunk(stem), store.sample_rate, start, noise_floor
+            )
+        else:
+            spans = [(start, end)]
+
+        logger.info(f"Whisper [{idx}/{total}] queued {stem} ({len(spans)} spans)")
+
+        pending += windower.feed(spans)
+
+        if not language_resolved and len(pending) >= config.LANGUAGE_DETECTION_SAMPLES:
+            language = resolve_language(backend, store, pending, logger, resume)
+            language_resolved = True
+
+        if language_resolved:
+            flush()
+
+    if store is None:
+        store = open_partial_audio_store()
+    pending += windower.finish()
+
+    if pending and not language_resolved:
+        language = resolve_language(backend, store, pending, logger, resume)
+
+    flush()
+
+    for future in as_completed(in_flight):
+        windows_data.append(future.result())
+
+    write_chunk_transcripts(chunk_ranges, windows_data)
+
+    logger.info(
+        f"Transcription completed successfully ({len(windows_data)} windows)"
+    )
+
+
+def _follow_store(store, stem: str, entry: dict):
+    """
+    A stage's partial-store handle: opened once, then extended with each
+    chunk the decoder reports instead of re-reading the index from disk.
+    """
+
+    if store is None:
+        return open_partial_audio_store()
+
+    if stem not in store.chunks:
+        store.append_chunk(stem, entry)
+
+    return store
+
+
+def _chunk_rms(samples: np.ndarray) -> float:
+    if samples.size == 0:
+        return 0.0
+
+    audio = samples.astype(np.float32) / np.float32(INT16_SCALE)
+    return float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+
+
+def _run_stage(body, out: queue.Queue, stop: threading.Event):
+    try:
+        body()
+    except BaseException as e:
+        _put(out, _StageFailure(e), stop)
+        return
+
+    _put(out, _DONE, stop)
+
+
+def _drain(source: queue.Queue, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            item = source.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+
+        if item is _DONE:
+            return
+
+        if isinstance(item, _StageFailure):
+            raise item.error
+
+        yield item
+
+
+def _put(target: queue.Queue, item, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+
+    return False
@@ -0,0 +1,255 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+import infra.config as config
+
+
+class TranscriptionBackend(ABC):
+    """
+    Speech-to-text engine used by the transcriber.
+
+    transcribe() takes 16 kHz mono float32 samples
+    and returns the transcript JSON shape written to data/transcripts:
+        {"text": str, "segments": [ {...}, ... ], "language": str | None}
+    Segment dicts carry at least id, start, end and text (seconds are
+    relative to the audio passed in).
+    """
+
+    name = "base"
+
+    def __init__(self, model_name: str, logger):
+        self.model_name = model_name
+        self.logger = logger
+        self._model = None
+
+    @property
+    def cache_tag(self) -> str:
+        """
+        Identifies the backend and model in transcript cache keys.
+        """
+
+        return f"{self.name}:{self.model_name}"
+
+    @classmethod
+    def decode_options(cls) -> dict:
+        """
+        Configured decode options that change the output (cache keys).
+        """
+
+        return {}
+
+    def load(self):
+        if self._model is None:
+            self.logger.info(
+                f"Loading {self.name} model: {self.model_name}"
+            )
+            self._model = self._load_model()
+        return self._model
+
+    @abstractmethod
+    def transcribe(self, audio, language: str | None = None) -> dict:
+        ...
+
+    def detect_language(self, audio) -> tuple[str | None, float]:
+        """
+        Identifies the spoken language of up to 30 s of audio.
+        Returns (language, probability). Backends override this with a
+        detection-only pass; the fallback runs a full transcription.
+        """
+
+        return self.transcribe(audio).get("language"), 1.0
+
+    @abstractmethod
+    def _load_model(self):
+        ...
+
+
+class OpenAIWhisperBackend(TranscriptionBackend):
+    name = "openai-whisper"
+
+    @classmethod
+    def decode_options(cls) -> dict:
+        return {
+            "fp16": False,
+            "word_timestamps": config.WHISPER_WORD_TIMESTAMPS,
+        }
+
+    def _load_model(self):
+        import whisper
+
+        if config.TRANSCRIPTION_CPU_THREADS > 0:
+            import torch
+            torch.set_num_threads(config.TRANSCRIPTION_CPU_THREADS)
+
+        return whisper.load_model(self.model_name)
+
+    def transcribe(self, audio, language: str | None = None) -> dict:
+        model = self.load()
+
+        result = model.transcribe(
+            audio,
+            fp16=False,
+            language=language,
+            word_timestamps=config.WHISPER_WORD_TIMESTAMPS,
+        )
+
+        return {
+            "text": result.get("text", "").strip(),
+            "segments": result.get("segments", []),
+            "language": result.get("language"),
+        }
+
+    def detect_language(self, audio) -> tuple[str | None, float]:
+        import whisper
+
+        model = self.load()
+
+        audio = whisper.pad_or_trim(np.asarray(audio, dtype=np.float32))
+        mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels).to(model.device)
+
+        _, probs = model.detect_language(mel)
+        language = max(probs, key=probs.get)
+
+        return language, float(probs[language])
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """
+    CTranslate2 Whisper. int8 on CPU is several times faster than
+    openai-whisper fp32 at near-identical accuracy.
+    """
+
+    name = "faster-whisper"
+
+    @classmethod
+    def decode_options(cls) -> dict:
+        return {
+            "beam_size": config.FASTER_WHISPER_BEAM_SIZE,
+            "compute_type": config.FASTER_WHISPER_COMPUTE_TYPE,
+            "word_timestamps": config.WHISPER_WORD_TIMESTAMPS,
+        }
+
+    def _load_model(self):
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(
+            self.model_name,
+            device="cpu",
+            compute_type=config.FASTER_WHISPER_COMPUTE_TYPE,
+            cpu_threads=config.TRANSCRIPTION_CPU_THREADS,
+        )
+
+    def transcribe(self, audio, language: str | None = None) -> dict:
+        model = self.load()
+
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32, copy=False)
+
+        segments, info = model.transcribe(
+            audio,
+            beam_size=config.FASTER_WHISPER_BEAM_SIZE,
+            language=language,
+            word_timestamps=config.WHISPER_WORD_TIMESTAMPS,
+        )
+
+        # Segments are generated lazily while decoding
+        segment_dicts = [_segment_to_dict(segment) for segment in segments]
+
+        return {
+            "text": "".join(s["text"] for s in segment_dicts).strip(),
+            "segments": segment_dicts,
+            "language": info.language,
+        }
+
+    def detect_language(self, audio) -> tuple[str | None, float]:
+        model = self.load()
+
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32, copy=False)
+
+        # Language detection runs up front; the segment generator is
+        # never consumed, so nothing is decoded
+        _, info = model.transcribe(audio, beam_size=1)
+
+        return info.language, float(info.language_probability)
+
+
+def _segment_to_dict(segment) -> dict:
+    """
+    Converts a faster-whisper Segment into an openai-whisper segment dict.
+    """
+
+    segment_dict = {
+        "id": segment.id,
+        "seek": segment.seek,
+        "start": float(segment.start),
+        "end": float(segment.end),
+        "text": segment.text,
+        "tokens": list(segment.tokens),
+        "temperature": segment.temperature,
+        "avg_logprob": segment.avg_logprob,
+        "compression_ratio": segment.compression_ratio,
+        "no_speech_prob": segment.no_speech_prob,
+    }
+
+    if segment.words:
+        segment_dict["words"] = [
+            {
+                "word": word.word,
+                "start": float(word.start),
+                "end": float(word.end),
+                "probability": word.probability,
+            }
+            for word in segment.words
+        ]
+
+    return segment_dict
+
+
+BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def get_backend(logger, name: str | None = None, model_name: str | None = None) -> TranscriptionBackend:
+    """
+    Returns the configured transcription backend (TRANSCRIPTION_BACKEND).
+    Uses the persistent transcription server when one is running with the
+    same decode options, so the model is not loaded again; otherwise
+    models load lazily in-process.
+    """
+
+    name = name or config.TRANSCRIPTION_BACKEND
+    model_name = model_name or config.WHISPER_MODEL_NAME
+
+    if config.TRANSCRIPTION_SERVER_ENABLED:
+        from processing.transcription_server import RemoteBackend, connect
+
+        conn = connect(timeout=1.0)
+        if conn is not None:
+            remote = RemoteBackend(name, model_name, logger, conn)
+            server_options = remote.server_decode_options()
+
+            if server_options == remote.decode_options():
+                logger.info(f"Using transcription server ({name}, {model_name})")
+                return remote
+
+            conn.close()
+            logger.warning(
+                f"Transcription server decodes with {server_options}, "
+                f"this run with {remote.decode_options()}; transcribing in-process"
+            )
+
+    return build_local_backend(logger, name, model_name)
+
+
+def build_local_backend(logger, name: str, model_name: str) -> TranscriptionBackend:
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown transcription backend '{name}' "
+            f"(expected one of: {', '.join(BACKENDS)})"
+        )
+
+    return BACKENDS[name](model_name, logger)
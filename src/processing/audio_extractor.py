@@ -1,27 +1,46 @@
+import json
 import subprocess
+import wave
 from pathlib import Path
 import sys
 
-from infra.config import AUDIO_DIR, AUDIO_SAMPLE_RATE, CHUNKS_DIR
+from infra.config import (
+    AUDIO_DIR,
+    AUDIO_SAMPLE_RATE,
+    AUDIO_STORE_ENABLED,
+    CHUNKS_DIR,
+)
+from infra.staging import input_fingerprint
+from processing.audio_store import (
+    AUDIO_STORE_PATH,
+    clear_audio_store,
+    load_store_index,
+    new_store_index,
+    write_store_index,
+)
 
 
 def extract_audio_from_chunks(logger, resume: bool):
     AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Later stages prefer a store over WAVs; one kept from another run
+    # must not shadow these
+    clear_audio_store()
+
     if not resume:
         clear_existing_audio()
 
-    chunk_files = sorted(CHUNKS_DIR.glob("chunk_*.mp4"))
+    chunk_sources = _chunk_audio_sources()
 
-    if not chunk_files:
+    if not chunk_sources:
         logger.error("No video chunks found to extract audio from")
         raise RuntimeError("No video chunks found")
 
-    total = len(chunk_files)
+    total = len(chunk_sources)
     extracted_count = 0
 
-    for idx, chunk_path in enumerate(chunk_files, start=1):
-        audio_output_path = AUDIO_DIR / f"{chunk_path.stem}.wav"
+    for idx, (stem, input_args) in enumerate(chunk_sources, start=1):
+        audio_output_path = AUDIO_DIR / f"{stem}.wav"
 
         # ✅ RESUME LOGIC
         if resume and audio_output_path.exists():
@@ -32,7 +51,7 @@ def extract_audio_from_chunks(logger, resume: bool):
             continue
 
         logger.info(
-            f"Audio [{idx}/{total}] extracting from {chunk_path.name}"
+            f"Audio [{idx}/{total}] extracting from {stem}"
         )
 
         command = [
@@ -40,7 +59,7 @@ def extract_audio_from_chunks(logger, resume: bool):
             "-y",
             "-hide_banner",
             "-loglevel", "error",
-            "-i", str(chunk_path),
+            *input_args,
             "-vn",
             "-acodec", "pcm_s16le",
             str(audio_output_path),
@@ -51,10 +70,10 @@ def extract_audio_from_chunks(logger, resume: bool):
             extracted_count += 1
         except subprocess.CalledProcessError as e:
             logger.exception(
-                f"Failed to extract audio from {chunk_path.name}"
+                f"Failed to extract audio from {stem}"
             )
             raise RuntimeError(
-                f"Audio extraction failed for {chunk_path.name}"
+                f"Audio extraction failed for {stem}"
             ) from e
 
     logger.info(
@@ -63,6 +82,360 @@ def extract_audio_from_chunks(logger, resume: bool):
 
     return extracted_count
 
+
+def _chunk_audio_sources() -> list[tuple[str, list[str]]]:
+    """
+    Returns (stem, ffmpeg input args) per chunk: the physical chunk file,
+    or the chunk's time range over the source for virtual chunks.
+    """
+
+    chunk_files = sorted(CHUNKS_DIR.glob("chunk_*.mp4"))
+    if chunk_files:
+        return [(path.stem, ["-i", str(path)]) for path in chunk_files]
+
+    metadata_path = CHUNKS_DIR / "chunks.json"
+    if not metadata_path.exists():
+        return []
+
+    sources = []
+    for entry in load_chunk_metadata():
+        if not entry.get("virtual"):
+            continue
+
+        start = float(entry["start_time"])
+        duration = float(entry["end_time"]) - start
+
+        sources.append((
+            Path(entry["file"]).stem,
+            [
+                "-ss", str(start),
+                "-t", str(duration),
+                "-i", str(entry["source"]),
+            ],
+        ))
+
+    return sources
+
+
+def extract_audio_single_pass(input_video_path, logger, resume: bool):
+    """
+    Decodes the source audio with ONE ffmpeg process and splits the
+    PCM stream at the chunk boundaries from chunks.json.
+    Writes the mono analysis-rate audio store, or the legacy
+    chunk_*.wav files when AUDIO_STORE_ENABLED is off.
+    """
+
+    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+
+    if not resume:
+        clear_existing_audio()
+
+    chunks = load_chunk_metadata()
+
+    if AUDIO_STORE_ENABLED:
+        for _ in iter_extract_to_store(input_video_path, chunks, logger):
+            pass
+        return len(chunks)
+
+    clear_audio_store()
+    return _extract_to_wavs(input_video_path, chunks, logger, resume)
+
+
+def _extract_to_wavs(input_video_path, chunks, logger, resume: bool):
+    total = len(chunks)
+
+    pending = []
+    for idx, entry in enumerate(chunks, start=1):
+        audio_output_path = AUDIO_DIR / f"{Path(entry['file']).stem}.wav"
+
+        # ✅ RESUME LOGIC
+        if resume and audio_output_path.exists():
+            logger.info(
+                f"Audio [{idx}/{total}] cache hit: {audio_output_path.name}"
+            )
+            continue
+
+        pending.append(idx - 1)
+
+    if not pending:
+        logger.info(f"Audio extraction complete: {total}/{total} files")
+        return total
+
+    sample_rate, channels = probe_audio_format(input_video_path)
+    extracted_count = total - len(pending)
+    pending_set = set(pending)
+
+    logger.info(
+        f"Audio single-pass decode ({sample_rate} Hz, {channels} ch, "
+        f"{len(pending)} chunks pending)"
+    )
+
+    for position, data in _iter_decoded_chunks(
+        input_video_path, chunks, pending[0], sample_rate, channels, logger
+    ):
+        if position not in pending_set:
+            continue
+
+        audio_output_path = AUDIO_DIR / f"{Path(chunks[position]['file']).stem}.wav"
+
+        logger.info(
+            f"Audio [{position + 1}/{total}] writing {audio_output_path.name}"
+        )
+
+        _write_wav(audio_output_path, data, sample_rate, channels)
+        extracted_count += 1
+
+    logger.info(
+        f"Audio extraction complete: {extracted_count}/{total} files"
+    )
+
+    return extracted_count
+
+
+def iter_extract_to_store(input_video_path, chunks, logger):
+    """
+    Decodes into the audio store and yields (stem, store_entry) as soon
+    as each chunk is on disk, cached prefix first. Lets later stages
+    start on a chunk while the rest of the VOD is still decoding.
+    """
+
+    total = len(chunks)
+    stems = [Path(entry["file"]).stem for entry in chunks]
+
+    fingerprint = input_fingerprint(input_video_path)
+
+    # The store is keyed by the input fingerprint, so it is reused on
+    # fresh runs too (reset_derived_state keeps it)
+    index = load_store_index()
+    if index is not None and (
+        index.get("source_fingerprint") != fingerprint
+        or int(index.get("sample_rate", 0)) != AUDIO_SAMPLE_RATE
+    ):
+        logger.info("Audio store belongs to another input — rebuilding")
+        index = None
+
+    if index is None:
+        clear_audio_store()
+        index = new_store_index(str(input_video_path), fingerprint)
+
+    # The store is written sequentially, so only a prefix can be cached;
+    # a chunk counts when it covers the same time range as now
+    first = next(
+        (
+            i for i, stem in enumerate(stems)
+            if not _store_entry_matches(index["chunks"].get(stem), chunks[i])
+        ),
+        None,
+    )
+
+    for idx in range(first if first is not None else total):
+        logger.info(f"Audio [{idx + 1}/{total}] cache hit: {stems[idx]}")
+
+    if first is None:
+        index["complete"] = True
+        write_store_index(index)
+        logger.info(f"Audio extraction complete: {total}/{total} chunks")
+        for stem in stems:
+            yield stem, index["chunks"][stem]
+        return
+
+    for stem in stems[:first]:
+        yield stem, index["chunks"][stem]
+
+    index["chunks"] = {stem: index["chunks"][stem] for stem in stems[:first]}
+    index["total_samples"] = sum(
+        int(entry["length"]) for entry in index["chunks"].values()
+    )
+    index["complete"] = False
+
+    logger.info(
+        f"Audio single-pass decode into store "
+        f"({AUDIO_SAMPLE_RATE} Hz mono, {total - first} chunks pending)"
+    )
+
+    mode = "r+b" if AUDIO_STORE_PATH.exists() else "wb"
+    with open(AUDIO_STORE_PATH, mode) as store:
+        store.truncate(index["total_samples"] * 2)
+        store.seek(index["total_samples"] * 2)
+
+        for position, data in _iter_decoded_chunks(
+            input_video_path, chunks, first, AUDIO_SAMPLE_RATE, 1, logger
+        ):
+            stem = stems[position]
+            length = len(data) // 2
+
+            logger.info(f"Audio [{position + 1}/{total}] writing {stem}")
+
+            store.write(data[:length * 2])
+            store.flush()
+
+            index["chunks"][stem] = {
+                "offset": index["total_samples"],
+                "length": length,
+                "start_time": chunks[position]["start_time"],
+                "end_time": chunks[position]["end_time"],
+            }
+            index["total_samples"] += length
+
+            # Persist progress so an interrupted run can resume per chunk
+            write_store_index(index)
+
+            yield stem, index["chunks"][stem]
+
+    index["complete"] = True
+    write_store_index(index)
+
+    logger.info(
+        f"Audio extraction complete: {total}/{total} chunks "
+        f"({index['total_samples'] / AUDIO_SAMPLE_RATE:.1f}s in store)"
+    )
+
+
+def _iter_decoded_chunks(
+    input_video_path,
+    chunks,
+    first: int,
+    sample_rate: int,
+    channels: int,
+    logger,
+):
+    """
+    Yields (position, pcm_bytes) for every chunk from `first` to the end,
+    decoding the source once with a single ffmpeg process.
+    """
+
+    frame_bytes = 2 * channels
+    seek_seconds = float(chunks[first]["start_time"])
+    seek_sample = round(seek_seconds * sample_rate)
+
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-ss", str(seek_seconds),
+        "-i", str(input_video_path),
+        "-vn",
+        "-f", "s16le",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "-ac", str(channels),
+        "pipe:1",
+    ]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    total = len(chunks)
+
+    try:
+        for position in range(first, total):
+            if position == total - 1:
+                # Last chunk takes whatever is left of the stream
+                data = process.stdout.read()
+            else:
+                start = round(float(chunks[position]["start_time"]) * sample_rate)
+                end = round(float(chunks[position + 1]["start_time"]) * sample_rate)
+                start = max(start, seek_sample)
+                data = _read_exact(process.stdout, (end - start) * frame_bytes)
+
+            yield position, data
+
+        process.stdout.close()
+        returncode = process.wait()
+    except GeneratorExit:
+        process.kill()
+        process.wait()
+        raise
+    except Exception as e:
+        process.kill()
+        process.wait()
+        logger.exception("Single-pass audio extraction failed")
+        raise RuntimeError("Single-pass audio extraction failed") from e
+
+    if returncode != 0:
+        logger.error(f"ffmpeg exited with code {returncode} during audio decode")
+        raise RuntimeError("Single-pass audio extraction failed")
+
+
+def probe_audio_format(input_video_path) -> tuple[int, int]:
+    """
+    Returns (sample_rate, channels) of the first audio stream.
+    """
+
+    command = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=sample_rate,channels",
+        "-of", "json",
+        str(input_video_path),
+    ]
+
+    try:
+        result = subprocess.run(
+            command, check=True, capture_output=True, text=True
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(
+            f"ffprobe failed for {input_video_path}"
+        ) from e
+
+    streams = json.loads(result.stdout).get("streams", [])
+    if not streams:
+        raise RuntimeError(f"No audio stream found in {input_video_path}")
+
+    stream = streams[0]
+    return int(stream["sample_rate"]), int(stream["channels"])
+
+
+def load_chunk_metadata():
+    metadata_path = CHUNKS_DIR / "chunks.json"
+
+    if not metadata_path.exists():
+        raise RuntimeError("chunks.json not found")
+
+    with open(metadata_path, "r", encoding="utf-8") as f:
+        chunks = json.load(f)
+
+    if not chunks:
+        raise RuntimeError("No video chunks found")
+
+    return sorted(chunks, key=lambda c: c["start_time"])
+
+
+def _read_exact(stream, size: int) -> bytes:
+    buffers = []
+    remaining = size
+
+    while remaining > 0:
+        block = stream.read(remaining)
+        if not block:
+            break
+        buffers.append(block)
+        remaining -= len(block)
+
+    return b"".join(buffers)
+
+
+def _write_wav(path: Path, data: bytes, sample_rate: int, channels: int):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(data)
+
+
+def _store_entry_matches(entry: dict | None, chunk: dict) -> bool:
+    return (
+        entry is not None
+        and float(entry["start_time"]) == float(chunk["start_time"])
+        and float(entry["end_time"]) == float(chunk["end_time"])
+    )
+
+
 def clear_existing_audio():
+    """
+    Removes per-chunk WAVs. The audio store validates itself against
+    the input fingerprint and is only cleared when it is rebuilt.
+    """
+
     for file in AUDIO_DIR.glob("chunk_*.wav"):
         file.unlink()
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from infra.config import (
+    AUDIO_FEATURE_N_FFT,
+    AUDIO_FEATURE_HOP,
+    AUDIO_FEATURE_BLOCK_FRAMES,
+    FEATURE_CACHE_DIR,
+)
+from infra.fingerprint import file_fingerprint
+from processing.audio_store import AUDIO_STORE_PATH, INT16_SCALE, open_audio_store
+
+
+FEATURE_NAMES = ("onset", "flux", "centroid")
+
+# Bump when the feature math changes so stale caches are not reused
+FEATURE_VERSION = 1
+
+LOG_EPSILON = 1e-10
+
+
+def compute_audio_features(
+    logger,
+    n_fft: int = AUDIO_FEATURE_N_FFT,
+    hop: int = AUDIO_FEATURE_HOP,
+) -> dict[str, np.ndarray] | None:
+    """
+    Per-second spectral features over the whole audio store:
+      onset    – mean positive log-magnitude change (onset strength)
+      flux     – L2 norm of the positive magnitude change (spectral flux)
+      centroid – magnitude-weighted mean frequency in Hz
+    STFT frames are computed in blocks of AUDIO_FEATURE_BLOCK_FRAMES, so
+    memory stays flat for any VOD length. Cached by audio fingerprint and
+    parameters. Returns None without an audio store.
+    """
+
+    store = open_audio_store()
+    if store is None:
+        logger.warning("No audio store — skipping spectral features")
+        return None
+
+    cache_path = FEATURE_CACHE_DIR / f"{_cache_key(store.sample_rate, n_fft, hop)}.npz"
+
+    if cache_path.exists():
+        logger.info(f"Audio features cache hit: {cache_path.name}")
+        with np.load(cache_path) as data:
+            return {name: data[name] for name in FEATURE_NAMES}
+
+    samples = store.samples
+    sample_rate = store.sample_rate
+
+    n_frames = 0
+    if len(samples) >= n_fft:
+        n_frames = 1 + (len(samples) - n_fft) // hop
+    n_seconds = max(1, math.ceil(len(samples) / sample_rate))
+
+    logger.info(
+        f"Computing audio features: {n_frames} STFT frames "
+        f"(n_fft={n_fft}, hop={hop}) over {n_seconds}s"
+    )
+
+    sums = {name: np.zeros(n_seconds, dtype=np.float64) for name in FEATURE_NAMES}
+    counts = np.zeros(n_seconds, dtype=np.float64)
+
+    window = np.hanning(n_fft).astype(np.float32)
+    freqs = np.fft.rfftfreq(n_fft, d=1.0 / sample_rate).astype(np.float32)
+    previous = None
+
+    for frame in range(0, n_frames, AUDIO_FEATURE_BLOCK_FRAMES):
+        count = min(AUDIO_FEATURE_BLOCK_FRAMES, n_frames - frame)
+        start = frame * hop
+        block = samples[start:start + (count - 1) * hop + n_fft]
+
+        frames = sliding_window_view(block, n_fft)[::hop][:count]
+        frames = frames.astype(np.float32) / np.float32(INT16_SCALE)
+        magnitude = np.abs(np.fft.rfft(frames * window, axis=1)).astype(np.float32)
+
+        # Differences need the last frame of the previous block
+        if previous is None:
+            previous = magnitude[:1]
+        diff_base = np.concatenate((previous, magnitude[:-1]))
+        previous = magnitude[-1:]
+
+        log_mag = np.log10(magnitude + LOG_EPSILON)
+        log_base = np.log10(diff_base + LOG_EPSILON)
+
+        onset = np.maximum(log_mag - log_base, 0.0).mean(axis=1)
+        flux = np.sqrt(np.square(np.maximum(magnitude - diff_base, 0.0)).sum(axis=1))
+
+        energy = magnitude.sum(axis=1)
+        centroid = np.where(
+            energy > 0,
+            (magnitude * freqs).sum(axis=1) / np.maximum(energy, LOG_EPSILON),
+            0.0,
+        )
+
+        # Frame centers → seconds
+        centers = (np.arange(frame, frame + count) * hop + n_fft // 2) // sample_rate
+        centers = np.minimum(centers, n_seconds - 1)
+
+        counts += np.bincount(centers, minlength=n_seconds)
+        for name, values in (("onset", onset), ("flux", flux), ("centroid", centroid)):
+            sums[name] += np.bincount(centers, weights=values, minlength=n_seconds)
+
+    features = {
+        name: (sums[name] / np.maximum(counts, 1)).astype(np.float32)
+        for name in FEATURE_NAMES
+    }
+
+    FEATURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp.npz")
+    np.savez(tmp_path, **features)
+    tmp_path.replace(cache_path)
+
+    logger.info(f"Audio features cached: {cache_path.name}")
+
+    return features
+
+
+def feature_scores_per_second(logger) -> dict[str, np.ndarray] | None:
+    """
+    Spectral features scaled to [0, 1] for the scorer: each feature is
+    divided by its 99th percentile and clipped.
+    """
+
+    features = compute_audio_features(logger)
+    if features is None:
+        return None
+
+    scores = {}
+    for name, values in features.items():
+        scale = float(np.percentile(values, 99)) if values.size else 0.0
+        if scale <= 0:
+            scores[name] = np.zeros(len(values), dtype=np.float64)
+        else:
+            scores[name] = np.clip(values / scale, 0.0, 1.0).astype(np.float64)
+
+    return scores
+
+
+def _cache_key(sample_rate: int, n_fft: int, hop: int) -> str:
+    params = {
+        "audio": file_fingerprint(AUDIO_STORE_PATH),
+        "sample_rate": sample_rate,
+        "n_fft": n_fft,
+        "hop": hop,
+        "version": FEATURE_VERSION,
+    }
+
+    return hashlib.sha1(
+        json.dumps(params, sort_keys=True).encode("utf-8")
+    ).hexdigest()
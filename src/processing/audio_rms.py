@@ -1,16 +1,37 @@
 import json
+import math
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
 
-from infra.config import AUDIO_DIR, CHUNKS_DIR, SPIKE_THRESHOLD, SILENCE_RMS_THRESHOLD
+from infra.config import (
+    AUDIO_DIR,
+    CHUNKS_DIR,
+    SPIKE_THRESHOLD,
+    SILENCE_RMS_THRESHOLD,
+    AUDIO_ENVELOPE_HOP_SECONDS,
+    AUDIO_SPIKE_BASELINE_SECONDS,
+)
+from processing.audio_store import open_audio_store, INT16_SCALE
+from processing.rolling_stats import ratio_to_baseline, rolling_sum
+
+
+ENVELOPE_PATH = AUDIO_DIR / "envelope.npz"
+
+# Frames processed per vectorized block (bounds the float32 working set)
+ENVELOPE_BLOCK_FRAMES = 6000
 
 
 def calculate_rms_energy(logger, resume: bool):
-    audio_files = sorted(AUDIO_DIR.glob("chunk_*.wav"))
+    store = open_audio_store()
 
-    if not audio_files:
+    if store is not None:
+        stems = store.chunk_stems()
+    else:
+        stems = [p.stem for p in sorted(AUDIO_DIR.glob("chunk_*.wav"))]
+
+    if not stems:
         logger.error("No audio files found for RMS calculation")
         raise RuntimeError("No audio files found for RMS calculation")
 
@@ -24,42 +45,238 @@ def calculate_rms_energy(logger, resume: bool):
                 if "audio_rms" in entry:
                     existing_rms[Path(entry["file"]).stem] = entry["audio_rms"]
 
-    total = len(audio_files)
-    rms_results = {}
+    envelope = None
+    if store is not None and not all(stem in existing_rms for stem in stems):
+        envelope, hop_seconds = compute_audio_envelope(store, logger, resume)
+        hop_samples = round(hop_seconds * store.sample_rate)
 
-    for idx, audio_path in enumerate(audio_files, start=1):
-        stem = audio_path.stem
+    total = len(stems)
+    rms_results = {}
 
+    for idx, stem in enumerate(stems, start=1):
         # ✅ RESUME LOGIC
         if resume and stem in existing_rms:
             logger.info(
-                f"RMS [{idx}/{total}] cache hit: {audio_path.name}"
+                f"RMS [{idx}/{total}] cache hit: {stem}"
             )
             rms_results[stem] = existing_rms[stem]
             continue
 
         logger.info(
-            f"RMS [{idx}/{total}] calculating {audio_path.name}"
+            f"RMS [{idx}/{total}] calculating {stem}"
         )
 
         try:
-            audio_data, _ = sf.read(audio_path)
+            if envelope is not None:
+                entry = store.chunks[stem]
+                first = int(entry["offset"]) // hop_samples
+                last = math.ceil(
+                    (int(entry["offset"]) + int(entry["length"])) / hop_samples
+                )
+                rms_results[stem] = envelope_rms(envelope[first:last])
+                continue
 
-            if audio_data.ndim > 1:
-                audio_data = np.mean(audio_data, axis=1)
+            audio_data = _load_chunk_samples(stem)
+
+            if audio_data.size == 0:
+                rms_results[stem] = 0.0
+                continue
 
             rms = np.sqrt(np.mean(np.square(audio_data)))
             rms_results[stem] = float(rms)
 
         except Exception as e:
-            logger.exception(f"Failed RMS calculation for {audio_path.name}")
+            logger.exception(f"Failed RMS calculation for {stem}")
             raise RuntimeError(
-                f"RMS calculation failed for {audio_path.name}"
+                f"RMS calculation failed for {stem}"
             ) from e
 
     return rms_results
 
 
+def _load_chunk_samples(stem: str) -> np.ndarray:
+    audio_data, _ = sf.read(AUDIO_DIR / f"{stem}.wav")
+
+    if audio_data.ndim > 1:
+        audio_data = np.mean(audio_data, axis=1)
+
+    return audio_data
+
+
+# ─────────────────────────────────────────────
+# Frame-level envelope
+# ─────────────────────────────────────────────
+
+def compute_audio_envelope(
+    store,
+    logger,
+    resume: bool,
+    hop_seconds: float = AUDIO_ENVELOPE_HOP_SECONDS,
+) -> tuple[np.ndarray, float]:
+    """
+    Computes frame RMS at a fixed hop over the whole audio store.
+    Frames are strided reshapes of the int16 memmap, processed in
+    float32 blocks. Cached to envelope.npz together with the store's
+    source fingerprint and the hop; a cache that does not match both
+    is rebuilt.
+    """
+
+    source = store.source_key
+
+    if resume and ENVELOPE_PATH.exists():
+        with np.load(ENVELOPE_PATH) as data:
+            cached_source = str(data["source"]) if "source" in data.files else None
+            cached_hop = float(data["hop_seconds"])
+
+            if cached_source == source and math.isclose(cached_hop, hop_seconds):
+                logger.info("Using cached audio envelope")
+                return data["rms"], cached_hop
+
+        logger.info("Cached audio envelope is stale, rebuilding")
+
+    hop_samples = round(hop_seconds * store.sample_rate)
+    if hop_samples <= 0:
+        raise ValueError(f"Envelope hop too small: {hop_seconds}s")
+
+    samples = store.samples
+    full_frames = len(samples) // hop_samples
+    has_tail = len(samples) % hop_samples > 0
+
+    logger.info(
+        f"Computing audio envelope: {full_frames + int(has_tail)} frames "
+        f"(hop={hop_seconds}s)"
+    )
+
+    envelope = np.empty(full_frames + int(has_tail), dtype=np.float32)
+
+    block_samples = ENVELOPE_BLOCK_FRAMES * hop_samples
+    for frame in range(0, full_frames, ENVELOPE_BLOCK_FRAMES):
+        count = min(ENVELOPE_BLOCK_FRAMES, full_frames - frame)
+        start = frame * hop_samples
+        block = samples[start:start + count * hop_samples]
+
+        envelope[frame:frame + count] = _frame_rms(
+            block.reshape(count, hop_samples)
+        )
+
+    if has_tail:
+        tail = samples[full_frames * hop_samples:]
+        envelope[-1] = _frame_rms(tail.reshape(1, -1))[0]
+
+    ENVELOPE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        ENVELOPE_PATH,
+        rms=envelope,
+        hop_seconds=np.float64(hop_seconds),
+        source=np.array(source),
+    )
+
+    return envelope, hop_seconds
+
+
+def samples_envelope(samples: np.ndarray, hop_samples: int) -> np.ndarray:
+    """
+    Frame RMS of one int16 sample range (same framing as the whole-VOD
+    envelope, for ranges that fit in memory).
+    """
+
+    full_frames = len(samples) // hop_samples
+    envelope = _frame_rms(
+        samples[:full_frames * hop_samples].reshape(full_frames, hop_samples)
+    )
+
+    if len(samples) % hop_samples:
+        tail = _frame_rms(samples[full_frames * hop_samples:].reshape(1, -1))
+        envelope = np.concatenate((envelope, tail))
+
+    return envelope
+
+
+def _frame_rms(frames: np.ndarray) -> np.ndarray:
+    frames = frames.astype(np.float32) / np.float32(INT16_SCALE)
+    return np.sqrt(np.mean(np.square(frames), axis=1, dtype=np.float32))
+
+
+def load_audio_envelope() -> tuple[np.ndarray, float] | None:
+    """
+    The cached envelope, or None when it is missing or was computed
+    from audio other than the current store.
+    """
+
+    if not ENVELOPE_PATH.exists():
+        return None
+
+    store = open_audio_store()
+    if store is None:
+        return None
+
+    with np.load(ENVELOPE_PATH) as data:
+        if "source" not in data.files or str(data["source"]) != store.source_key:
+            return None
+
+        return data["rms"], float(data["hop_seconds"])
+
+
+def envelope_rms(frames: np.ndarray) -> float:
+    """
+    Combines frame RMS values into one RMS over their time span.
+    """
+
+    if frames.size == 0:
+        return 0.0
+
+    return float(np.sqrt(np.mean(np.square(frames, dtype=np.float64))))
+
+
+def aggregate_envelope(
+    envelope: np.ndarray,
+    hop_seconds: float,
+    bin_seconds: float = 1.0,
+) -> np.ndarray:
+    """
+    Aggregates frame RMS into dense bins (default: one per second).
+    """
+
+    frames_per_bin = max(1, round(bin_seconds / hop_seconds))
+    n_bins = math.ceil(len(envelope) / frames_per_bin)
+
+    power = np.zeros(n_bins * frames_per_bin, dtype=np.float64)
+    power[:len(envelope)] = np.square(envelope, dtype=np.float64)
+
+    counts = np.full(n_bins, frames_per_bin, dtype=np.float64)
+    if len(envelope) % frames_per_bin:
+        counts[-1] = len(envelope) % frames_per_bin
+
+    sums = power.reshape(n_bins, frames_per_bin).sum(axis=1)
+    return np.sqrt(sums / counts).astype(np.float32)
+
+
+def audio_scores_per_second() -> np.ndarray | None:
+    """
+    Dense per-second audio_score array built from the cached envelope,
+    using the same spike / silence / normalization rules as chunks.
+    """
+
+    cached = load_audio_envelope()
+    if cached is None:
+        return None
+
+    envelope, hop_seconds = cached
+    rms = aggregate_envelope(envelope, hop_seconds, 1.0)
+
+    if AUDIO_SPIKE_BASELINE_SECONDS > 0:
+        spike_scores, is_silent = compute_local_spike_scores(
+            rms, AUDIO_SPIKE_BASELINE_SECONDS
+        )
+    else:
+        spike_scores, is_silent = compute_spike_scores(rms)
+
+    return normalize_spike_scores(spike_scores, is_silent)
+
+
+# ─────────────────────────────────────────────
+# Chunk metadata
+# ─────────────────────────────────────────────
 
 def write_rms_to_metadata(rms_results):
     metadata_path = CHUNKS_DIR / "chunks.json"
@@ -81,71 +298,110 @@ def write_rms_to_metadata(rms_results):
         json.dump(metadata, f, indent=2)
 
 
+def compute_spike_scores(rms_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (spike_scores, is_silent) for an array of RMS values.
+    Spike score is RMS over the median RMS; silent entries score 0.
+    """
 
-def detect_volume_spikes(metadata):
-    rms_values = np.array(
-        [entry.get("audio_rms", 0.0) for entry in metadata]
-    )
+    rms_values = np.asarray(rms_values, dtype=np.float64)
 
-    if len(rms_values) == 0:
-        return metadata
+    if rms_values.size == 0:
+        return rms_values, np.zeros(0, dtype=bool)
 
     median_rms = np.median(rms_values)
 
     if median_rms == 0:
         median_rms = 1e-9
 
-    for entry in metadata:
-        rms = entry.get("audio_rms", 0.0)
+    is_silent = rms_values < SILENCE_RMS_THRESHOLD
+    spike_scores = np.where(is_silent, 0.0, rms_values / median_rms)
 
-        # Silence handling
-        if rms < SILENCE_RMS_THRESHOLD:
-            entry["is_silent"] = True
-            entry["audio_spike_score"] = 0.0
-            entry["is_volume_spike"] = False
-            continue
+    return spike_scores, is_silent
+
+
+def compute_local_spike_scores(
+    rms_values: np.ndarray,
+    window_seconds: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Like compute_spike_scores, but against a local baseline: the mean
+    non-silent RMS of a centered window, so a loud stretch of the VOD
+    does not mask spikes elsewhere.
+    """
+
+    rms_values = np.asarray(rms_values, dtype=np.float64)
+    is_silent = rms_values < SILENCE_RMS_THRESHOLD
+    active = (~is_silent).astype(np.float64)
+
+    active_sum = rolling_sum(rms_values * active, window_seconds, "centered")
+    active_count = rolling_sum(active, window_seconds, "centered")
+    baseline = ratio_to_baseline(active_sum, active_count)
 
-        entry["is_silent"] = False
+    spike_scores = np.where(is_silent, 0.0, ratio_to_baseline(rms_values, baseline))
 
-        spike_score = rms / median_rms
+    return spike_scores, is_silent
 
+
+def normalize_spike_scores(
+    spike_scores: np.ndarray,
+    is_silent: np.ndarray,
+) -> np.ndarray:
+    """
+    Min-max normalizes spike scores over non-silent entries.
+    """
+
+    audio_scores = np.zeros(len(spike_scores), dtype=np.float64)
+    active = spike_scores[~is_silent]
+
+    if active.size == 0:
+        return audio_scores
+
+    min_score = active.min()
+    max_score = active.max()
+
+    # Avoid division by zero if all scores are identical
+    if max_score == min_score:
+        return audio_scores
+
+    audio_scores[~is_silent] = (active - min_score) / (max_score - min_score)
+    return audio_scores
+
+
+def detect_volume_spikes(metadata):
+    if len(metadata) == 0:
+        return metadata
+
+    rms_values = np.array(
+        [entry.get("audio_rms", 0.0) for entry in metadata]
+    )
+
+    spike_scores, is_silent = compute_spike_scores(rms_values)
+
+    for entry, spike_score, silent in zip(metadata, spike_scores, is_silent):
+        entry["is_silent"] = bool(silent)
         entry["audio_spike_score"] = float(spike_score)
-        entry["is_volume_spike"] = bool(spike_score >= SPIKE_THRESHOLD)
+        entry["is_volume_spike"] = bool(
+            not silent and spike_score >= SPIKE_THRESHOLD
+        )
 
     return metadata
 
 
-
 def normalize_audio_scores(metadata):
-    # Collect spike scores for non-silent chunks
-    spike_scores = [
-        entry["audio_spike_score"]
-        for entry in metadata
-        if not entry.get("is_silent", False)
-    ]
-
-    if not spike_scores:
-        # All chunks silent
-        for entry in metadata:
-            entry["audio_score"] = 0.0
+    if len(metadata) == 0:
         return metadata
 
-    min_score = min(spike_scores)
-    max_score = max(spike_scores)
+    spike_scores = np.array(
+        [entry.get("audio_spike_score", 0.0) for entry in metadata]
+    )
+    is_silent = np.array(
+        [entry.get("is_silent", False) for entry in metadata], dtype=bool
+    )
 
-    for entry in metadata:
-        if entry.get("is_silent", False):
-            entry["audio_score"] = 0.0
-            continue
+    audio_scores = normalize_spike_scores(spike_scores, is_silent)
 
-        if max_score == min_score:
-            # Avoid division by zero if all scores are identical
-            entry["audio_score"] = 0.0
-        else:
-            normalized = (
-                (entry["audio_spike_score"] - min_score)
-                / (max_score - min_score)
-            )
-            entry["audio_score"] = float(normalized)
+    for entry, score in zip(metadata, audio_scores):
+        entry["audio_score"] = float(score)
 
-    return metadata
\ No newline at end of file
+    return metadata
@@ -0,0 +1,184 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from infra.config import AUDIO_DIR, AUDIO_SAMPLE_RATE
+
+
+AUDIO_STORE_PATH = AUDIO_DIR / "audio.pcm"
+AUDIO_INDEX_PATH = AUDIO_DIR / "audio_index.json"
+
+STORE_DTYPE = "int16"
+INT16_SCALE = 32768.0
+
+
+class AudioStore:
+    """
+    Read-only view over the mono analysis-rate PCM file of one VOD.
+    All sample accessors return zero-copy memmap slices.
+    """
+
+    def __init__(self, pcm_path: Path, index: dict):
+        self.index = index
+        self.pcm_path = pcm_path
+        self.sample_rate = int(index["sample_rate"])
+        self.total_samples = int(index["total_samples"])
+        self.chunks = index.get("chunks", {})
+
+        if self.total_samples > 0:
+            self.samples = np.memmap(
+                pcm_path,
+                dtype=STORE_DTYPE,
+                mode="r",
+                shape=(self.total_samples,),
+            )
+        else:
+            self.samples = np.zeros(0, dtype=STORE_DTYPE)
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.total_samples / self.sample_rate
+
+    @property
+    def source_key(self) -> str:
+        """
+        Identifies the decoded audio: input fingerprint, rate and length.
+        Caches derived from the store record it and rebuild on mismatch.
+        """
+
+        fingerprint = self.index.get("source_fingerprint") or ""
+        return f"{fingerprint}:{self.sample_rate}:{self.total_samples}"
+
+    def append_chunk(self, stem: str, entry: dict):
+        """
+        Extends a partial-store view with a chunk the decoder has just
+        written, without re-reading the index from disk.
+        """
+
+        self.chunks[stem] = entry
+        end = int(entry["offset"]) + int(entry["length"])
+
+        if end > self.total_samples:
+            self.total_samples = end
+            self.samples = np.memmap(
+                self.pcm_path,
+                dtype=STORE_DTYPE,
+                mode="r",
+                shape=(self.total_samples,),
+            )
+
+    def chunk_stems(self) -> list[str]:
+        return sorted(self.chunks.keys())
+
+    def time_range(self, start_sec: float, end_sec: float) -> np.ndarray:
+        start = max(0, int(round(start_sec * self.sample_rate)))
+        end = min(self.total_samples, int(round(end_sec * self.sample_rate)))
+        return self.samples[start:max(start, end)]
+
+    def chunk(self, stem: str) -> np.ndarray:
+        entry = self.chunks[stem]
+        offset = int(entry["offset"])
+        return self.samples[offset:offset + int(entry["length"])]
+
+    def chunk_float(self, stem: str) -> np.ndarray:
+        return to_float32(self.chunk(stem))
+
+    def time_range_float(self, start_sec: float, end_sec: float) -> np.ndarray:
+        return to_float32(self.time_range(start_sec, end_sec))
+
+
+def to_float32(samples: np.ndarray) -> np.ndarray:
+    """
+    Converts int16 PCM to float32 in [-1, 1] (the format Whisper expects).
+    """
+
+    return samples.astype(np.float32) / INT16_SCALE
+
+
+def read_wav_float32(path: Path, sample_rate: int = AUDIO_SAMPLE_RATE) -> np.ndarray:
+    """
+    Loads a WAV as mono float32 at `sample_rate`, in-process. Whisper
+    would otherwise spawn ffmpeg to decode and resample it again.
+    """
+
+    import soundfile as sf
+
+    audio, source_rate = sf.read(str(path), dtype="float32", always_2d=True)
+    audio = audio.mean(axis=1)
+
+    if source_rate != sample_rate:
+        from math import gcd
+        from scipy.signal import resample_poly
+
+        divisor = gcd(source_rate, sample_rate)
+        audio = resample_poly(
+            audio, sample_rate // divisor, source_rate // divisor
+        )
+
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def open_audio_store() -> AudioStore | None:
+    """
+    Returns the complete audio store, or None if it was not written.
+    """
+
+    index = load_store_index()
+    if not index or not index.get("complete"):
+        return None
+
+    if not AUDIO_STORE_PATH.exists():
+        return None
+
+    return AudioStore(AUDIO_STORE_PATH, index)
+
+
+def open_partial_audio_store() -> AudioStore | None:
+    """
+    Returns a view over the chunks written so far, even while the store
+    is still being decoded (the index is persisted after every chunk).
+    """
+
+    index = load_store_index()
+    if not index or not AUDIO_STORE_PATH.exists():
+        return None
+
+    return AudioStore(AUDIO_STORE_PATH, index)
+
+
+def load_store_index() -> dict | None:
+    if not AUDIO_INDEX_PATH.exists():
+        return None
+
+    with open(AUDIO_INDEX_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def new_store_index(source: str, source_fingerprint: str | None = None) -> dict:
+    return {
+        "source": source,
+        "source_fingerprint": source_fingerprint,
+        "sample_rate": AUDIO_SAMPLE_RATE,
+        "channels": 1,
+        "dtype": STORE_DTYPE,
+        "total_samples": 0,
+        "complete": False,
+        "chunks": {},
+    }
+
+
+def write_store_index(index: dict):
+    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = AUDIO_INDEX_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    tmp_path.replace(AUDIO_INDEX_PATH)
+
+
+def clear_audio_store():
+    for path in (AUDIO_STORE_PATH, AUDIO_INDEX_PATH):
+        if path.exists():
+            path.unlink()
@@ -1,50 +1,40 @@
 import json
-import math
-from collections import defaultdict
 from pathlib import Path
 
-from infra.config import DATA_DIR, CHAT_METRICS_DIR
+import numpy as np
 
+import infra.config as config
+from infra.config import CHAT_METRICS_DIR
+from processing.chat.chat_aggregates import require_chat_aggregates
 
-def compute_messages_per_second(logger) -> Path:
+
+def compute_messages_per_second(logger) -> Path | None:
     """
-    Computes messages-per-second (MPS) from normalized chat.
+    Messages-per-second (MPS) view of the chat aggregates, written as
+    JSON when CHAT_METRICS_JSON_VIEWS is on.
     """
 
-    input_path = DATA_DIR / "chat" / "normalized.json"
     output_path = CHAT_METRICS_DIR / "messages_per_second.json"
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Normalized chat not found: {input_path}")
+    aggregates = require_chat_aggregates(logger)
+
+    if not config.CHAT_METRICS_JSON_VIEWS:
+        return None
 
     if output_path.exists():
         logger.info("Using cached messages-per-second metrics")
         return output_path
 
-    logger.info("Computing messages per second")
-
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    counts = defaultdict(int)
-
-    for msg in data["messages"]:
-        t = msg.get("vod_time_sec")
-        if t is None:
-            continue
-
-        sec = int(math.floor(t))
-        counts[sec] += 1
+    messages = aggregates["messages"]
 
-    # Convert to sorted list for easier downstream use
     timeline = [
-        {"second": sec, "messages": counts[sec]}
-        for sec in sorted(counts.keys())
+        {"second": sec, "messages": int(messages[sec])}
+        for sec in np.flatnonzero(messages).tolist()
     ]
 
     output = {
-        "vod_id": data.get("vod_id"),
-        "total_messages": len(data.get("messages", [])),
+        "vod_id": aggregates["vod_id"],
+        "total_messages": int(messages.sum()),
         "timeline": timeline,
     }
 
@@ -1,8 +1,11 @@
 import json
-from collections import deque
 from pathlib import Path
 
-from infra.config import DATA_DIR, CHAT_METRICS_DIR, CHAT_BASELINE_WINDOW_SECONDS
+import numpy as np
+
+from infra.config import CHAT_METRICS_DIR, CHAT_BASELINE_WINDOW_SECONDS
+from processing.chat.chat_aggregates import CHAT_AGGREGATES_PATH, load_chat_aggregates
+from processing.rolling_stats import rolling_mean
 
 
 def compute_rolling_baseline(logger) -> Path:
@@ -12,11 +15,11 @@ def compute_rolling_baseline(logger) -> Path:
     Missing seconds are treated as zero.
     """
 
-    input_path = CHAT_METRICS_DIR / "messages_per_second.json"
     output_path = CHAT_METRICS_DIR / "rolling_baseline.json"
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"MPS file not found: {input_path}")
+    aggregates = load_chat_aggregates()
+    if aggregates is None:
+        raise FileNotFoundError(f"Chat aggregates not found: {CHAT_AGGREGATES_PATH}")
 
     if output_path.exists():
         logger.info("Using cached rolling baseline")
@@ -27,45 +30,15 @@ def compute_rolling_baseline(logger) -> Path:
         CHAT_BASELINE_WINDOW_SECONDS,
     )
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    timeline = data["timeline"]
-
-    # Build a dense timeline: second -> messages
-    counts = {item["second"]: item["messages"] for item in timeline}
-    if not counts:
-        raise ValueError("Empty MPS timeline")
-
-    min_sec = min(counts.keys())
-    max_sec = max(counts.keys())
-
-    window = deque()
-    window_sum = 0.0
-
-    baseline_timeline = []
-
-    for sec in range(min_sec, max_sec + 1):
-        val = counts.get(sec, 0)
-
-        window.append(val)
-        window_sum += val
-
-        if len(window) > CHAT_BASELINE_WINDOW_SECONDS:
-            window_sum -= window.popleft()
-
-        baseline = window_sum / len(window)
+    min_sec, messages, baseline = message_baseline(aggregates)
 
-        baseline_timeline.append(
-            {
-                "second": sec,
-                "messages": val,
-                "baseline": baseline,
-            }
-        )
+    baseline_timeline = [
+        {"second": min_sec + i, "messages": int(val), "baseline": float(base)}
+        for i, (val, base) in enumerate(zip(messages.tolist(), baseline.tolist()))
+    ]
 
     output = {
-        "vod_id": data.get("vod_id"),
+        "vod_id": aggregates["vod_id"],
         "window_seconds": CHAT_BASELINE_WINDOW_SECONDS,
         "timeline": baseline_timeline,
     }
@@ -79,3 +52,23 @@ def compute_rolling_baseline(logger) -> Path:
     )
 
     return output_path
+
+
+def message_baseline(aggregates: dict) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    (first second, messages, trailing mean baseline) over the seconds
+    from the first to the last one with messages.
+    """
+
+    counts = aggregates["messages"]
+
+    active = np.flatnonzero(counts)
+    if not len(active):
+        raise ValueError("Empty MPS timeline")
+
+    min_sec = int(active[0])
+    messages = counts[min_sec:int(active[-1]) + 1]
+
+    baseline = rolling_mean(messages, CHAT_BASELINE_WINDOW_SECONDS, "trailing")
+
+    return min_sec, messages, baseline
@@ -0,0 +1,190 @@
+from pathlib import Path
+
+import numpy as np
+
+from infra.config import CHAT_METRICS_DIR
+from processing.chat.chat_keywords import chat_keywords_version, load_chat_keyword_groups
+from processing.chat.chat_store import CHAT_STORE_DIR, open_chat_store
+
+
+CHAT_AGGREGATES_PATH = CHAT_METRICS_DIR / "chat_per_second.npz"
+
+
+def compute_chat_aggregates(logger) -> Path:
+    """
+    Reads the chat store once and writes every per-second chat metric
+    as dense arrays indexed by chat second:
+
+    - messages, text_messages (messages with normalized text)
+    - emotes, unique_emotes, top_emote (id, -1 if none),
+      top_emote_count
+    - keyword_hits (distinct keywords per message, summed)
+
+    plus keyword_seconds / keyword_ids, the distinct (second, keyword)
+    pairs, and the emote_names / keyword_phrases the ids refer to.
+
+    Cached until the chat store holds another VOD or the chat keywords
+    (file or word-boundary setting) change.
+    """
+
+    store = open_chat_store()
+    if store is None:
+        raise FileNotFoundError(f"Chat store not found: {CHAT_STORE_DIR}")
+
+    cache_key = (store.vod_id or "", chat_keywords_version())
+
+    if _cached_key() == cache_key:
+        logger.info("Using cached per-second chat aggregates")
+        return CHAT_AGGREGATES_PATH
+
+    keyword_groups = load_chat_keyword_groups()
+
+    logger.info("Aggregating chat per second (%d messages)", len(store))
+
+    seconds = store.seconds()
+    n_seconds = int(seconds[-1]) + 1 if len(seconds) else 0
+
+    def per_second(index):
+        return np.bincount(index, minlength=n_seconds).astype(np.int64)
+
+    has_text = np.diff(store.text_offsets) > 0
+
+    arrays = {
+        "messages": per_second(seconds),
+        "text_messages": per_second(seconds[has_text]),
+    }
+    arrays.update(_emote_aggregates(store, seconds, n_seconds, per_second))
+    arrays.update(_keyword_aggregates(store, keyword_groups, seconds, has_text, per_second))
+
+    CHAT_METRICS_DIR.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        CHAT_AGGREGATES_PATH,
+        vod_id=np.array(cache_key[0]),
+        keywords_version=np.array(cache_key[1]),
+        emote_names=np.array(store.emote_names, dtype=str),
+        **arrays,
+    )
+
+    logger.info("Chat aggregates computed: %d seconds", n_seconds)
+
+    return CHAT_AGGREGATES_PATH
+
+
+def load_chat_aggregates() -> dict | None:
+    if not CHAT_AGGREGATES_PATH.exists():
+        return None
+
+    with np.load(CHAT_AGGREGATES_PATH) as data:
+        aggregates = {key: data[key] for key in data.files}
+
+    aggregates["vod_id"] = str(aggregates["vod_id"]) or None
+    aggregates.pop("keywords_version", None)
+    aggregates["emote_names"] = aggregates["emote_names"].tolist()
+    aggregates["keyword_phrases"] = aggregates["keyword_phrases"].tolist()
+
+    return aggregates
+
+
+def _cached_key() -> tuple[str, str] | None:
+    """
+    (vod_id, keywords version) the cached aggregates were computed for.
+    """
+
+    if not CHAT_AGGREGATES_PATH.exists():
+        return None
+
+    with np.load(CHAT_AGGREGATES_PATH) as data:
+        if "keywords_version" not in data.files:
+            return None
+        return str(data["vod_id"]), str(data["keywords_version"])
+
+
+def require_chat_aggregates(logger) -> dict:
+    compute_chat_aggregates(logger)
+    return load_chat_aggregates()
+
+
+def keywords_by_second(aggregates: dict) -> dict[int, list[str]]:
+    """
+    Sorted distinct keywords seen in each second.
+    """
+
+    phrases = aggregates["keyword_phrases"]
+    found = {}
+
+    for sec, keyword_id in zip(
+        aggregates["keyword_seconds"].tolist(),
+        aggregates["keyword_ids"].tolist(),
+    ):
+        found.setdefault(sec, []).append(phrases[keyword_id])
+
+    return {sec: sorted(words) for sec, words in found.items()}
+
+
+def _emote_aggregates(store, seconds, n_seconds: int, per_second) -> dict:
+    emote_ids = np.asarray(store.emote_ids, dtype=np.int64)
+    emote_seconds = np.repeat(seconds, store.emote_counts())
+
+    top_emote = np.full(n_seconds, -1, dtype=np.int64)
+    top_emote_count = np.zeros(n_seconds, dtype=np.int64)
+
+    n_names = max(len(store.emote_names), 1)
+
+    # Occurrences of each distinct (second, emote) pair; first_seen
+    # breaks ties the way Counter.most_common does
+    pairs, first_seen, pair_counts = np.unique(
+        emote_seconds * n_names + emote_ids,
+        return_index=True,
+        return_counts=True,
+    )
+    pair_seconds = pairs // n_names
+    pair_emotes = pairs % n_names
+
+    order = np.lexsort((first_seen, -pair_counts, pair_seconds))
+    ranked_seconds = pair_seconds[order]
+    is_top = np.ones(len(order), dtype=bool)
+    is_top[1:] = ranked_seconds[1:] != ranked_seconds[:-1]
+
+    top_emote[ranked_seconds[is_top]] = pair_emotes[order][is_top]
+    top_emote_count[ranked_seconds[is_top]] = pair_counts[order][is_top]
+
+    return {
+        "emotes": per_second(emote_seconds),
+        "unique_emotes": per_second(pair_seconds),
+        "top_emote": top_emote,
+        "top_emote_count": top_emote_count,
+    }
+
+
+def _keyword_aggregates(store, keyword_groups, seconds, has_text, per_second) -> dict:
+    matcher = keyword_groups.matcher
+
+    hit_seconds = []
+    hit_ids = []
+
+    # Chat repeats itself ("LETS GO" spam), so each distinct text is
+    # matched once
+    found_by_text = {}
+
+    for i in np.flatnonzero(has_text).tolist():
+        text = store.message_text(i)
+        found = found_by_text.get(text)
+        if found is None:
+            found = found_by_text[text] = matcher.present(text)
+        if found:
+            sec = int(seconds[i])
+            hit_seconds.extend([sec] * len(found))
+            hit_ids.extend(found)
+
+    hit_seconds = np.array(hit_seconds, dtype=np.int64)
+    hit_ids = np.array(hit_ids, dtype=np.int64)
+
+    n_phrases = max(len(matcher.phrases), 1)
+    pairs = np.unique(hit_seconds * n_phrases + hit_ids)
+
+    return {
+        "keyword_hits": per_second(hit_seconds),
+        "keyword_seconds": pairs // n_phrases,
+        "keyword_ids": pairs % n_phrases,
+        "keyword_phrases": np.array(matcher.phrases, dtype=str),
+    }
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+from infra.config import TWITCH_CHAT_RAW_DIR
+import infra.config as config
+from processing.chat.timestamp_normalizer import normalize_chat_timestamps, normalize_comment
+from processing.chat.text_normalizer import normalize_chat_text, add_normalized_text
+from processing.chat.username_stripper import strip_usernames, strip_username
+from processing.chat.emote_extractor import extract_emotes, add_emote_tokens
+from processing.chat.message_filter import filter_chat_messages, is_noise_message
+from processing.chat.final_chat_export import export_final_chat
+from processing.chat.raw_chat_reader import iter_raw_comments
+from processing.chat.chat_store import CHAT_STORE_DIR, open_chat_store, write_chat_store
+
+
+def ingest_chat(vod_id: str, logger) -> Path:
+    """
+    Raw Twitch chat replay → columnar chat store in one pass.
+
+    Each comment goes through timestamp normalization, text
+    normalization, username stripping, emote extraction and the noise
+    filter before the next one is read, and the kept messages are
+    appended straight to the chat store. With CHAT_INGEST_DEBUG the
+    staged pipeline runs instead, leaving every intermediate file in
+    data/twitch/chat and data/chat/normalized.json for inspection, and
+    the store is built from its output.
+
+    A store already written for this vod_id is reused.
+    """
+
+    if config.CHAT_INGEST_DEBUG:
+        logger.info("Chat ingest debug mode: writing per-stage chat files")
+        normalize_chat_timestamps(vod_id, logger)
+        normalize_chat_text(vod_id, logger)
+        strip_usernames(vod_id, logger)
+        extract_emotes(vod_id, logger)
+        filter_chat_messages(vod_id, logger)
+        normalized_path = export_final_chat(vod_id, logger)
+
+        with open(normalized_path, "r", encoding="utf-8") as f:
+            messages = json.load(f)["messages"]
+
+        write_chat_store(vod_id, messages)
+        return CHAT_STORE_DIR
+
+    store = open_chat_store()
+    if store is not None and store.vod_id == str(vod_id):
+        logger.info("Using cached chat store (%d messages)", len(store))
+        return CHAT_STORE_DIR
+
+    raw_path = TWITCH_CHAT_RAW_DIR / f"{vod_id}.json"
+    if not raw_path.exists():
+        raise FileNotFoundError(f"Raw chat file not found: {raw_path}")
+
+    logger.info("Ingesting chat replay: %s", raw_path)
+
+    # Comments are read one at a time, so memory stays flat however
+    # long the chat replay is
+    stats = {"dropped": 0, "filtered": 0}
+    messages = _ingest_messages(iter_raw_comments(raw_path), stats)
+
+    kept = write_chat_store(vod_id, messages)
+
+    logger.info(
+        "Chat ingest complete: %d messages (%d without timestamps, %d filtered)",
+        kept,
+        stats["dropped"],
+        stats["filtered"],
+    )
+
+    return CHAT_STORE_DIR
+
+
+def _ingest_messages(comments, stats: dict):
+    for comment in comments:
+        msg = normalize_comment(comment)
+        if msg is None:
+            stats["dropped"] += 1
+            continue
+
+        add_normalized_text(msg)
+        strip_username(msg)
+        add_emote_tokens(msg)
+
+        if is_noise_message(msg):
+            stats["filtered"] += 1
+            continue
+
+        yield msg
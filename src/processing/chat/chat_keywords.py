@@ -1,5 +1,8 @@
 import json
+
+import infra.config as config
 from infra.config import CHAT_KEYWORDS_PATH
+from processing.keyword_matcher import KeywordGroups, compiled_keyword_groups
 
 
 def load_chat_keywords() -> set[str]:
@@ -8,8 +11,7 @@ def load_chat_keywords() -> set[str]:
     Returns a flat set of lowercase strings.
     """
 
-    if not CHAT_KEYWORDS_PATH.exists():
-        raise FileNotFoundError(f"Chat keywords config missing: {CHAT_KEYWORDS_PATH}")
+    _require_chat_keywords()
 
     with open(CHAT_KEYWORDS_PATH, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -20,3 +22,33 @@ def load_chat_keywords() -> set[str]:
             keywords.add(kw.lower())
 
     return keywords
+
+
+def load_chat_keyword_groups() -> KeywordGroups:
+    """
+    Loads configured chat keywords as compiled keyword groups.
+    """
+
+    _require_chat_keywords()
+
+    return compiled_keyword_groups(
+        CHAT_KEYWORDS_PATH, word_boundary=config.KEYWORD_WORD_BOUNDARY
+    )
+
+
+def chat_keywords_version() -> str:
+    """
+    Changes whenever the chat keyword matches could: the keyword file's
+    mtime plus the word-boundary setting. Stored next to results derived
+    from the matches.
+    """
+
+    _require_chat_keywords()
+
+    mtime = CHAT_KEYWORDS_PATH.stat().st_mtime_ns
+    return f"{mtime}:{int(bool(config.KEYWORD_WORD_BOUNDARY))}"
+
+
+def _require_chat_keywords():
+    if not CHAT_KEYWORDS_PATH.exists():
+        raise FileNotFoundError(f"Chat keywords config missing: {CHAT_KEYWORDS_PATH}")
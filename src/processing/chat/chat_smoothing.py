@@ -1,13 +1,19 @@
 import json
-from collections import deque
 from pathlib import Path
 
+import numpy as np
+
 from infra.config import CHAT_METRICS_DIR, CHAT_SMOOTHING_WINDOW_SECONDS
+from processing.rolling_stats import densify, rolling_mean
 
 
 def smooth_chat_score(logger) -> Path:
     """
     Applies rolling average smoothing to final chat score.
+
+    The trailing window spans CHAT_SMOOTHING_WINDOW_SECONDS real seconds
+    (seconds without a chat score count as 0), so a burst carries into
+    the seconds after it, which get entries of their own.
     """
 
     input_path = CHAT_METRICS_DIR / "chat_score.json"
@@ -29,36 +35,44 @@ def smooth_chat_score(logger) -> Path:
         data = json.load(f)
 
     timeline = data["timeline"]
+    by_sec = {item["second"]: item for item in timeline}
 
-    # Ensure sorted by time
-    timeline = sorted(timeline, key=lambda x: x["second"])
+    if by_sec:
+        min_sec = min(by_sec)
+        max_sec = max(by_sec) + CHAT_SMOOTHING_WINDOW_SECONDS - 1
 
-    window = deque()
-    window_sum = 0.0
-
-    smoothed_timeline = []
-
-    for item in timeline:
-        score = item["score"]
+        raw = densify(
+            list(by_sec.keys()),
+            [item["score"] for item in by_sec.values()],
+            min_sec,
+            max_sec,
+        )
+        smoothed = rolling_mean(raw, CHAT_SMOOTHING_WINDOW_SECONDS, "trailing")
 
-        window.append(score)
-        window_sum += score
+        # Scored seconds, plus the seconds a burst carries into
+        keep = smoothed != 0
+        keep[np.array(list(by_sec.keys())) - min_sec] = True
+    else:
+        min_sec = 0
+        smoothed = np.zeros(0)
+        keep = np.zeros(0, dtype=bool)
 
-        if len(window) > CHAT_SMOOTHING_WINDOW_SECONDS:
-            window_sum -= window.popleft()
+    smoothed_timeline = []
 
-        smoothed = window_sum / len(window)
+    for i in np.flatnonzero(keep).tolist():
+        sec = min_sec + i
+        item = by_sec.get(sec, {})
 
         smoothed_timeline.append(
             {
-                "second": item["second"],
-                "score": smoothed,
+                "second": sec,
+                "score": float(smoothed[i]),
 
                 # retain explainability
-                "raw_score": item["score"],
-                "activity": item["activity"],
-                "emote": item["emote"],
-                "keyword": item["keyword"],
+                "raw_score": item.get("score", 0.0),
+                "activity": item.get("activity", 0.0),
+                "emote": item.get("emote", 0.0),
+                "keyword": item.get("keyword", 0.0),
             }
         )
 
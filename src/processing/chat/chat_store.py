@@ -0,0 +1,224 @@
+import json
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+from infra.config import DATA_DIR
+
+
+CHAT_STORE_DIR = DATA_DIR / "chat" / "store"
+CHAT_INDEX_PATH = CHAT_STORE_DIR / "index.json"
+
+TIMES_PATH = CHAT_STORE_DIR / "times.f32"
+TEXT_PATH = CHAT_STORE_DIR / "text.utf8"
+TEXT_OFFSETS_PATH = CHAT_STORE_DIR / "text_offsets.i64"
+EMOTE_IDS_PATH = CHAT_STORE_DIR / "emote_ids.i32"
+EMOTE_OFFSETS_PATH = CHAT_STORE_DIR / "emote_offsets.i64"
+
+
+class ChatStore:
+    """
+    Read-only columnar view over the normalized chat of one VOD.
+
+    Messages are sorted by vod_time_sec. Message i's normalized text is
+    text[text_offsets[i]:text_offsets[i + 1]] (UTF-8) and its emotes are
+    emote_ids[emote_offsets[i]:emote_offsets[i + 1]], ids into
+    emote_names. All arrays are zero-copy memmaps.
+    """
+
+    def __init__(self, index: dict):
+        self.index = index
+        self.vod_id = index.get("vod_id")
+        self.message_count = int(index["message_count"])
+        self.emote_names = index.get("emotes", [])
+
+        n = self.message_count
+        self.times = _memmap(TIMES_PATH, np.float32, n)
+        self.text_offsets = _memmap(TEXT_OFFSETS_PATH, np.int64, n + 1)
+        self.emote_offsets = _memmap(EMOTE_OFFSETS_PATH, np.int64, n + 1)
+        self.text = _memmap(TEXT_PATH, np.uint8, int(self.text_offsets[-1]))
+        self.emote_ids = _memmap(EMOTE_IDS_PATH, np.int32, int(self.emote_offsets[-1]))
+
+    def __len__(self) -> int:
+        return self.message_count
+
+    def seconds(self) -> np.ndarray:
+        """
+        Whole VOD second of every message.
+        """
+
+        return np.floor(self.times).astype(np.int64)
+
+    def time_slice(self, start_sec: float, end_sec: float) -> slice:
+        """
+        Messages with start_sec <= vod_time_sec < end_sec, by binary
+        search over the sorted times.
+        """
+
+        start = int(np.searchsorted(self.times, start_sec, side="left"))
+        end = int(np.searchsorted(self.times, end_sec, side="left"))
+        return slice(start, max(start, end))
+
+    def message_text(self, i: int) -> str:
+        start, end = self.text_offsets[i], self.text_offsets[i + 1]
+        return self.text[start:end].tobytes().decode("utf-8")
+
+    def texts(self, messages: slice = slice(None)):
+        for i in range(*messages.indices(self.message_count)):
+            yield self.message_text(i)
+
+    def emote_counts(self) -> np.ndarray:
+        return np.diff(self.emote_offsets)
+
+    def message_emote_ids(self, i: int) -> np.ndarray:
+        return self.emote_ids[self.emote_offsets[i]:self.emote_offsets[i + 1]]
+
+
+class ChatStoreWriter:
+    """
+    Builds the chat store one message at a time during ingest. Text is
+    streamed to disk; times, offsets and emote ids are kept as compact
+    arrays until finish().
+    """
+
+    def __init__(self, vod_id: str | None):
+        CHAT_STORE_DIR.mkdir(parents=True, exist_ok=True)
+
+        self.vod_id = vod_id
+        self.times = array("d")
+        self.text_offsets = array("q", [0])
+        self.emote_ids = array("i")
+        self.emote_offsets = array("q", [0])
+        self.emote_index: dict[str, int] = {}
+
+        self._text_file = open(TEXT_PATH, "wb")
+        self._text_bytes = 0
+
+    def add(self, vod_time_sec: float, text: str, emote_tokens):
+        # Messages sent before the VOD starts have no VOD second (and
+        # would break the per-second bincounts)
+        if vod_time_sec < 0:
+            return
+
+        encoded = text.encode("utf-8")
+        self._text_file.write(encoded)
+        self._text_bytes += len(encoded)
+
+        self.times.append(vod_time_sec)
+        self.text_offsets.append(self._text_bytes)
+
+        for name in emote_tokens:
+            emote_id = self.emote_index.setdefault(name, len(self.emote_index))
+            self.emote_ids.append(emote_id)
+        self.emote_offsets.append(len(self.emote_ids))
+
+    def finish(self) -> int:
+        """
+        Sorts by time if needed, writes the arrays and the index.
+        Returns the message count.
+        """
+
+        self._text_file.close()
+
+        times = np.frombuffer(self.times, dtype=np.float64)
+        text_offsets = np.frombuffer(self.text_offsets, dtype=np.int64)
+        emote_ids = np.frombuffer(self.emote_ids, dtype=np.int32)
+        emote_offsets = np.frombuffer(self.emote_offsets, dtype=np.int64)
+
+        if np.any(np.diff(times) < 0):
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+
+            text = np.fromfile(TEXT_PATH, dtype=np.uint8)
+            text, text_offsets = _reorder_ragged(text, text_offsets, order)
+            text.tofile(TEXT_PATH)
+
+            emote_ids, emote_offsets = _reorder_ragged(emote_ids, emote_offsets, order)
+
+        times.astype(np.float32).tofile(TIMES_PATH)
+        text_offsets.tofile(TEXT_OFFSETS_PATH)
+        emote_ids.tofile(EMOTE_IDS_PATH)
+        emote_offsets.tofile(EMOTE_OFFSETS_PATH)
+
+        index = {
+            "vod_id": self.vod_id,
+            "message_count": len(times),
+            "emotes": list(self.emote_index),
+        }
+
+        tmp_path = CHAT_INDEX_PATH.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        tmp_path.replace(CHAT_INDEX_PATH)
+
+        return len(times)
+
+
+def write_chat_store(vod_id: str | None, messages) -> int:
+    """
+    Writes the store from normalized chat messages (vod_time_sec,
+    text_userless, emote_tokens). Messages with a negative
+    vod_time_sec are dropped. Returns the stored message count.
+    """
+
+    clear_chat_store()
+    writer = ChatStoreWriter(vod_id)
+
+    for msg in messages:
+        writer.add(
+            msg["vod_time_sec"],
+            msg.get("text_userless") or "",
+            msg.get("emote_tokens") or [],
+        )
+
+    return writer.finish()
+
+
+def open_chat_store() -> ChatStore | None:
+    """
+    Returns the chat store, or None if ingest has not written it.
+    """
+
+    if not CHAT_INDEX_PATH.exists():
+        return None
+
+    with open(CHAT_INDEX_PATH, "r", encoding="utf-8") as f:
+        return ChatStore(json.load(f))
+
+
+def clear_chat_store():
+    # Index first: a store without an index is never opened
+    for path in (
+        CHAT_INDEX_PATH,
+        TIMES_PATH,
+        TEXT_PATH,
+        TEXT_OFFSETS_PATH,
+        EMOTE_IDS_PATH,
+        EMOTE_OFFSETS_PATH,
+    ):
+        if path.exists():
+            path.unlink()
+
+
+def _memmap(path: Path, dtype, length: int) -> np.ndarray:
+    if length <= 0:
+        return np.zeros(0, dtype=dtype)
+
+    return np.memmap(path, dtype=dtype, mode="r", shape=(length,))
+
+
+def _reorder_ragged(values: np.ndarray, offsets: np.ndarray, order: np.ndarray):
+    """
+    Permutes the rows of a ragged array (values split at offsets).
+    """
+
+    lengths = np.diff(offsets)[order]
+    new_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+
+    # Source position of every output element
+    row_starts = np.repeat(offsets[:-1][order], lengths)
+    within = np.arange(int(new_offsets[-1])) - np.repeat(new_offsets[:-1], lengths)
+
+    return values[row_starts + within], new_offsets
@@ -30,25 +30,7 @@ def extract_emotes(vod_id: str, logger) -> Path:
     messages_out = []
 
     for msg in data["messages"]:
-        raw = msg.get("raw", {})
-        message = raw.get("message", {})
-
-        emotes = message.get("emotes", []) or []
-
-        # Normalize emote tokens
-        tokens = []
-        for e in emotes:
-            name = e.get("name")
-            if name:
-                tokens.append(name)
-
-        new_msg = {
-            **msg,
-            "emote_tokens": tokens,
-            "emote_count": len(tokens),
-        }
-
-        messages_out.append(new_msg)
+        messages_out.append(add_emote_tokens(msg))
 
     output = {
         **data,
@@ -64,3 +46,26 @@ def extract_emotes(vod_id: str, logger) -> Path:
     )
 
     return out_path
+
+
+def add_emote_tokens(msg: dict) -> dict:
+    """
+    Adds emote_tokens and emote_count to a message, in place.
+    """
+
+    raw = msg.get("raw", {})
+    message = raw.get("message", {})
+
+    emotes = message.get("emotes", []) or []
+
+    # Normalize emote tokens
+    tokens = []
+    for e in emotes:
+        name = e.get("name")
+        if name:
+            tokens.append(name)
+
+    msg["emote_tokens"] = tokens
+    msg["emote_count"] = len(tokens)
+
+    return msg
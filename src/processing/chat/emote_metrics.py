@@ -1,64 +1,50 @@
 import json
-import math
-from collections import defaultdict
 from pathlib import Path
 
-from infra.config import DATA_DIR, CHAT_METRICS_DIR
+import numpy as np
 
+import infra.config as config
+from infra.config import CHAT_METRICS_DIR
+from processing.chat.chat_aggregates import require_chat_aggregates
 
-def compute_emote_density_per_second(logger) -> Path:
+
+def compute_emote_density_per_second(logger) -> Path | None:
     """
-    Computes emote density per second from normalized chat.
+    Emote density per second view of the chat aggregates, written as
+    JSON when CHAT_METRICS_JSON_VIEWS is on.
     """
 
-    input_path = DATA_DIR / "chat" / "normalized.json"
     output_path = CHAT_METRICS_DIR / "emote_density.json"
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Normalized chat not found: {input_path}")
+    aggregates = require_chat_aggregates(logger)
+
+    if not config.CHAT_METRICS_JSON_VIEWS:
+        return None
 
     if output_path.exists():
         logger.info("Using cached emote density metrics")
         return output_path
 
-    logger.info("Computing emote density per second")
-
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    emotes_per_sec = defaultdict(int)
-    messages_per_sec = defaultdict(int)
-
-    for msg in data["messages"]:
-        t = msg.get("vod_time_sec")
-        if t is None:
-            continue
-
-        sec = int(math.floor(t))
-
-        emote_count = len(msg.get("emote_tokens", []))
-        emotes_per_sec[sec] += emote_count
-
-        messages_per_sec[sec] += 1
+    emotes_per_sec = aggregates["emotes"]
+    messages_per_sec = aggregates["messages"]
 
     timeline = []
-    all_seconds = sorted(set(emotes_per_sec.keys()) | set(messages_per_sec.keys()))
 
-    for sec in all_seconds:
-        emotes = emotes_per_sec.get(sec, 0)
-        msgs = messages_per_sec.get(sec, 0)
+    for sec in np.flatnonzero(messages_per_sec).tolist():
+        emotes = int(emotes_per_sec[sec])
+        msgs = int(messages_per_sec[sec])
 
         timeline.append(
             {
                 "second": sec,
                 "emotes": emotes,
                 "messages": msgs,
-                "emotes_per_message": (emotes / msgs) if msgs > 0 else 0.0,
+                "emotes_per_message": emotes / msgs,
             }
         )
 
     output = {
-        "vod_id": data.get("vod_id"),
+        "vod_id": aggregates["vod_id"],
         "timeline": timeline,
     }
 
@@ -1,61 +1,48 @@
 import json
-from collections import Counter, defaultdict
 from pathlib import Path
 
-from infra.config import DATA_DIR, CHAT_METRICS_DIR
+import numpy as np
 
+import infra.config as config
+from infra.config import CHAT_METRICS_DIR
+from processing.chat.chat_aggregates import require_chat_aggregates
 
-def detect_repeated_emotes(logger) -> Path:
+
+def detect_repeated_emotes(logger) -> Path | None:
     """
-    Detects repeated emotes per second.
+    Repeated-emote view of the chat aggregates (top emote per second),
+    written as JSON when CHAT_METRICS_JSON_VIEWS is on.
     """
 
-    # We need per-message emote tokens, so re-read normalized chat
-    input_chat = DATA_DIR / "chat" / "normalized.json"
     output_path = CHAT_METRICS_DIR / "repeated_emotes.json"
 
-    if not input_chat.exists():
-        raise FileNotFoundError(f"Normalized chat not found: {input_chat}")
+    aggregates = require_chat_aggregates(logger)
+
+    if not config.CHAT_METRICS_JSON_VIEWS:
+        return None
 
     if output_path.exists():
         logger.info("Using cached repeated-emote metrics")
         return output_path
 
-    logger.info("Detecting repeated emotes")
-
-    with open(input_chat, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    emotes_by_second = defaultdict(list)
-
-    for msg in data["messages"]:
-        sec = int(msg["vod_time_sec"])
-        tokens = msg.get("emote_tokens", [])
-        emotes_by_second[sec].extend(tokens)
+    names = aggregates["emote_names"]
+    emotes = aggregates["emotes"]
 
     timeline = []
 
-    for sec in sorted(emotes_by_second.keys()):
-        tokens = emotes_by_second[sec]
-
-        if not tokens:
-            continue
-
-        counts = Counter(tokens)
-        most_common_emote, repeat_count = counts.most_common(1)[0]
-
+    for sec in np.flatnonzero(emotes).tolist():
         timeline.append(
             {
                 "second": sec,
-                "total_emotes": len(tokens),
-                "unique_emotes": len(counts),
-                "top_emote": most_common_emote,
-                "top_emote_count": repeat_count,
+                "total_emotes": int(emotes[sec]),
+                "unique_emotes": int(aggregates["unique_emotes"][sec]),
+                "top_emote": names[aggregates["top_emote"][sec]],
+                "top_emote_count": int(aggregates["top_emote_count"][sec]),
             }
         )
 
     output = {
-        "vod_id": data.get("vod_id"),
+        "vod_id": aggregates["vod_id"],
         "timeline": timeline,
     }
 
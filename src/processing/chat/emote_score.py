@@ -2,7 +2,10 @@ import json
 import math
 from pathlib import Path
 
-from infra.config import CHAT_METRICS_DIR, DATA_DIR, EMOTE_SCORE_SCALE
+import numpy as np
+
+from infra.config import CHAT_METRICS_DIR, EMOTE_SCORE_SCALE
+from processing.chat.chat_aggregates import CHAT_AGGREGATES_PATH, load_chat_aggregates
 from processing.chat.hype_emotes import load_hype_emotes
 
 
@@ -11,12 +14,11 @@ def compute_emote_score(logger) -> Path:
     Computes normalized emote score per second in [0, 1].
     """
 
-    density_path = CHAT_METRICS_DIR / "emote_density.json"
-    repeat_path = CHAT_METRICS_DIR / "repeated_emotes.json"
     output_path = CHAT_METRICS_DIR / "emote_score.json"
 
-    if not density_path.exists() or not repeat_path.exists():
-        raise FileNotFoundError("Required emote metric files missing")
+    aggregates = load_chat_aggregates()
+    if aggregates is None:
+        raise FileNotFoundError(f"Chat aggregates not found: {CHAT_AGGREGATES_PATH}")
 
     if output_path.exists():
         logger.info("Using cached emote score")
@@ -24,31 +26,18 @@ def compute_emote_score(logger) -> Path:
 
     logger.info("Normalizing emote score")
 
-    with open(density_path, "r", encoding="utf-8") as f:
-        density = json.load(f)["timeline"]
-
-    with open(repeat_path, "r", encoding="utf-8") as f:
-        repeats = json.load(f)["timeline"]
-
     hype_emotes = load_hype_emotes()
 
-    repeat_by_sec = {x["second"]: x for x in repeats}
+    names = aggregates["emote_names"]
+    emotes = aggregates["emotes"]
 
     timeline = []
 
-    for item in density:
-        sec = item["second"]
-        total_emotes = item["emotes"]
-
-        if total_emotes == 0:
-            continue
-
-        rep = repeat_by_sec.get(sec)
-        if not rep:
-            continue
+    for sec in np.flatnonzero(emotes).tolist():
+        total_emotes = int(emotes[sec])
 
-        top_emote = rep["top_emote"]
-        top_count = rep["top_emote_count"]
+        top_emote = names[aggregates["top_emote"][sec]]
+        top_count = int(aggregates["top_emote_count"][sec])
 
         hype_count = top_count if top_emote in hype_emotes else 0
         repeat_strength = top_count / total_emotes
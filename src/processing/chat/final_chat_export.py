@@ -6,8 +6,8 @@ from infra.config import DATA_DIR, TWITCH_CHAT_CLEAN_DIR
 
 def export_final_chat(vod_id: str, logger) -> Path:
     """
-    Exports the final, canonical normalized chat file.
-    This is the ONLY chat file used by metrics and scoring.
+    Exports the final normalized chat file (chat ingest debug mode).
+    Metrics read the chat store built from it.
     """
 
     input_path = TWITCH_CHAT_CLEAN_DIR / f"{vod_id}.json"
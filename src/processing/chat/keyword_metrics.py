@@ -1,70 +1,49 @@
 import json
-import math
-from collections import defaultdict
 from pathlib import Path
 
-from infra.config import DATA_DIR, CHAT_METRICS_DIR
-from processing.chat.chat_keywords import load_chat_keywords
+import numpy as np
 
+import infra.config as config
+from infra.config import CHAT_METRICS_DIR
+from processing.chat.chat_aggregates import keywords_by_second, require_chat_aggregates
 
-def compute_chat_keyword_hits(logger) -> Path:
+
+def compute_chat_keyword_hits(logger) -> Path | None:
     """
-    Counts chat keyword / phrase hits per second.
+    Chat keyword / phrase hits per second view of the chat aggregates,
+    written as JSON when CHAT_METRICS_JSON_VIEWS is on. Keywords are
+    matched against each message's text_userless.
     """
 
-    input_path = DATA_DIR / "chat" / "normalized.json"
     output_path = CHAT_METRICS_DIR / "chat_keyword_hits.json"
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Normalized chat not found: {input_path}")
+    aggregates = require_chat_aggregates(logger)
+
+    if not config.CHAT_METRICS_JSON_VIEWS:
+        return None
 
     if output_path.exists():
         logger.info("Using cached chat keyword hits")
         return output_path
 
-    logger.info("Computing chat keyword hits per second")
-
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    keywords = load_chat_keywords()
-
-    hits_per_sec = defaultdict(int)
-    messages_per_sec = defaultdict(int)
-    keywords_per_sec = defaultdict(set)
-
-    for msg in data["messages"]:
-        t = msg.get("vod_time_sec")
-        text = msg.get("text", "")
-
-        if t is None or not text:
-            continue
-
-        sec = int(math.floor(t))
-        messages_per_sec[sec] += 1
-
-        for kw in keywords:
-            if kw in text:
-                hits_per_sec[sec] += 1
-                keywords_per_sec[sec].add(kw)
+    messages_per_sec = aggregates["text_messages"]
+    hits_per_sec = aggregates["keyword_hits"]
+    keywords_per_sec = keywords_by_second(aggregates)
 
     timeline = []
-    all_seconds = sorted(
-        set(messages_per_sec.keys()) | set(hits_per_sec.keys())
-    )
 
-    for sec in all_seconds:
+    for sec in np.flatnonzero(messages_per_sec).tolist():
         timeline.append(
             {
                 "second": sec,
-                "messages": messages_per_sec.get(sec, 0),
-                "keyword_hits": hits_per_sec.get(sec, 0),
-                "keywords": sorted(keywords_per_sec.get(sec, [])),
+                "messages": int(messages_per_sec[sec]),
+                "keyword_hits": int(hits_per_sec[sec]),
+                "keywords": keywords_per_sec.get(sec, []),
             }
         )
 
     output = {
-        "vod_id": data.get("vod_id"),
+        "vod_id": aggregates["vod_id"],
         "timeline": timeline,
     }
 
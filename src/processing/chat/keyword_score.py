@@ -2,7 +2,14 @@ import json
 import math
 from pathlib import Path
 
+import numpy as np
+
 from infra.config import CHAT_METRICS_DIR, KEYWORD_SCORE_SCALE
+from processing.chat.chat_aggregates import (
+    CHAT_AGGREGATES_PATH,
+    keywords_by_second,
+    load_chat_aggregates,
+)
 
 
 def compute_chat_keyword_score(logger) -> Path:
@@ -10,11 +17,11 @@ def compute_chat_keyword_score(logger) -> Path:
     Computes normalized chat keyword score per second in [0, 1].
     """
 
-    input_path = CHAT_METRICS_DIR / "chat_keyword_hits.json"
     output_path = CHAT_METRICS_DIR / "chat_keyword_score.json"
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Keyword hits not found: {input_path}")
+    aggregates = load_chat_aggregates()
+    if aggregates is None:
+        raise FileNotFoundError(f"Chat aggregates not found: {CHAT_AGGREGATES_PATH}")
 
     if output_path.exists():
         logger.info("Using cached chat keyword score")
@@ -22,30 +29,28 @@ def compute_chat_keyword_score(logger) -> Path:
 
     logger.info("Normalizing chat keyword score")
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    messages_per_sec = aggregates["text_messages"]
+    hits_per_sec = aggregates["keyword_hits"]
+    keywords_per_sec = keywords_by_second(aggregates)
 
     timeline = []
 
-    for item in data["timeline"]:
-        messages = item["messages"]
-        hits = item["keyword_hits"]
-
-        if messages == 0 or hits == 0:
-            continue
+    for sec in np.flatnonzero(hits_per_sec).tolist():
+        messages = int(messages_per_sec[sec])
+        hits = int(hits_per_sec[sec])
 
         density = hits / messages
         score = math.tanh(density / KEYWORD_SCORE_SCALE)
 
         timeline.append(
             {
-                "second": item["second"],
+                "second": sec,
                 "score": score,
 
                 # metadata for explainability
                 "keyword_hits": hits,
                 "messages": messages,
-                "keywords": item["keywords"],
+                "keywords": keywords_per_sec.get(sec, []),
                 "signal": "keyword",
             }
         )
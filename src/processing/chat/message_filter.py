@@ -40,26 +40,7 @@ def filter_chat_messages(vod_id: str, logger) -> Path:
     dropped = 0
 
     for msg in data["messages"]:
-        text = (msg.get("text_userless") or "").strip()
-        emote_count = msg.get("emote_count", 0)
-
-        # 1) Empty text and no emotes
-        if not text and emote_count == 0:
-            dropped += 1
-            continue
-
-        # 2) Pure punctuation and no emotes
-        if PURE_PUNCTUATION_RE.match(text) and emote_count == 0:
-            dropped += 1
-            continue
-
-        # 3) Very short noise without emotes
-        if len(text) < 2 and emote_count == 0:
-            dropped += 1
-            continue
-
-        # 4) System / bot messages
-        if any(p.search(text) for p in SYSTEM_MESSAGE_PATTERNS):
+        if is_noise_message(msg):
             dropped += 1
             continue
 
@@ -81,3 +62,23 @@ def filter_chat_messages(vod_id: str, logger) -> Path:
     )
 
     return out_path
+
+
+def is_noise_message(msg: dict) -> bool:
+    text = (msg.get("text_userless") or "").strip()
+    emote_count = msg.get("emote_count", 0)
+
+    # 1) Empty text and no emotes
+    if not text and emote_count == 0:
+        return True
+
+    # 2) Pure punctuation and no emotes
+    if PURE_PUNCTUATION_RE.match(text) and emote_count == 0:
+        return True
+
+    # 3) Very short noise without emotes
+    if len(text) < 2 and emote_count == 0:
+        return True
+
+    # 4) System / bot messages
+    return any(p.search(text) for p in SYSTEM_MESSAGE_PATTERNS)
@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+
+# Characters read from disk per refill
+READ_BLOCK_CHARS = 1 << 20
+
+_WHITESPACE = " \t\n\r"
+
+
+class _Scanner:
+    """
+    A sliding text buffer over a file that JSON values are decoded from
+    one at a time with raw_decode. Consumed text is dropped, so memory
+    holds roughly one block plus the value being decoded.
+    """
+
+    def __init__(self, f, block_chars: int):
+        self.f = f
+        self.block_chars = block_chars
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, min_chars: int = 0) -> bool:
+        if self.eof:
+            return False
+
+        if self.pos > self.block_chars:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+        data = self.f.read(max(self.block_chars, min_chars))
+        if not data:
+            self.eof = True
+            return False
+
+        self.buf += data
+        return True
+
+    def peek(self) -> str:
+        """
+        Next non-whitespace character ("" at end of file).
+        """
+
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"Malformed chat JSON: expected {ch!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value continues past the buffer; grow geometrically so
+                # a very large value is not re-decoded once per block
+                if not self._fill(len(self.buf) - self.pos):
+                    raise
+                continue
+
+            # A number may be cut at the buffer edge
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+
+            self.pos = end
+            return value
+
+
+def iter_raw_comments(
+    path: Path,
+    header: dict | None = None,
+    block_chars: int = READ_BLOCK_CHARS,
+):
+    """
+    Yields the entries of comments[] in a TwitchDownloader chat replay
+    one at a time, without loading the file.
+
+    Top-level fields that precede comments (video, streamer, ...) are
+    stored in header when given. Reading stops at the end of the
+    comments array, so trailing fields such as embeddedData are never
+    parsed.
+    """
+
+    with open(path, "r", encoding="utf-8-sig") as f:
+        scanner = _Scanner(f, block_chars)
+        scanner.expect("{")
+
+        if scanner.peek() == "}":
+            return
+
+        while True:
+            key = scanner.value()
+            scanner.expect(":")
+
+            if key == "comments":
+                yield from _iter_array(scanner)
+                return
+
+            value = scanner.value()
+            if header is not None:
+                header[key] = value
+
+            if scanner.peek() == "}":
+                return
+            scanner.expect(",")
+
+
+def _iter_array(scanner: _Scanner):
+    if scanner.peek() == "n":
+        # "comments": null
+        scanner.value()
+        return
+
+    scanner.expect("[")
+
+    if scanner.peek() == "]":
+        return
+
+    while True:
+        yield scanner.value()
+
+        if scanner.peek() == "]":
+            return
+        scanner.expect(",")
@@ -1,30 +1,31 @@
 import json
 from pathlib import Path
 
+import numpy as np
+
 from infra.config import (
     CHAT_METRICS_DIR,
     CHAT_SPIKE_RATIO_THRESHOLD,
     CHAT_MIN_BASELINE,
 )
+from processing.chat.baseline_metrics import message_baseline
+from processing.chat.chat_aggregates import CHAT_AGGREGATES_PATH, load_chat_aggregates
+from processing.rolling_stats import ratio_to_baseline
 
 
-def _log_debug_metrics(baseline_timeline, spikes, logger):
+def _log_debug_metrics(messages, baseline, spikes, logger):
     """
     Logs high-level diagnostic metrics for chat activity.
     """
 
-    mps_values = [x["messages"] for x in baseline_timeline]
-    baseline_values = [x["baseline"] for x in baseline_timeline if x["baseline"] > 0]
+    nonzero_mps = messages[messages > 0]
+    positive_baseline = baseline[baseline > 0]
 
-    max_mps = max(mps_values) if mps_values else 0
-    avg_mps = (
-        sum(v for v in mps_values if v > 0) / max(1, len([v for v in mps_values if v > 0]))
-    )
+    max_mps = messages.max() if len(messages) else 0
+    avg_mps = nonzero_mps.sum() / max(1, len(nonzero_mps))
 
-    max_baseline = max(baseline_values) if baseline_values else 0
-    avg_baseline = (
-        sum(baseline_values) / max(1, len(baseline_values))
-    )
+    max_baseline = positive_baseline.max() if len(positive_baseline) else 0
+    avg_baseline = positive_baseline.sum() / max(1, len(positive_baseline))
 
     max_spike = max(
         (s["magnitude"] for s in spikes),
@@ -45,11 +46,11 @@ def detect_chat_spikes(logger) -> Path:
     Detects chat activity spikes using a ratio over rolling baseline.
     """
 
-    input_path = CHAT_METRICS_DIR / "rolling_baseline.json"
     output_path = CHAT_METRICS_DIR / "chat_spikes.json"
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Baseline file not found: {input_path}")
+    aggregates = load_chat_aggregates()
+    if aggregates is None:
+        raise FileNotFoundError(f"Chat aggregates not found: {CHAT_AGGREGATES_PATH}")
 
     if output_path.exists():
         logger.info("Using cached chat spikes")
@@ -61,44 +62,25 @@ def detect_chat_spikes(logger) -> Path:
         CHAT_MIN_BASELINE,
     )
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    spikes = []
-
-    for item in data["timeline"]:
-        sec = item["second"]
-        mps = item["messages"]
-        baseline = item["baseline"]
-
-        if baseline < CHAT_MIN_BASELINE:
-            continue
-
-        ratio = mps / baseline if baseline > 0 else 0.0
+    min_sec, messages, baseline = message_baseline(aggregates)
 
-        if baseline > 0:
-            logger.debug(
-                "sec=%d mps=%.2f baseline=%.2f ratio=%.2f",
-                sec,
-                mps,
-                baseline,
-                ratio,
-            )
+    ratio = ratio_to_baseline(messages, baseline, CHAT_MIN_BASELINE)
+    is_spike = ratio >= CHAT_SPIKE_RATIO_THRESHOLD
 
-        if ratio >= CHAT_SPIKE_RATIO_THRESHOLD:
-            spikes.append(
-                {
-                    "timestamp_sec": sec,
-                    "magnitude": ratio,
-                    "messages_per_second": mps,
-                    "baseline": baseline,
-                }
-            )
+    spikes = [
+        {
+            "timestamp_sec": min_sec + i,
+            "magnitude": float(ratio[i]),
+            "messages_per_second": int(messages[i]),
+            "baseline": float(baseline[i]),
+        }
+        for i in np.flatnonzero(is_spike).tolist()
+    ]
 
-    _log_debug_metrics(data["timeline"], spikes, logger)
+    _log_debug_metrics(messages, baseline, spikes, logger)
 
     output = {
-        "vod_id": data.get("vod_id"),
+        "vod_id": aggregates["vod_id"],
         "threshold_ratio": CHAT_SPIKE_RATIO_THRESHOLD,
         "min_baseline": CHAT_MIN_BASELINE,
         "spike_count": len(spikes),
@@ -33,21 +33,7 @@ def normalize_chat_text(vod_id: str, logger) -> Path:
     normalized = []
 
     for msg in messages:
-        raw_msg = msg.get("message", {})
-        body = raw_msg.get("body", "")
-
-        if not isinstance(body, str):
-            body = ""
-
-        text_norm = body.strip().lower()
-
-        new_msg = {
-            **msg,
-            "text_raw": body,
-            "text_norm": text_norm,
-        }
-
-        normalized.append(new_msg)
+        normalized.append(add_normalized_text(msg))
 
     output = {
         **data,
@@ -63,3 +49,20 @@ def normalize_chat_text(vod_id: str, logger) -> Path:
     )
 
     return out_path
+
+
+def add_normalized_text(msg: dict) -> dict:
+    """
+    Adds text_raw and text_norm to a message, in place.
+    """
+
+    raw_msg = msg.get("message", {})
+    body = raw_msg.get("body", "")
+
+    if not isinstance(body, str):
+        body = ""
+
+    msg["text_raw"] = body
+    msg["text_norm"] = body.strip().lower()
+
+    return msg
@@ -6,6 +6,7 @@ from infra.config import (
     TWITCH_CHAT_RAW_DIR,
     TWITCH_CHAT_NORMALIZED_DIR,
 )
+from processing.chat.raw_chat_reader import iter_raw_comments
 
 
 def normalize_chat_timestamps(vod_id: str, logger) -> Path:
@@ -26,39 +27,23 @@ def normalize_chat_timestamps(vod_id: str, logger) -> Path:
 
     logger.info("Normalizing chat timestamps")
 
-    with open(raw_path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    comments = raw.get("comments", [])
+    header = {}
+    comments = iter_raw_comments(raw_path, header)
     normalized_comments = []
 
     dropped = 0
 
     for msg in comments:
-        offset = msg.get("content_offset_seconds")
-
-        if offset is None:
-            dropped += 1
-            continue
+        normalized_msg = normalize_comment(msg)
 
-        try:
-            vod_time = float(offset)
-        except (TypeError, ValueError):
+        if normalized_msg is None:
             dropped += 1
             continue
 
-        normalized_msg: Dict[str, Any] = {
-            "vod_time_sec": vod_time,
-            "message": msg.get("message"),
-            "commenter": msg.get("commenter"),
-            "emotes": msg.get("message", {}).get("emotes", []),
-            "raw": msg,  # preserve full original message
-        }
-
         normalized_comments.append(normalized_msg)
 
     output = {
-        "vod_id": raw.get("video", {}).get("id"),
+        "vod_id": (header.get("video") or {}).get("id"),
         "message_count": len(normalized_comments),
         "dropped_messages": dropped,
         "messages": normalized_comments,
@@ -74,3 +59,28 @@ def normalize_chat_timestamps(vod_id: str, logger) -> Path:
     )
 
     return out_path
+
+
+def normalize_comment(msg: Dict[str, Any]) -> Dict[str, Any] | None:
+    """
+    One raw Twitch comment as a chat message with vod_time_sec, or None
+    when it has no usable offset.
+    """
+
+    offset = msg.get("content_offset_seconds")
+
+    if offset is None:
+        return None
+
+    try:
+        vod_time = float(offset)
+    except (TypeError, ValueError):
+        return None
+
+    return {
+        "vod_time_sec": vod_time,
+        "message": msg.get("message"),
+        "commenter": msg.get("commenter"),
+        "emotes": msg.get("message", {}).get("emotes", []),
+        "raw": msg,  # preserve full original message
+    }
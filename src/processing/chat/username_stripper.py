@@ -37,21 +37,7 @@ def strip_usernames(vod_id: str, logger) -> Path:
     cleaned = []
 
     for msg in data["messages"]:
-        text = msg.get("text_norm", "")
-
-        # Strip common username prefixes
-        for pattern in USERNAME_PREFIX_PATTERNS:
-            text = pattern.sub("", text)
-
-        new_msg = {
-            **msg,
-            "text_userless": text,
-        }
-
-        # Remove structured identity
-        new_msg.pop("commenter", None)
-
-        cleaned.append(new_msg)
+        cleaned.append(strip_username(msg))
 
     output = {
         **data,
@@ -67,3 +53,22 @@ def strip_usernames(vod_id: str, logger) -> Path:
     )
 
     return out_path
+
+
+def strip_username(msg: dict) -> dict:
+    """
+    Adds text_userless and drops the commenter, in place.
+    """
+
+    text = msg.get("text_norm", "")
+
+    # Strip common username prefixes
+    for pattern in USERNAME_PREFIX_PATTERNS:
+        text = pattern.sub("", text)
+
+    msg["text_userless"] = text
+
+    # Remove structured identity
+    msg.pop("commenter", None)
+
+    return msg
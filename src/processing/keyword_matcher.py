@@ -0,0 +1,160 @@
+import json
+import re
+from pathlib import Path
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed phrase list against text.
+
+    Matching is exact (callers lowercase both sides) and per phrase:
+    substring tests and str.count run in C, which beats any per-character
+    matcher written in Python for the few dozen phrases we configure.
+    With word_boundary a match only counts when it is not preceded or
+    followed by a word character, so "what" no longer matches inside
+    "whatever"; the substring test still runs first and skips the regex
+    for phrases that cannot match.
+    """
+
+    def __init__(self, phrases, word_boundary: bool = False):
+        self.phrases = list(dict.fromkeys(p for p in phrases if p))
+        self.word_boundary = word_boundary
+        self._patterns = [_phrase_pattern(p, word_boundary) for p in self.phrases]
+
+    def occurrences(self, text: str):
+        """
+        Yields (start, end, phrase_index) per occurrence. Occurrences of
+        the same phrase never overlap (leftmost first, as str.count
+        counts them); occurrences of different phrases may.
+        """
+
+        for index, phrase in enumerate(self.phrases):
+            if phrase in text:
+                for match in self._patterns[index].finditer(text):
+                    yield match.start(), match.end(), index
+
+    def count(self, text: str) -> list[int]:
+        """
+        Occurrences per phrase (str.count semantics).
+        """
+
+        if not self.word_boundary:
+            return [text.count(phrase) for phrase in self.phrases]
+
+        return [
+            len(pattern.findall(text)) if phrase in text else 0
+            for phrase, pattern in zip(self.phrases, self._patterns)
+        ]
+
+    def present(self, text: str) -> list[int]:
+        """
+        Indices of the phrases that occur at least once, in phrase order.
+        """
+
+        if not self.word_boundary:
+            return [i for i, phrase in enumerate(self.phrases) if phrase in text]
+
+        return [
+            i
+            for i, (phrase, pattern) in enumerate(zip(self.phrases, self._patterns))
+            if phrase in text and pattern.search(text)
+        ]
+
+
+class KeywordGroups:
+    """
+    A compiled keyword file: one matcher over all phrases, plus the
+    group each phrase belongs to (a phrase may sit in several groups).
+    """
+
+    def __init__(self, groups: dict[str, list[str]], word_boundary: bool = False):
+        self.groups = groups
+        self.matcher = KeywordMatcher(
+            (phrase for phrases in groups.values() for phrase in phrases),
+            word_boundary=word_boundary,
+        )
+
+        index_of = {phrase: i for i, phrase in enumerate(self.matcher.phrases)}
+        self.group_indices = {
+            name: [index_of[p] for p in phrases if p in index_of]
+            for name, phrases in groups.items()
+        }
+
+    def count_groups(self, text: str) -> dict[str, int]:
+        counts = self.matcher.count(text)
+        return {
+            name: sum(counts[i] for i in indices)
+            for name, indices in self.group_indices.items()
+        }
+
+    def phrase_weights(self, group_weights: dict[str, float]) -> list[float]:
+        """
+        Per-phrase weight: the sum of the weights of its groups.
+        """
+
+        weights = [0.0] * len(self.matcher.phrases)
+        for name, weight in group_weights.items():
+            for index in self.group_indices.get(name, []):
+                weights[index] += weight
+
+        return weights
+
+    def present_phrases(self, text: str) -> set[str]:
+        phrases = self.matcher.phrases
+        return {phrases[i] for i in self.matcher.present(text)}
+
+
+_compiled: dict[tuple[str, bool], tuple[int, KeywordGroups]] = {}
+
+
+def compiled_keyword_groups(path: Path, word_boundary: bool = False) -> KeywordGroups:
+    """
+    Compiles a keyword JSON file once; recompiled when the file's mtime
+    changes. Nested objects become dotted group names
+    ("sentiment.positive"); phrases are lowercased.
+    """
+
+    key = (str(path), word_boundary)
+    mtime = path.stat().st_mtime_ns
+
+    cached = _compiled.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    groups = KeywordGroups(_flatten_groups(data), word_boundary=word_boundary)
+    _compiled[key] = (mtime, groups)
+
+    return groups
+
+
+def _flatten_groups(data: dict, prefix: str = "") -> dict[str, list[str]]:
+    groups = {}
+
+    for name, value in data.items():
+        if isinstance(value, dict):
+            groups.update(_flatten_groups(value, f"{prefix}{name}."))
+        else:
+            groups[f"{prefix}{name}"] = [phrase.lower() for phrase in value]
+
+    return groups
+
+
+def _phrase_pattern(phrase: str, word_boundary: bool) -> re.Pattern:
+    # The boundary only applies on sides where the phrase itself starts /
+    # ends with a word character ("what?" may be followed by anything)
+    pattern = re.escape(phrase)
+
+    if word_boundary:
+        if _is_word_char(phrase[0]):
+            pattern = r"(?<!\w)" + pattern
+        if _is_word_char(phrase[-1]):
+            pattern += r"(?!\w)"
+
+    return re.compile(pattern)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
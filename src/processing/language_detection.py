@@ -0,0 +1,154 @@
+import json
+from collections import defaultdict
+
+import infra.config as config
+from processing.vad import gather_speech, speech_spans_in_range
+
+
+LANGUAGE_PATH = config.TRANSCRIPTS_DIR / "language.json"
+
+# Seconds of audio Whisper looks at for language identification
+DETECTION_WINDOW_SECONDS = 30.0
+
+
+def resolve_vod_language(backend, store, speech_regions, logger, resume: bool) -> str | None:
+    """
+    Language pinned for every transcription of this VOD.
+
+    TRANSCRIPTION_LANGUAGE (config / preset) wins; otherwise the language
+    is detected once from the most speech-heavy windows and cached next
+    to the transcripts.
+    """
+
+    if speech_regions is None:
+        speech_regions = [(0.0, store.duration_seconds)]
+
+    windows = speech_heavy_windows(
+        speech_regions,
+        store.duration_seconds,
+        config.LANGUAGE_DETECTION_SAMPLES,
+    )
+
+    return resolve_language(backend, store, windows, logger, resume)
+
+
+def resolve_language(backend, store, span_lists, logger, resume: bool) -> str | None:
+    """
+    Same as resolve_vod_language, with the sample windows (lists of VOD
+    spans) chosen by the caller — the streaming pipeline uses the first
+    windows it sees.
+    """
+
+    known = known_language(logger, resume)
+    if known is not None:
+        return known
+
+    max_samples = round(DETECTION_WINDOW_SECONDS * store.sample_rate)
+    samples = [
+        gather_speech(store, spans)[0][:max_samples]
+        for spans in span_lists
+    ]
+
+    return detect_language(backend, samples, logger)
+
+
+def known_language(logger, resume: bool) -> str | None:
+    """
+    The configured language, or on resume the one detected earlier.
+    """
+
+    pinned = configured_language()
+    if pinned is not None:
+        logger.info(f"Transcription language pinned by config: {pinned}")
+        return pinned
+
+    if resume:
+        cached = load_cached_language()
+        if cached is not None:
+            logger.info(f"Using cached VOD language: {cached}")
+            return cached
+
+    return None
+
+
+def configured_language() -> str | None:
+    language = config.TRANSCRIPTION_LANGUAGE
+    if not language or language == "auto":
+        return None
+    return language
+
+
+def detect_language(backend, samples: list, logger) -> str | None:
+    """
+    Runs language identification on each sample and keeps the language
+    with the highest summed probability. The result is cached.
+    """
+
+    samples = [sample for sample in samples if len(sample)]
+    if not samples:
+        logger.info("No speech for language detection — Whisper will detect per window")
+        return None
+
+    votes = defaultdict(float)
+    for sample in samples:
+        language, probability = backend.detect_language(sample)
+        if language:
+            votes[language] += probability
+
+    if not votes:
+        return None
+
+    language = max(votes, key=votes.get)
+    logger.info(
+        f"Detected VOD language: {language} "
+        f"({len(samples)} samples, votes: "
+        + ", ".join(f"{k}={v:.2f}" for k, v in sorted(votes.items(), key=lambda kv: -kv[1]))
+        + ")"
+    )
+
+    write_language(language)
+    return language
+
+
+def speech_heavy_windows(
+    speech_regions: list[tuple[float, float]],
+    duration: float,
+    count: int,
+) -> list[list[tuple[float, float]]]:
+    """
+    Picks up to `count` non-overlapping DETECTION_WINDOW_SECONDS windows
+    with the most speech, in VOD order. Each window is returned as its
+    clipped speech spans.
+    """
+
+    windows = []
+    start = 0.0
+    while start < duration:
+        end = min(start + DETECTION_WINDOW_SECONDS, duration)
+        spans = speech_spans_in_range(speech_regions, start, end)
+        speech = sum(e - s for s, e in spans)
+        if speech > 0:
+            windows.append((speech, start, spans))
+        start = end
+
+    best = sorted(windows, key=lambda w: -w[0])[:count]
+    return [spans for _, _, spans in sorted(best, key=lambda w: w[1])]
+
+
+def load_cached_language() -> str | None:
+    if not LANGUAGE_PATH.exists():
+        return None
+
+    with open(LANGUAGE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f).get("language")
+
+
+def write_language(language: str):
+    LANGUAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(LANGUAGE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"language": language}, f)
+
+
+def clear_cached_language():
+    if LANGUAGE_PATH.exists():
+        LANGUAGE_PATH.unlink()
@@ -0,0 +1,168 @@
+import json
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+from infra.config import KEYFRAME_INDEX_DIR
+from infra.staging import input_fingerprint
+
+
+class KeyframeIndex:
+    """
+    Sorted video keyframe timestamps (seconds) of one input file.
+    """
+
+    def __init__(self, keyframes: np.ndarray, duration: float):
+        self.keyframes = np.asarray(keyframes, dtype=np.float64)
+        self.duration = float(duration)
+
+    def __len__(self) -> int:
+        return len(self.keyframes)
+
+    def keyframe_at_or_before(self, t: float) -> float:
+        """
+        Where a stream-copy cut requested at `t` actually starts.
+        """
+
+        if len(self.keyframes) == 0:
+            return t
+
+        pos = np.searchsorted(self.keyframes, t, side="right") - 1
+        return float(self.keyframes[max(pos, 0)])
+
+    def keyframe_at_or_after(self, t: float) -> float:
+        if len(self.keyframes) == 0:
+            return t
+
+        pos = np.searchsorted(self.keyframes, t, side="left")
+        if pos >= len(self.keyframes):
+            return self.duration
+
+        return float(self.keyframes[pos])
+
+    def segment_boundaries(self, segment_seconds: float) -> list[float]:
+        """
+        Start times of the segments the ffmpeg segment muxer produces with
+        `-c copy`: each cut lands on a keyframe, never before the nominal
+        segment_seconds grid.
+        """
+
+        if len(self.keyframes) == 0:
+            return [
+                float(t)
+                for t in np.arange(0.0, max(self.duration, 1e-9), segment_seconds)
+            ]
+
+        boundaries = [0.0]
+
+        while True:
+            # The muxer aims for segment_count * segment_seconds and cuts
+            # on the first keyframe past both that target and the last cut
+            target = len(boundaries) * segment_seconds
+            pos = max(
+                np.searchsorted(self.keyframes, target, side="left"),
+                np.searchsorted(self.keyframes, boundaries[-1], side="right"),
+            )
+
+            if pos >= len(self.keyframes) or self.keyframes[pos] >= self.duration:
+                break
+
+            boundaries.append(float(self.keyframes[pos]))
+
+        return boundaries
+
+
+def load_keyframe_index(input_video_path, logger) -> KeyframeIndex:
+    """
+    Returns the keyframe index of an input file, probing it once with
+    ffprobe and caching the result keyed by the file fingerprint.
+    """
+
+    fingerprint = input_fingerprint(Path(input_video_path))
+    index_path = KEYFRAME_INDEX_DIR / f"{fingerprint}.npz"
+
+    if index_path.exists():
+        with np.load(index_path) as data:
+            logger.info(f"Keyframe index cache hit: {index_path.name}")
+            return KeyframeIndex(data["keyframes"], float(data["duration"]))
+
+    logger.info(f"Building keyframe index for {input_video_path}")
+
+    keyframes = _probe_keyframes(input_video_path)
+    duration = probe_duration_seconds(input_video_path)
+
+    KEYFRAME_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(".tmp.npz")
+    np.savez(
+        tmp_path,
+        keyframes=keyframes,
+        duration=np.float64(duration),
+    )
+    tmp_path.replace(index_path)
+
+    logger.info(
+        f"Keyframe index built: {len(keyframes)} keyframes over {duration:.1f}s"
+    )
+
+    return KeyframeIndex(keyframes, duration)
+
+
+def _probe_keyframes(input_video_path) -> np.ndarray:
+    """
+    Reads packet timestamps and flags of the first video stream.
+    Packets are only demuxed, never decoded.
+    """
+
+    command = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=print_section=0",
+        str(input_video_path),
+    ]
+
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1024 * 1024,
+    )
+
+    keyframes = []
+    for line in process.stdout:
+        pts_time, _, flags = line.strip().partition(",")
+        if "K" not in flags or pts_time in ("", "N/A"):
+            continue
+        keyframes.append(float(pts_time))
+
+    if process.wait() != 0:
+        raise RuntimeError(f"ffprobe packet scan failed for {input_video_path}")
+
+    return np.unique(np.array(keyframes, dtype=np.float64))
+
+
+def probe_duration_seconds(input_video_path) -> float:
+    command = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "json",
+        str(input_video_path),
+    ]
+
+    try:
+        result = subprocess.run(
+            command, check=True, capture_output=True, text=True
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(
+            f"ffprobe failed for {input_video_path}"
+        ) from e
+
+    duration = json.loads(result.stdout).get("format", {}).get("duration")
+    if duration is None:
+        raise RuntimeError(f"Could not determine duration of {input_video_path}")
+
+    return float(duration)
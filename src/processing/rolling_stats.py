@@ -0,0 +1,129 @@
+import numpy as np
+
+
+# Window placement relative to sample t, for a window of w samples:
+#   trailing  values[t - w + 1 : t + 1]   (ends at t)
+#   causal    values[t - w : t]           (strictly before t)
+#   centered  values[t - w // 2 : t - w // 2 + w]
+# Windows are truncated at the array edges; means divide by the number
+# of samples actually in the window.
+ALIGNMENTS = ("trailing", "causal", "centered")
+
+
+def window_bounds(n: int, window: int, align: str = "trailing") -> tuple[np.ndarray, np.ndarray]:
+    """
+    (starts, ends) of the window around every sample, clipped to [0, n].
+    """
+
+    starts = _window_starts(n, window, align)
+    return np.clip(starts, 0, n), np.clip(starts + window, 0, n)
+
+
+def window_sums(values: np.ndarray, starts: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sum of values[s:s + window] for every start s, via one cumulative
+    sum (O(n) regardless of window size).
+    """
+
+    csum = _cumsum(values)
+    starts = np.asarray(starts)
+    ends = np.minimum(starts + window, len(values))
+    return csum[ends] - csum[starts]
+
+
+def rolling_sum(values: np.ndarray, window: int, align: str = "trailing") -> np.ndarray:
+    starts, ends = window_bounds(len(values), window, align)
+    csum = _cumsum(values)
+    return csum[ends] - csum[starts]
+
+
+def rolling_count(n: int, window: int, align: str = "trailing") -> np.ndarray:
+    """
+    Number of in-bounds samples in every window.
+    """
+
+    starts, ends = window_bounds(n, window, align)
+    return ends - starts
+
+
+def rolling_mean(values: np.ndarray, window: int, align: str = "trailing") -> np.ndarray:
+    """
+    Mean over each window; 0 where the window is empty (the first
+    sample of a causal window).
+    """
+
+    sums = rolling_sum(values, window, align)
+    counts = rolling_count(len(values), window, align)
+    return np.divide(sums, counts, out=np.zeros(len(sums)), where=counts > 0)
+
+
+def rolling_max(values: np.ndarray, window: int, align: str = "trailing") -> np.ndarray:
+    """
+    Maximum over each window (-inf where the window is empty). Max has
+    no cumulative form, so this reduces a strided window view: O(n * w)
+    work but no Python loop and no copy of the windows.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    starts = _window_starts(n, window, align)
+
+    # -inf padding on both sides keeps every window full length
+    padded = np.full(n + 2 * window, -np.inf)
+    padded[window:window + n] = values
+    views = np.lib.stride_tricks.sliding_window_view(padded, window)
+
+    return views[starts + window].max(axis=1, initial=-np.inf)
+
+
+def ratio_to_baseline(
+    values: np.ndarray,
+    baseline: np.ndarray,
+    min_baseline: float = 0.0,
+) -> np.ndarray:
+    """
+    values / baseline, 0 where the baseline is below min_baseline or
+    not positive.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    baseline = np.asarray(baseline, dtype=np.float64)
+    valid = (baseline >= min_baseline) & (baseline > 0)
+
+    return np.divide(values, baseline, out=np.zeros(len(values)), where=valid)
+
+
+def densify(seconds, values, start: int, end: int) -> np.ndarray:
+    """
+    Dense array over [start, end] from sparse (second, value) pairs;
+    missing seconds are 0.
+    """
+
+    dense = np.zeros(max(end - start + 1, 0), dtype=np.float64)
+    seconds = np.asarray(seconds, dtype=np.int64)
+    dense[seconds - start] = values
+    return dense
+
+
+def _window_starts(n: int, window: int, align: str) -> np.ndarray:
+    """
+    Unclipped window start of every sample.
+    """
+
+    if window < 1:
+        raise ValueError(f"Window must be at least 1 sample, got {window}")
+
+    t = np.arange(n)
+
+    if align == "trailing":
+        return t - window + 1
+    if align == "causal":
+        return t - window
+    if align == "centered":
+        return t - window // 2
+
+    raise ValueError(f"Unknown window alignment: {align!r} (expected one of {ALIGNMENTS})")
+
+
+def _cumsum(values: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
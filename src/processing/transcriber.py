@@ -1,85 +1,317 @@
+import contextlib
 import json
+import shutil
+from concurrent.futures import as_completed
 from pathlib import Path
 
-import whisper
-
+import infra.config as config
 from infra.config import (
     AUDIO_DIR,
     TRANSCRIPTS_DIR,
-    WHISPER_MODEL_NAME,
-    CHUNKS_DIR
+    CHUNKS_DIR,
+)
+from processing.asr_backends import get_backend
+from processing.audio_store import open_audio_store, read_wav_float32
+from processing.language_detection import (
+    clear_cached_language,
+    configured_language,
+    resolve_vod_language,
+)
+from processing.transcript_cache import cached_transcribe
+from processing.transcription_pool import TranscriptionPool, open_pool
+from processing.transcription_windows import (
+    TranscriptionWindower,
+    clear_window_transcripts,
+    transcribe_window,
+    write_chunk_transcripts,
 )
+from processing.vad import (
+    detect_speech_regions,
+    speech_spans_in_range,
+    gather_speech,
+    remap_segments,
+)
+
+
+# Cascade: fast-tier chunk transcripts, kept once refinement has
+# overwritten the chunk transcripts
+FAST_TRANSCRIPTS_DIR = TRANSCRIPTS_DIR / "fast"
 
 
 def transcribe_audio_chunks(logger, resume: bool):
-    TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+    prepare_transcripts(logger, resume)
 
-    if not resume:
-        clear_existing_transcripts()
-    else:
-        logger.info("Using cached transcripts (resume enabled)")
+    store = open_audio_store()
 
-    audio_files = sorted(AUDIO_DIR.glob("chunk_*.wav"))
+    if store is not None:
+        stems = store.chunk_stems()
+    else:
+        stems = [p.stem for p in sorted(AUDIO_DIR.glob("chunk_*.wav"))]
 
-    if not audio_files:
+    if not stems:
         logger.error("No audio files found for transcription")
         raise RuntimeError("No audio files found for transcription")
 
-    total = len(audio_files)
-    logger.info(f"Loading Whisper model: {WHISPER_MODEL_NAME}")
-    model = whisper.load_model(WHISPER_MODEL_NAME)
+    total = len(stems)
 
-    results = {}
+    speech_regions = None
+    if store is not None and config.VAD_ENABLED:
+        speech_regions = detect_speech_regions(store, logger, resume)
+
+    results = {stem: load_cached_transcript(stem) for stem in stems}
+    missing = [stem for stem in stems if results[stem] is None]
 
-    logger.info(f"Starting transcription for {total} audio files")
+    if not missing:
+        logger.info(f"Whisper: all {total} chunk transcripts cached")
+        return results
 
-    for idx, audio_path in enumerate(audio_files, start=1):
-        transcript_path = TRANSCRIPTS_DIR / f"{audio_path.stem}.json"
+    model_name = first_pass_model_name()
+
+    # Worker processes when the CPU has room for several models,
+    # otherwise one in-process (or server) backend
+    pool = open_pool(logger, model_name)
+    backend = pool or get_backend(logger, model_name=model_name)
+
+    with pool or contextlib.nullcontext():
+        if store is not None:
+            language = resolve_vod_language(
+                backend, store, speech_regions, logger, resume
+            )
+        else:
+            language = configured_language()
 
-        # Cache hit
-        if transcript_path.exists():
-            logger.info(
-                f"Whisper [{idx}/{total}] cache hit: {audio_path.name}"
+        if store is not None and windowed_transcription_enabled():
+            return _transcribe_windowed(
+                backend, store, speech_regions, language, logger
             )
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                results[audio_path.stem] = json.load(f)
-            continue
 
         logger.info(
-            f"Whisper [{idx}/{total}] transcribing {audio_path.name}"
+            f"Starting transcription for {len(missing)} of {total} audio files"
         )
 
-        try:
-            result = model.transcribe(
-                str(audio_path),
-                fp16=False,
-            )
-        except Exception as e:
-            logger.exception(
-                f"Transcription failed for {audio_path.name}"
-            )
-            raise RuntimeError(
-                f"Transcription failed for {audio_path.name}"
-            ) from e
-
-        transcript_data = {
-            "text": result.get("text", "").strip(),
-            "segments": result.get("segments", []),
-            "language": result.get("language"),
-        }
+        if pool is not None:
+            results.update(_transcribe_chunks_pooled(
+                pool, store, missing, speech_regions, language, logger
+            ))
+        else:
+            for idx, stem in enumerate(missing, start=1):
+                logger.info(
+                    f"Whisper [{idx}/{len(missing)}] transcribing {stem}"
+                )
+
+                transcript_data = transcribe_chunk(
+                    backend, store, stem, speech_regions, logger, language
+                )
+
+                write_transcript(stem, transcript_data)
+                results[stem] = transcript_data
+
+    logger.info("Transcription completed successfully")
+
+    return results
+
+
+def _transcribe_chunks_pooled(pool, store, stems, speech_regions, language, logger) -> dict:
+    """
+    Hands the chunks to the worker pool and writes each transcript as
+    soon as its worker finishes.
+    """
+
+    chunk_ranges = chunk_time_ranges(store) if store is not None else {}
+
+    futures = {}
+    for stem in stems:
+        chunk_regions = speech_regions
+        if speech_regions is not None:
+            # Workers only need the regions inside their chunk
+            chunk_regions = speech_spans_in_range(speech_regions, *chunk_ranges[stem])
+
+        futures[pool.submit_chunk(stem, chunk_regions, language)] = stem
+
+    results = {}
+    for idx, future in enumerate(as_completed(futures), start=1):
+        stem = futures[future]
+        transcript_data = future.result()
+
+        write_transcript(stem, transcript_data)
+        results[stem] = transcript_data
+
+        logger.info(f"Whisper [{idx}/{len(stems)}] transcribed {stem}")
+
+    return results
+
+
+def first_pass_model_name() -> str:
+    """
+    Model for the full-VOD transcription: the fast cascade tier when
+    TRANSCRIPTION_CASCADE is on, WHISPER_MODEL_NAME otherwise.
+    """
+
+    if config.TRANSCRIPTION_CASCADE:
+        return config.CASCADE_FAST_MODEL_NAME
+    return config.WHISPER_MODEL_NAME
+
+
+def windowed_transcription_enabled() -> bool:
+    return config.TRANSCRIPTION_WINDOWING in ("fixed", "speech")
+
 
-        with open(transcript_path, "w", encoding="utf-8") as f:
-            json.dump(transcript_data, f, indent=2)
+def window_spans(store, speech_regions):
+    """
+    Audio spans fed to the windower: speech regions in "speech" mode,
+    the whole store otherwise.
+    """
 
-        results[audio_path.stem] = transcript_data
+    if config.TRANSCRIPTION_WINDOWING == "speech" and speech_regions is not None:
+        return speech_regions
+
+    return [(0.0, store.duration_seconds)]
+
+
+def chunk_time_ranges(store) -> dict:
+    return {
+        stem: (
+            int(entry["offset"]) / store.sample_rate,
+            (int(entry["offset"]) + int(entry["length"])) / store.sample_rate,
+        )
+        for stem, entry in store.chunks.items()
+    }
+
+
+def _transcribe_windowed(backend, store, speech_regions, language, logger):
+    """
+    Transcribes in TRANSCRIPTION_WINDOW_SECONDS windows instead of
+    analysis chunks, then maps segments back onto the chunks.
+    """
+
+    windower = TranscriptionWindower(config.TRANSCRIPTION_WINDOW_SECONDS)
+    windows = windower.feed(window_spans(store, speech_regions))
+    windows += windower.finish()
+
+    logger.info(
+        f"Starting windowed transcription: {len(windows)} windows "
+        f"({config.TRANSCRIPTION_WINDOWING}, {config.TRANSCRIPTION_WINDOW_SECONDS}s)"
+    )
+
+    windows_data = []
+
+    if isinstance(backend, TranscriptionPool):
+        futures = [backend.submit_window(window, language) for window in windows]
+        for idx, future in enumerate(as_completed(futures), start=1):
+            windows_data.append(future.result())
+            logger.info(f"Whisper [{idx}/{len(windows)}] windows transcribed")
+    else:
+        for idx, window in enumerate(windows, start=1):
+            logger.info(f"Whisper [{idx}/{len(windows)}] window at {window[0][0]:.1f}s")
+            try:
+                windows_data.append(
+                    transcribe_window(backend, store, window, logger, language)
+                )
+            except Exception as e:
+                logger.exception(f"Transcription failed for window at {window[0][0]:.1f}s")
+                raise RuntimeError("Windowed transcription failed") from e
+
+    results = write_chunk_transcripts(chunk_time_ranges(store), windows_data)
 
     logger.info("Transcription completed successfully")
 
     return results
 
 
+def prepare_transcripts(logger, resume: bool):
+    TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    if not resume:
+        clear_existing_transcripts()
+    else:
+        logger.info("Using cached transcripts (resume enabled)")
+
+
+def transcribe_chunk(backend, store, stem, speech_regions, logger, language=None) -> dict:
+    """
+    Transcribes one chunk: only its speech spans when speech_regions is
+    given, the whole chunk otherwise (store slice or WAV file).
+    language=None lets Whisper detect it for this chunk.
+    """
+
+    try:
+        if speech_regions is not None:
+            return _transcribe_speech_only(
+                backend, store, stem, speech_regions, logger, language
+            )
+
+        # Whisper always gets 16 kHz mono float32 in memory — never a path,
+        # which would make it decode and resample again with ffmpeg
+        if store is not None:
+            audio = store.chunk_float(stem)
+        else:
+            audio = read_wav_float32(AUDIO_DIR / f"{stem}.wav")
+
+        return cached_transcribe(backend, audio, language)
+    except Exception as e:
+        logger.exception(
+            f"Transcription failed for {stem}"
+        )
+        raise RuntimeError(
+            f"Transcription failed for {stem}"
+        ) from e
+
+
+def load_cached_transcript(stem: str) -> dict | None:
+    transcript_path = TRANSCRIPTS_DIR / f"{stem}.json"
+
+    if not transcript_path.exists():
+        return None
+
+    with open(transcript_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_transcript(stem: str, transcript_data: dict):
+    transcript_path = TRANSCRIPTS_DIR / f"{stem}.json"
+
+    with open(transcript_path, "w", encoding="utf-8") as f:
+        json.dump(transcript_data, f, indent=2)
+
+
+def _transcribe_speech_only(backend, store, stem, speech_regions, logger, language=None):
+    """
+    Transcribes only the speech spans of a chunk, concatenated.
+    Segment times are mapped back to chunk-relative time.
+    """
+
+    entry = store.chunks[stem]
+    chunk_start = int(entry["offset"]) / store.sample_rate
+    chunk_end = chunk_start + int(entry["length"]) / store.sample_rate
+
+    spans = speech_spans_in_range(speech_regions, chunk_start, chunk_end)
+
+    if not spans:
+        logger.info(f"No speech in {stem} — skipping Whisper")
+        return {
+            "text": "",
+            "segments": [],
+            "language": None,
+            "speech_seconds": 0.0,
+        }
+
+    audio, concat_offsets, span_starts = gather_speech(store, spans)
+
+    transcript_data = dict(cached_transcribe(backend, audio, language))
+    transcript_data["segments"] = remap_segments(
+        transcript_data["segments"], concat_offsets, span_starts, chunk_start
+    )
+    transcript_data["speech_seconds"] = round(len(audio) / store.sample_rate, 3)
+
+    return transcript_data
 
 
 def clear_existing_transcripts():
     for file in TRANSCRIPTS_DIR.glob("chunk_*.json"):
-        file.unlink()
\ No newline at end of file
+        file.unlink()
+
+    clear_window_transcripts()
+    clear_cached_language()
+
+    if FAST_TRANSCRIPTS_DIR.exists():
+        shutil.rmtree(FAST_TRANSCRIPTS_DIR)
\ No newline at end of file
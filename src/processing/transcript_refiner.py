@@ -0,0 +1,162 @@
+import json
+import shutil
+
+import infra.config as config
+from processing.asr_backends import get_backend
+from processing.audio_store import open_audio_store
+from processing.language_detection import known_language
+from processing.transcriber import FAST_TRANSCRIPTS_DIR, chunk_time_ranges
+from processing.transcription_windows import (
+    TranscriptionWindower,
+    transcribe_window,
+    write_chunk_transcripts,
+)
+from processing.vad import (
+    detect_speech_regions,
+    map_segment_times,
+    speech_spans_in_range,
+)
+
+
+def refine_highlight_transcripts(logger) -> bool:
+    """
+    Second cascade tier: re-transcribes the flagged highlight chunks
+    (plus PRE/POST buffers) with WHISPER_MODEL_NAME and splices the
+    result into the chunk transcripts, replacing the fast-model segments
+    there. The fast-tier chunk transcripts are kept in
+    transcripts/fast and refined windows in the transcript cache (keyed
+    by model), so both tiers survive a resume.
+
+    Returns True when transcripts changed and scores need recomputing.
+    """
+
+    if not config.TRANSCRIPTION_CASCADE:
+        return False
+
+    store = open_audio_store()
+    if store is None:
+        logger.warning("Cascade refinement needs the audio store — skipping")
+        return False
+
+    spans = candidate_spans(store.duration_seconds)
+    if not spans:
+        logger.info("Cascade: no highlight candidates to refine")
+        return False
+
+    speech_regions = None
+    if config.VAD_ENABLED and config.TRANSCRIPTION_WINDOWING != "fixed":
+        speech_regions = detect_speech_regions(store, logger, resume=True)
+
+    windows = []
+    for start, end in spans:
+        windower = TranscriptionWindower(config.TRANSCRIPTION_WINDOW_SECONDS)
+        if speech_regions is not None:
+            span_audio = speech_spans_in_range(speech_regions, start, end)
+        else:
+            span_audio = [(start, end)]
+        windows += windower.feed(span_audio) + windower.finish()
+
+    refined_seconds = sum(end - start for start, end in spans)
+    logger.info(
+        f"Cascade: refining {len(spans)} candidate spans ({refined_seconds:.0f}s, "
+        f"{len(windows)} windows) with {config.WHISPER_MODEL_NAME}"
+    )
+
+    backend = get_backend(logger, model_name=config.WHISPER_MODEL_NAME)
+    language = known_language(logger, resume=True)
+
+    refined = [
+        transcribe_window(backend, store, window, logger, language)
+        for window in windows
+    ]
+
+    chunk_ranges = chunk_time_ranges(store)
+    kept = _fast_segments_outside(chunk_ranges, spans)
+
+    write_chunk_transcripts(chunk_ranges, kept + refined)
+
+    logger.info("Cascade: highlight transcripts refined")
+    return True
+
+
+def candidate_spans(duration: float) -> list[tuple[float, float]]:
+    """
+    Flagged highlight chunks widened by the highlight buffers, merged,
+    in VOD seconds.
+    """
+
+    chunks_path = config.CHUNKS_DIR / "chunks.json"
+    if not chunks_path.exists():
+        raise RuntimeError("chunks.json not found")
+
+    with open(chunks_path, "r", encoding="utf-8") as f:
+        chunks = json.load(f)
+
+    spans = sorted(
+        (
+            max(0.0, float(entry["start_time"]) - config.PRE_BUFFER_SECONDS),
+            min(duration, float(entry["end_time"]) + config.POST_BUFFER_SECONDS),
+        )
+        for entry in chunks
+        if entry.get("is_highlight")
+    )
+
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _fast_segments_outside(chunk_ranges: dict, spans) -> list[dict]:
+    """
+    Fast-tier segments (in VOD time) whose midpoint lies outside the
+    refined spans, one pseudo-window per chunk.
+    """
+
+    kept = []
+    for stem, (chunk_start, _) in chunk_ranges.items():
+        transcript = _load_fast_transcript(stem)
+        if transcript is None:
+            continue
+
+        segments = []
+        for segment in transcript.get("segments", []):
+            start = float(segment["start"]) + chunk_start
+            end = float(segment["end"]) + chunk_start
+            midpoint = (start + end) / 2
+
+            if any(s <= midpoint < e for s, e in spans):
+                continue
+
+            segment = {k: v for k, v in segment.items() if k != "language"}
+            segments.append(
+                map_segment_times(segment, lambda t, side: t + chunk_start)
+            )
+
+        kept.append({"segments": segments, "language": transcript.get("language")})
+
+    return kept
+
+
+def _load_fast_transcript(stem: str) -> dict | None:
+    """
+    The fast-tier transcript of a chunk. The first refinement moves it
+    out of the way before the chunk transcript is overwritten.
+    """
+
+    fast_path = FAST_TRANSCRIPTS_DIR / f"{stem}.json"
+
+    if not fast_path.exists():
+        chunk_path = config.TRANSCRIPTS_DIR / f"{stem}.json"
+        if not chunk_path.exists():
+            return None
+
+        FAST_TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(chunk_path, fast_path)
+
+    with open(fast_path, "r", encoding="utf-8") as f:
+        return json.load(f)
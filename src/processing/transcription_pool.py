@@ -0,0 +1,193 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import infra.config as config
+from processing.asr_backends import build_local_backend
+
+
+# Threads per worker when not configured. PyTorch CPU inference stops
+# scaling well beyond a handful of threads per model, so many small
+# workers beat one wide one.
+DEFAULT_THREADS_PER_WORKER = 4
+
+
+def physical_cpu_count() -> int:
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+
+    return count or os.cpu_count() or 1
+
+
+def pool_layout() -> tuple[int, int]:
+    """
+    (workers, threads per worker) from TRANSCRIPTION_WORKERS /
+    TRANSCRIPTION_THREADS_PER_WORKER, where 0 means derive from the
+    physical core count. Unset threads per worker fall back to
+    TRANSCRIPTION_CPU_THREADS.
+    """
+
+    cores = physical_cpu_count()
+
+    threads = config.TRANSCRIPTION_THREADS_PER_WORKER
+    if threads <= 0:
+        threads = config.TRANSCRIPTION_CPU_THREADS
+    if threads <= 0:
+        threads = min(DEFAULT_THREADS_PER_WORKER, cores)
+
+    workers = config.TRANSCRIPTION_WORKERS
+    if workers <= 0:
+        workers = max(1, cores // threads)
+
+    return workers, threads
+
+
+def open_pool(logger, model_name: str | None = None):
+    """
+    Returns a TranscriptionPool when the layout has more than one
+    worker, otherwise None (transcribe in-process or via the server).
+    """
+
+    workers, threads = pool_layout()
+    if workers <= 1:
+        return None
+
+    if config.TRANSCRIPTION_SERVER_ENABLED:
+        logger.info("Transcription pool enabled; the transcription server is not used")
+
+    return TranscriptionPool(
+        logger,
+        config.TRANSCRIPTION_BACKEND,
+        model_name or config.WHISPER_MODEL_NAME,
+        workers,
+        threads,
+    )
+
+
+class TranscriptionPool:
+    """
+    Worker processes that each load their own model with a fixed thread
+    count and read audio straight from the memory-mapped store.
+
+    Jobs are submitted per chunk or per window and return futures; the
+    caller writes transcripts and reports progress as they complete.
+    """
+
+    def __init__(self, logger, backend_name: str, model_name: str, workers: int, threads: int):
+        self.logger = logger
+        self.backend_name = backend_name
+        self.model_name = model_name
+        self.workers = workers
+        self.threads = threads
+
+        logger.info(
+            f"Transcription pool: {workers} workers × {threads} threads "
+            f"({backend_name}, {model_name})"
+        )
+
+        # Spawn, not fork: the streaming pipeline has threads running
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(backend_name, model_name, threads, _worker_settings()),
+        )
+
+    def submit_chunk(self, stem: str, speech_regions, language: str | None):
+        return self.executor.submit(_transcribe_chunk_job, stem, speech_regions, language)
+
+    def submit_window(self, window, language: str | None):
+        return self.executor.submit(_transcribe_window_job, window, language)
+
+    def detect_language(self, audio) -> tuple[str | None, float]:
+        return self.executor.submit(_detect_language_job, audio).result()
+
+    def close(self, cancel: bool = False):
+        self.executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(cancel=exc_type is not None)
+
+
+# ─────────────────────────────────────────────
+# Worker side
+# ─────────────────────────────────────────────
+
+_worker_backend = None
+_worker_store = None
+_worker_logger = logging.getLogger("vod-engine.transcription-worker")
+
+
+def _worker_settings() -> dict:
+    """
+    The parent's whole runtime config: a spawned worker re-imports
+    infra.config and would otherwise miss presets, CLI overrides and UI
+    flags.
+    """
+
+    return {
+        name: value
+        for name, value in vars(config).items()
+        if name.isupper()
+    }
+
+
+def _init_worker(backend_name: str, model_name: str, threads: int, settings: dict):
+    global _worker_backend
+
+    for key, value in settings.items():
+        setattr(config, key, value)
+
+    # Both backends read this when the model loads
+    config.TRANSCRIPTION_CPU_THREADS = threads
+
+    _worker_backend = build_local_backend(_worker_logger, backend_name, model_name)
+    _worker_backend.load()
+
+
+def _store_covering(end_seconds: float):
+    """
+    The worker's store handle, reopened when the streaming pipeline has
+    appended past it.
+    """
+
+    global _worker_store
+
+    from processing.audio_store import open_partial_audio_store
+
+    if _worker_store is None or _worker_store.duration_seconds < end_seconds:
+        _worker_store = open_partial_audio_store()
+
+    return _worker_store
+
+
+def _transcribe_chunk_job(stem: str, speech_regions, language):
+    from processing.audio_store import open_partial_audio_store
+    from processing.transcriber import transcribe_chunk
+
+    global _worker_store
+
+    if _worker_store is None or stem not in _worker_store.chunks:
+        _worker_store = open_partial_audio_store()
+
+    return transcribe_chunk(
+        _worker_backend, _worker_store, stem, speech_regions, _worker_logger, language
+    )
+
+
+def _transcribe_window_job(window, language):
+    from processing.transcription_windows import transcribe_window
+
+    store = _store_covering(window[-1][1])
+    return transcribe_window(_worker_backend, store, window, _worker_logger, language)
+
+
+def _detect_language_job(audio):
+    return _worker_backend.detect_language(audio)
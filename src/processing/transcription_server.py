@@ -0,0 +1,340 @@
+import queue
+import secrets
+import socket
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+import infra.config as config
+from processing.asr_backends import (
+    BACKENDS,
+    TranscriptionBackend,
+    build_local_backend,
+)
+
+
+SERVER_HOST = "127.0.0.1"
+
+
+# ─────────────────────────────────────────────
+# Shared helpers
+# ─────────────────────────────────────────────
+
+def server_address() -> tuple[str, int]:
+    return SERVER_HOST, config.TRANSCRIPTION_SERVER_PORT
+
+
+def server_authkey() -> bytes:
+    """
+    Per-installation secret shared by the server and its clients.
+    """
+
+    key_path = config.TRANSCRIPTION_SERVER_KEY_PATH
+
+    if not key_path.exists():
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        key_path.write_bytes(secrets.token_bytes(32))
+
+    return key_path.read_bytes()
+
+
+def connect(timeout: float | None = None):
+    """
+    Returns a connection to the running server, or None.
+    """
+
+    try:
+        conn = Client(server_address(), authkey=server_authkey())
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+    if timeout is not None and not _ping(conn, timeout):
+        conn.close()
+        return None
+
+    return conn
+
+
+def _ping(conn, timeout: float) -> bool:
+    try:
+        conn.send({"op": "ping"})
+        if not conn.poll(timeout):
+            return False
+        return conn.recv().get("ok", False)
+    except (OSError, EOFError):
+        return False
+
+
+# ─────────────────────────────────────────────
+# Server
+# ─────────────────────────────────────────────
+
+class _PendingRequest:
+    def __init__(self, request: dict):
+        self.request = request
+        self.reply = None
+        self.done = threading.Event()
+
+
+class TranscriptionServer:
+    """
+    Long-lived worker that keeps Whisper models loaded.
+
+    Each client connection is served by its own thread; requests from all
+    connections go through one queue and a single worker thread runs the
+    model, one request at a time in arrival order. The configured model
+    is loaded when the server starts, before the first request.
+
+    Requests carry the client's decode options; a request whose options
+    differ from the server's (another preset or config) is refused
+    rather than answered with differently decoded output.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.requests = queue.Queue()
+        self.backends: dict[tuple[str, str], TranscriptionBackend] = {}
+        self.listener = None
+        self.address = None
+        self.stopping = threading.Event()
+
+    def serve_forever(self):
+        self.listener = Listener(server_address(), authkey=server_authkey())
+        self.address = self.listener.address
+        self.logger.info(f"Transcription server listening on {self.address}")
+
+        threading.Thread(
+            target=self._worker_loop, name="asr-worker", daemon=True
+        ).start()
+
+        while not self.stopping.is_set():
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self.stopping.is_set():
+                    break
+                self.logger.exception("Rejected transcription client")
+                continue
+
+            if self.stopping.is_set():
+                conn.close()
+                break
+
+            threading.Thread(
+                target=self._serve_connection, args=(conn,), daemon=True
+            ).start()
+
+        self.listener.close()
+        self.logger.info("Transcription server stopped")
+
+    def _serve_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                except Exception as e:
+                    # Undecodable message: the stream itself is still usable
+                    self.logger.exception("Malformed transcription request")
+                    request = None
+                    reply = {"ok": False, "error": repr(e)}
+                else:
+                    reply = None
+
+                op = request.get("op") if isinstance(request, dict) else None
+
+                if op == "ping":
+                    reply = {"ok": True}
+                elif op == "decode_options":
+                    reply = self._decode_options_reply(request)
+                elif op == "shutdown":
+                    conn.send({"ok": True})
+                    self._shutdown()
+                    return
+                elif reply is None:
+                    pending = _PendingRequest(request)
+                    self.requests.put(pending)
+                    pending.done.wait()
+                    reply = pending.reply
+
+                try:
+                    conn.send(reply)
+                except (OSError, EOFError):
+                    return
+
+    def _shutdown(self):
+        self.stopping.set()
+
+        # Closing the listener does not interrupt a blocking accept();
+        # a throwaway connection wakes the accept loop instead
+        try:
+            socket.create_connection(self.address, timeout=1.0).close()
+        except OSError:
+            pass
+
+    def _worker_loop(self):
+        try:
+            self._backend(config.TRANSCRIPTION_BACKEND, config.WHISPER_MODEL_NAME)
+        except Exception:
+            self.logger.exception("Failed to preload the transcription model")
+
+        while True:
+            pending = self.requests.get()
+
+            try:
+                reply = {"ok": True, "result": self._run(pending.request)}
+            except Exception as e:
+                self.logger.exception("Transcription request failed")
+                reply = {"ok": False, "error": repr(e)}
+
+            pending.reply = reply
+            pending.done.set()
+
+    def _run(self, request):
+        if not isinstance(request, dict):
+            raise ValueError(f"Expected a request dict, got {type(request).__name__}")
+
+        op = request.get("op")
+        if op not in ("transcribe", "detect_language"):
+            raise ValueError(f"Unknown transcription server op: {op!r}")
+
+        backend_name = request["backend"]
+        options = _server_decode_options(backend_name)
+        if request.get("decode_options") != options:
+            raise ValueError(
+                f"Decode options differ from the server's {options}: "
+                f"{request.get('decode_options')}"
+            )
+
+        backend = self._backend(backend_name, request["model"])
+
+        if op == "detect_language":
+            return backend.detect_language(request["audio"])
+
+        return backend.transcribe(request["audio"], request.get("language"))
+
+    def _decode_options_reply(self, request: dict) -> dict:
+        try:
+            return {"ok": True, "result": _server_decode_options(request["backend"])}
+        except Exception as e:
+            return {"ok": False, "error": repr(e)}
+
+    def _backend(self, backend_name: str, model_name: str) -> TranscriptionBackend:
+        key = (backend_name, model_name)
+
+        if key not in self.backends:
+            backend = build_local_backend(self.logger, backend_name, model_name)
+            backend.load()
+            self.backends[key] = backend
+
+        return self.backends[key]
+
+
+def _server_decode_options(backend_name: str) -> dict:
+    if backend_name not in BACKENDS:
+        raise ValueError(f"Unknown transcription backend '{backend_name}'")
+
+    return BACKENDS[backend_name].decode_options()
+
+
+def run_server():
+    """
+    Process entry point (also used by the UI to spawn the server).
+    """
+
+    from infra.logger import setup_logger
+
+    TranscriptionServer(setup_logger()).serve_forever()
+
+
+# ─────────────────────────────────────────────
+# Client
+# ─────────────────────────────────────────────
+
+class RemoteBackend(TranscriptionBackend):
+    """
+    Proxy for a backend hosted by the transcription server.
+    """
+
+    name = "server"
+
+    def __init__(self, backend_name: str, model_name: str, logger, conn):
+        super().__init__(model_name, logger)
+        self.backend_name = backend_name
+        self.conn = conn
+        self.lock = threading.Lock()
+
+    @property
+    def cache_tag(self) -> str:
+        return f"{self.backend_name}:{self.model_name}"
+
+    def decode_options(self) -> dict:
+        return BACKENDS[self.backend_name].decode_options()
+
+    def load(self):
+        return None
+
+    def _load_model(self):
+        # The model lives in the server process
+        return None
+
+    def transcribe(self, audio, language: str | None = None) -> dict:
+        return self._call({
+            "op": "transcribe",
+            "audio": audio,
+            "language": language,
+        })
+
+    def detect_language(self, audio) -> tuple[str | None, float]:
+        language, probability = self._call({
+            "op": "detect_language",
+            "audio": audio,
+        })
+        return language, probability
+
+    def server_decode_options(self) -> dict:
+        return self._call({"op": "decode_options"})
+
+    def _call(self, request: dict) -> dict:
+        request["backend"] = self.backend_name
+        request["model"] = self.model_name
+        request["decode_options"] = self.decode_options()
+
+        with self.lock:
+            self.conn.send(request)
+            reply = self.conn.recv()
+
+        if not reply.get("ok"):
+            raise RuntimeError(
+                f"Transcription server error: {reply.get('error')}"
+            )
+
+        return reply["result"]
+
+
+def start_server_process(logger):
+    """
+    Spawns the server in a daemon process unless one is already running.
+    Returns the process, or None when an existing server was found.
+    """
+
+    import multiprocessing
+
+    conn = connect(timeout=1.0)
+    if conn is not None:
+        conn.close()
+        logger.info("Transcription server already running")
+        return None
+
+    process = multiprocessing.Process(
+        target=run_server, name="transcription-server", daemon=True
+    )
+    process.start()
+
+    logger.info(f"Started transcription server (pid {process.pid})")
+    return process
+
+
+if __name__ == "__main__":
+    run_server()
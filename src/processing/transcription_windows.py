@@ -0,0 +1,172 @@
+import bisect
+import json
+from collections import Counter
+
+from infra.config import TRANSCRIPTS_DIR
+from processing.transcript_cache import transcribe_with_cache
+from processing.vad import gather_speech, map_segment_times, map_to_source_time
+
+
+SEGMENTS_PATH = TRANSCRIPTS_DIR / "segments.json"
+
+# Spans closer than this are treated as one continuous span (seconds)
+SPAN_JOIN_TOLERANCE = 0.05
+
+
+class TranscriptionWindower:
+    """
+    Packs audio spans (VOD seconds) into transcription windows holding
+    at most window_seconds of audio, Whisper's native context.
+
+    Spans arrive in time order through feed(); finished windows are
+    returned as soon as they are full, so windows can be transcribed
+    while later audio is still being decoded. A span that would not fit
+    starts a new window when the current one is already half full;
+    otherwise it is split at the window edge.
+    """
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = float(window_seconds)
+        self.current: list[tuple[float, float]] = []
+        self.filled = 0.0
+
+    def feed(self, spans) -> list[list[tuple[float, float]]]:
+        finished = []
+
+        for start, end in spans:
+            start, end = float(start), float(end)
+
+            if end - start > self.window_seconds - self.filled and \
+                    end - start <= self.window_seconds and \
+                    self.filled >= self.window_seconds / 2:
+                finished.append(self._emit())
+
+            while end - start > 1e-6:
+                take = min(end - start, self.window_seconds - self.filled)
+                self._append(start, start + take)
+                start += take
+
+                if self.filled >= self.window_seconds - 1e-6:
+                    finished.append(self._emit())
+
+        return finished
+
+    def finish(self) -> list[list[tuple[float, float]]]:
+        return [self._emit()] if self.current else []
+
+    def _append(self, start: float, end: float):
+        if self.current and start - self.current[-1][1] <= SPAN_JOIN_TOLERANCE:
+            self.current[-1] = (self.current[-1][0], end)
+        else:
+            self.current.append((start, end))
+        self.filled += end - start
+
+    def _emit(self) -> list[tuple[float, float]]:
+        window = [(round(s, 3), round(e, 3)) for s, e in self.current]
+        self.current = []
+        self.filled = 0.0
+        return window
+
+
+def transcribe_window(backend, store, window, logger, language: str | None = None) -> dict:
+    """
+    Transcribes one window (through the transcript cache). Segment times
+    are absolute VOD seconds.
+    """
+
+    audio, concat_offsets, span_starts = gather_speech(store, window)
+
+    result, from_cache = transcribe_with_cache(backend, audio, language)
+
+    def to_vod_time(t: float, side: str) -> float:
+        return map_to_source_time(t, concat_offsets, span_starts, side)
+
+    segments = [
+        map_segment_times(segment, to_vod_time)
+        for segment in result.get("segments", [])
+    ]
+
+    window_data = {
+        "spans": window,
+        "language": result.get("language"),
+        "segments": segments,
+    }
+
+    if not from_cache:
+        logger.info(
+            f"Transcribed window {window[0][0]:.1f}s–{window[-1][1]:.1f}s "
+            f"({sum(e - s for s, e in window):.1f}s audio, {len(segments)} segments)"
+        )
+
+    return window_data
+
+
+def write_chunk_transcripts(chunk_ranges: dict, windows_data: list[dict]) -> dict:
+    """
+    Maps window segments onto analysis chunks by segment midpoint and
+    writes the usual per-chunk transcript JSON (chunk-relative times).
+    Also writes all segments in VOD time to segments.json.
+
+    chunk_ranges: {stem: (start_seconds, end_seconds)}
+    """
+
+    ordered = sorted(chunk_ranges.items(), key=lambda item: item[1][0])
+    chunk_starts = [start for _, (start, _) in ordered]
+    per_chunk = {stem: {"segments": [], "languages": Counter()} for stem, _ in ordered}
+
+    all_segments = []
+    for window_data in windows_data:
+        for segment in window_data["segments"]:
+            all_segments.append({**segment, "language": window_data["language"]})
+
+    all_segments.sort(key=lambda s: s["start"])
+
+    for segment in all_segments:
+        midpoint = (segment["start"] + segment["end"]) / 2
+        stem = _chunk_for_time(ordered, chunk_starts, midpoint)
+        if stem is None:
+            continue
+
+        # Segments straddling a chunk edge are clipped to their chunk
+        chunk_start, chunk_end = chunk_ranges[stem]
+        per_chunk[stem]["segments"].append(map_segment_times(
+            segment,
+            lambda t, side: min(max(t, chunk_start), chunk_end) - chunk_start,
+        ))
+        if segment["language"]:
+            per_chunk[stem]["languages"][segment["language"]] += 1
+
+    TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    for stem, data in per_chunk.items():
+        languages = data["languages"].most_common(1)
+        transcript_data = {
+            "text": " ".join(s["text"].strip() for s in data["segments"]).strip(),
+            "segments": data["segments"],
+            "language": languages[0][0] if languages else None,
+        }
+
+        with open(TRANSCRIPTS_DIR / f"{stem}.json", "w", encoding="utf-8") as f:
+            json.dump(transcript_data, f, indent=2)
+
+        results[stem] = transcript_data
+
+    with open(SEGMENTS_PATH, "w", encoding="utf-8") as f:
+        json.dump({"segments": all_segments}, f)
+
+    return results
+
+
+def _chunk_for_time(ordered, chunk_starts, t: float):
+    pos = bisect.bisect_right(chunk_starts, t) - 1
+    if pos < 0:
+        return None
+
+    # Past the last chunk end only by rounding — keep it in the last chunk
+    return ordered[pos][0]
+
+
+def clear_window_transcripts():
+    if SEGMENTS_PATH.exists():
+        SEGMENTS_PATH.unlink()
@@ -0,0 +1,295 @@
+import json
+import math
+
+import numpy as np
+
+import infra.config as config
+from infra.config import AUDIO_DIR
+from processing.audio_rms import compute_audio_envelope, samples_envelope
+
+
+SPEECH_REGIONS_PATH = AUDIO_DIR / "speech_regions.json"
+
+# Percentile of the envelope taken as the noise floor
+NOISE_FLOOR_PERCENTILE = 10
+
+
+def detect_speech_regions(store, logger, resume: bool) -> list[tuple[float, float]]:
+    """
+    Energy-based voice activity over the whole VOD, computed once from
+    the RMS envelope. A frame is active when its RMS is above
+    VAD_THRESHOLD_RATIO × the noise floor, clamped to
+    [VAD_MIN_RMS, VAD_MAX_RMS]. Returns sorted, non-overlapping (start, end) regions in VOD seconds.
+
+    speech_regions.json records the store's source key and the VAD
+    parameters; a cache that does not match both is recomputed.
+    """
+
+    params = vad_params()
+
+    if resume and SPEECH_REGIONS_PATH.exists():
+        with open(SPEECH_REGIONS_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+
+        if cached.get("source") == store.source_key and cached.get("params") == params:
+            logger.info("Using cached speech regions")
+            return [tuple(region) for region in cached["regions"]]
+
+        logger.info("Cached speech regions are stale, recomputing")
+
+    envelope, hop_seconds = compute_audio_envelope(
+        store, logger, resume, hop_seconds=params["hop_seconds"]
+    )
+
+    regions = regions_from_envelope(envelope, hop_seconds, store.duration_seconds)
+
+    speech_seconds = sum(end - start for start, end in regions)
+    logger.info(
+        f"VAD: {len(regions)} speech regions, {speech_seconds:.0f}s of "
+        f"{store.duration_seconds:.0f}s ({speech_seconds / max(store.duration_seconds, 1e-9):.0%})"
+    )
+
+    SPEECH_REGIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(SPEECH_REGIONS_PATH, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "source": store.source_key,
+                "params": params,
+                "hop_seconds": hop_seconds,
+                "regions": regions,
+            },
+            f,
+        )
+
+    return regions
+
+
+def vad_params() -> dict:
+    """
+    Every setting the speech regions depend on.
+    """
+
+    return {
+        "hop_seconds": config.AUDIO_ENVELOPE_HOP_SECONDS,
+        "noise_floor_percentile": NOISE_FLOOR_PERCENTILE,
+        "threshold_ratio": config.VAD_THRESHOLD_RATIO,
+        "min_rms": config.VAD_MIN_RMS,
+        "max_rms": config.VAD_MAX_RMS,
+        "min_speech_seconds": config.VAD_MIN_SPEECH_SECONDS,
+        "min_silence_seconds": config.VAD_MIN_SILENCE_SECONDS,
+        "pad_seconds": config.VAD_PAD_SECONDS,
+    }
+
+
+class NoiseFloorEstimator:
+    """
+    Noise floor over an envelope that arrives in pieces (the streaming
+    pipeline sees the VOD chunk by chunk). Uses the same percentile of
+    audible frames as the whole-VOD pass, over every frame added so far,
+    so the streaming threshold converges on the sequential one instead
+    of being re-estimated from each chunk alone.
+    """
+
+    def __init__(self):
+        self._audible = np.empty(0, dtype=np.float32)
+        self._count = 0
+
+    def add(self, envelope: np.ndarray):
+        audible = envelope[envelope > 0]
+        needed = self._count + audible.size
+
+        if needed > self._audible.size:
+            grown = np.empty(max(needed, 2 * self._audible.size), dtype=np.float32)
+            grown[:self._count] = self._audible[:self._count]
+            self._audible = grown
+
+        self._audible[self._count:needed] = audible
+        self._count = needed
+
+    def threshold(self) -> float:
+        return _threshold_from_audible(self._audible[:self._count])
+
+
+def detect_range_speech_regions(
+    samples: np.ndarray,
+    sample_rate: int,
+    range_start: float,
+    noise_floor: NoiseFloorEstimator | None = None,
+) -> list[tuple[float, float]]:
+    """
+    Speech regions of a single sample range (VOD seconds), for when the
+    whole-VOD envelope does not exist yet. With a noise_floor estimator
+    the range's frames are added to it and the threshold comes from
+    every range seen so far; without one the noise floor is local to
+    the range.
+    """
+
+    hop_seconds = config.AUDIO_ENVELOPE_HOP_SECONDS
+    envelope = samples_envelope(samples, round(hop_seconds * sample_rate))
+
+    threshold = None
+    if noise_floor is not None:
+        noise_floor.add(envelope)
+        threshold = noise_floor.threshold()
+
+    regions = regions_from_envelope(
+        envelope, hop_seconds, len(samples) / sample_rate, threshold
+    )
+
+    return [
+        (round(start + range_start, 3), round(end + range_start, 3))
+        for start, end in regions
+    ]
+
+
+def speech_threshold(envelope: np.ndarray) -> float:
+    """
+    Activity threshold of a whole envelope: VAD_THRESHOLD_RATIO × the
+    noise floor, clamped to [VAD_MIN_RMS, VAD_MAX_RMS].
+    """
+
+    return _threshold_from_audible(envelope[envelope > 0])
+
+
+def _threshold_from_audible(audible: np.ndarray) -> float:
+    noise_floor = (
+        float(np.percentile(audible, NOISE_FLOOR_PERCENTILE)) if audible.size else 0.0
+    )
+    # Without any quiet stretch the floor is the speech level itself
+    return min(
+        max(config.VAD_MIN_RMS, noise_floor * config.VAD_THRESHOLD_RATIO),
+        config.VAD_MAX_RMS,
+    )
+
+
+def regions_from_envelope(
+    envelope: np.ndarray,
+    hop_seconds: float,
+    duration: float,
+    threshold: float | None = None,
+) -> list[tuple[float, float]]:
+    if envelope.size == 0:
+        return []
+
+    if threshold is None:
+        threshold = speech_threshold(envelope)
+
+    active = envelope >= threshold
+
+    # Run boundaries of the active mask
+    edges = np.diff(active.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1) * hop_seconds
+    ends = np.flatnonzero(edges == -1) * hop_seconds
+
+    regions = []
+    for start, end in zip(starts, ends):
+        start = max(0.0, float(start) - config.VAD_PAD_SECONDS)
+        end = min(duration, float(end) + config.VAD_PAD_SECONDS)
+
+        # Short pauses stay inside one region
+        if regions and start - regions[-1][1] < config.VAD_MIN_SILENCE_SECONDS:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], end))
+        else:
+            regions.append((start, end))
+
+    return [
+        (round(start, 3), round(end, 3))
+        for start, end in regions
+        if end - start >= config.VAD_MIN_SPEECH_SECONDS
+    ]
+
+
+def speech_spans_in_range(
+    regions: list[tuple[float, float]],
+    start: float,
+    end: float,
+) -> list[tuple[float, float]]:
+    """
+    Speech regions clipped to [start, end), in VOD seconds.
+    """
+
+    spans = []
+    for region_start, region_end in regions:
+        if region_end <= start:
+            continue
+        if region_start >= end:
+            break
+        spans.append((max(region_start, start), min(region_end, end)))
+
+    return spans
+
+
+def gather_speech(store, spans: list[tuple[float, float]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Concatenates the float32 samples of the spans. Returns
+    (audio, concat_offsets, span_starts): concat_offsets[i] is where span i
+    begins in the concatenated audio, span_starts[i] its VOD time (seconds).
+    """
+
+    pieces = [store.time_range_float(start, end) for start, end in spans]
+
+    lengths = np.array([len(piece) for piece in pieces], dtype=np.float64)
+    concat_offsets = np.concatenate(([0.0], np.cumsum(lengths)[:-1])) / store.sample_rate
+    span_starts = np.array([start for start, _ in spans], dtype=np.float64)
+
+    if not pieces:
+        return np.zeros(0, dtype=np.float32), concat_offsets, span_starts
+
+    return np.concatenate(pieces), concat_offsets, span_starts
+
+
+def map_to_source_time(
+    t: float,
+    concat_offsets: np.ndarray,
+    span_starts: np.ndarray,
+    side: str = "right",
+) -> float:
+    """
+    Maps a time in concatenated speech audio back to VOD time.
+    side="left" keeps a time that falls exactly on a span joint in the
+    earlier span (use it for segment ends).
+    """
+
+    if len(span_starts) == 0:
+        return t
+
+    span = max(int(np.searchsorted(concat_offsets, t, side=side)) - 1, 0)
+    return float(span_starts[span] + (t - concat_offsets[span]))
+
+
+def remap_segments(
+    segments: list[dict],
+    concat_offsets: np.ndarray,
+    span_starts: np.ndarray,
+    chunk_start: float,
+) -> list[dict]:
+    """
+    Rewrites segment start/end from concatenated-speech time to
+    chunk-relative time (the same frame of reference as ungated chunks).
+    """
+
+    def convert(t: float, side: str) -> float:
+        return map_to_source_time(t, concat_offsets, span_starts, side) - chunk_start
+
+    return [map_segment_times(segment, convert) for segment in segments]
+
+
+def map_segment_times(segment: dict, convert) -> dict:
+    """
+    Copy of a segment with start/end — and those of its word timestamps,
+    if any — passed through convert(t, side); side is "right" for starts
+    and "left" for ends (see map_to_source_time).
+    """
+
+    segment = dict(segment)
+
+    for key, side in (("start", "right"), ("end", "left")):
+        if key in segment and not math.isnan(float(segment[key])):
+            segment[key] = round(convert(float(segment[key]), side), 3)
+
+    if segment.get("words"):
+        segment["words"] = [
+            map_segment_times(word, convert) for word in segment["words"]
+        ]
+
+    return segment
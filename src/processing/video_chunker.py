@@ -2,20 +2,31 @@ import subprocess
 import json
 from pathlib import Path
 
-from infra.config import CHUNK_DURATION_SECONDS, CHUNKS_DIR
+from infra.config import CHUNK_DURATION_SECONDS, CHUNKS_DIR, VIRTUAL_CHUNKING
+from infra.staging import input_fingerprint
+from processing.media_index import load_keyframe_index
 
 
 def chunk_video(input_video_path: str, logger):
+    if VIRTUAL_CHUNKING:
+        return plan_virtual_chunks(input_video_path, logger)
+
     logger.info(f"Starting video chunking: {input_video_path}")
 
     metadata_path = CHUNKS_DIR / "chunks.json"
+    fingerprint = input_fingerprint(input_video_path)
 
     if metadata_path.exists():
         existing_chunks = list(CHUNKS_DIR.glob("chunk_*.mp4"))
         if existing_chunks:
-            logger.info("Chunks already exist — skipping video chunking")
             with open(metadata_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                existing = json.load(f)
+
+            if _chunks_match(existing, fingerprint):
+                logger.info("Chunks already exist — skipping video chunking")
+                return existing
+
+            logger.info("Existing chunks belong to another input — re-chunking")
 
     CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
     clear_existing_chunks()
@@ -48,15 +59,32 @@ def chunk_video(input_video_path: str, logger):
         logger.error("Chunking completed but no chunks were created")
         raise RuntimeError("No chunks created from input video")
 
+    # Stream-copy cuts land on keyframes, not on the nominal grid
+    keyframe_index = load_keyframe_index(input_video_path, logger)
+    boundaries = keyframe_index.segment_boundaries(CHUNK_DURATION_SECONDS)
+
+    if len(boundaries) != len(chunk_files):
+        logger.warning(
+            f"Keyframe index predicts {len(boundaries)} chunks but ffmpeg "
+            f"wrote {len(chunk_files)} — using nominal chunk times"
+        )
+        boundaries = [
+            idx * CHUNK_DURATION_SECONDS for idx in range(len(chunk_files))
+        ]
+
     metadata = []
 
     for idx, chunk_file in enumerate(chunk_files):
-        start_time = idx * CHUNK_DURATION_SECONDS
-        end_time = start_time + CHUNK_DURATION_SECONDS
+        start_time = boundaries[idx]
+        if idx + 1 < len(boundaries):
+            end_time = boundaries[idx + 1]
+        else:
+            end_time = keyframe_index.duration
 
         metadata.append({
             "chunk_id": idx,
             "file": str(chunk_file),
+            "source_fingerprint": fingerprint,
             "start_time": start_time,
             "end_time": end_time,
         })
@@ -74,6 +102,83 @@ def chunk_video(input_video_path: str, logger):
     return metadata
 
 
+def plan_virtual_chunks(input_video_path: str, logger):
+    """
+    Virtual chunking: chunks are logical [start, end) ranges over the
+    source video. Nothing is remuxed; downstream stages read the time
+    range they need straight from the source.
+    """
+
+    logger.info(f"Planning virtual chunks: {input_video_path}")
+
+    metadata_path = CHUNKS_DIR / "chunks.json"
+    source = str(Path(input_video_path).resolve())
+    fingerprint = input_fingerprint(input_video_path)
+
+    if metadata_path.exists():
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            existing = json.load(f)
+
+        if _chunks_match(existing, fingerprint) and all(
+            entry.get("virtual") and entry.get("source") == source
+            for entry in existing
+        ):
+            logger.info("Virtual chunks already planned — skipping")
+            return existing
+
+    CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Physical chunks from an earlier run are dead weight now
+    clear_existing_chunks()
+
+    # Keyframe-aligned boundaries keep chunk ranges identical to what a
+    # stream copy of the same range would contain
+    keyframe_index = load_keyframe_index(input_video_path, logger)
+    duration = keyframe_index.duration
+    boundaries = keyframe_index.segment_boundaries(CHUNK_DURATION_SECONDS)
+    chunk_count = len(boundaries)
+
+    metadata = []
+
+    for idx in range(chunk_count):
+        start_time = boundaries[idx]
+        if idx + 1 < chunk_count:
+            end_time = boundaries[idx + 1]
+        else:
+            end_time = duration
+
+        metadata.append({
+            "chunk_id": idx,
+            "file": f"chunk_{idx:04d}",
+            "source": source,
+            "source_fingerprint": fingerprint,
+            "start_time": start_time,
+            "end_time": end_time,
+            "virtual": True,
+        })
+
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+
+    logger.info(
+        f"Virtual chunking complete: {chunk_count} keyframe-aligned chunks "
+        f"over {duration:.1f}s (~{CHUNK_DURATION_SECONDS}s each)"
+    )
+    logger.info(f"Chunk metadata written to {metadata_path}")
+
+    return metadata
+
+
+def _chunks_match(metadata, fingerprint: str) -> bool:
+    """
+    Cached chunk metadata is only valid for the input it was built from.
+    """
+
+    return bool(metadata) and all(
+        entry.get("source_fingerprint") == fingerprint for entry in metadata
+    )
+
+
 def clear_existing_chunks():
     for file in CHUNKS_DIR.glob("chunk_*.mp4"):
         file.unlink()
@@ -1,7 +1,11 @@
 import json
+
+import numpy as np
+
 import infra.config as config
 
 from infra.config import CHAT_WEIGHT, CHAT_BOOST_MAX
+from processing.chat.chat_aggregates import load_chat_aggregates
 
 
 def apply_chat_boost_to_chunks(logger, chat_weight: float):
@@ -10,12 +14,12 @@ def apply_chat_boost_to_chunks(logger, chat_weight: float):
             logger.info("Chat influence disabled — skipping chat boost")
             return
 
-        mps_path = config.CHAT_METRICS_DIR / "messages_per_second.json"
         chat_scores_path = config.CHAT_METRICS_DIR / "chat_scores_aligned.json"
         chunks_path = config.CHUNKS_DIR / "chunks.json"
 
-        if not mps_path.exists():
-            logger.warning("messages_per_second.json not found — skipping chat boost")
+        aggregates = load_chat_aggregates()
+        if aggregates is None:
+            logger.warning("Chat aggregates not found — skipping chat boost")
             return
 
         if not chat_scores_path.exists():
@@ -27,12 +31,10 @@ def apply_chat_boost_to_chunks(logger, chat_weight: float):
 
         logger.info("Applying chat boost with weight = %.2f", chat_weight)
 
-        with open(mps_path, "r", encoding="utf-8") as f:
-            mps_data = json.load(f)
-
+        messages = aggregates["messages"]
         mps_by_sec = {
-            int(item["second"]): int(item["messages"])
-            for item in mps_data.get("timeline", [])
+            sec: int(messages[sec])
+            for sec in np.flatnonzero(messages).tolist()
         }
 
         with open(chat_scores_path, "r", encoding="utf-8") as f:
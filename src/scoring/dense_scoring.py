@@ -0,0 +1,274 @@
+import json
+import math
+
+import numpy as np
+
+import infra.config as config
+from infra.config import (
+    CHAT_BOOST_MAX,
+    CHAT_TO_VIDEO_OFFSET_SECONDS,
+    MERGE_GAP_SECONDS,
+)
+from highlights.timeline_io import SCHEMA_VERSION, save_timeline
+from processing.audio_features import feature_scores_per_second
+from processing.audio_rms import audio_scores_per_second
+from scoring.text_features import text_scores_per_second
+from processing.chat.chat_aggregates import load_chat_aggregates
+from processing.rolling_stats import window_sums
+
+
+HIGHLIGHTS_DIR = config.DATA_DIR / "highlights"
+TIMELINE_PATH = HIGHLIGHTS_DIR / "highlight_timeline.json"
+DENSE_SCORES_PATH = HIGHLIGHTS_DIR / "dense_scores.npz"
+
+
+# ─────────────────────────────────────────────
+# Per-second signals
+# ─────────────────────────────────────────────
+
+def build_dense_scores(logger, chat_weight: float) -> dict[str, np.ndarray]:
+    """
+    Fuses audio, text and chat into per-second arrays over the VOD.
+    phase1 = AUDIO_WEIGHT * audio + TEXT_WEIGHT * text; chat is the
+    weighted, capped chat score of each second.
+    """
+
+    chunks = _load_chunks()
+    n_seconds = math.ceil(max(float(c["end_time"]) for c in chunks))
+
+    audio = audio_scores_per_second()
+    if audio is None:
+        logger.info("No audio envelope — spreading chunk audio scores per second")
+        audio = spread_chunk_values(chunks, "audio_score", n_seconds)
+    else:
+        audio = _fit(audio, n_seconds)
+
+    text = text_scores_per_second()
+    if text is None:
+        logger.info("No per-second text scores — spreading chunk text scores per second")
+        text = spread_chunk_values(chunks, "text_score", n_seconds)
+    else:
+        text = _fit(text, n_seconds)
+
+    # Read at call time so presets apply
+    phase1 = config.AUDIO_WEIGHT * audio + config.TEXT_WEIGHT * text
+
+    feature_weights = {
+        "onset": config.ONSET_WEIGHT,
+        "flux": config.SPECTRAL_FLUX_WEIGHT,
+        "centroid": config.SPECTRAL_CENTROID_WEIGHT,
+    }
+
+    if any(feature_weights.values()):
+        features = feature_scores_per_second(logger)
+        if features is not None:
+            for name, weight in feature_weights.items():
+                phase1 = phase1 + weight * _fit(features[name], n_seconds)
+
+    chat, messages = _load_chat_per_second(logger, n_seconds)
+    chat = np.minimum(chat * chat_weight, CHAT_BOOST_MAX)
+
+    scores = {
+        "audio": audio,
+        "text": text,
+        "phase1": phase1,
+        "chat": chat,
+        "messages": messages,
+    }
+
+    HIGHLIGHTS_DIR.mkdir(parents=True, exist_ok=True)
+    np.savez(DENSE_SCORES_PATH, **scores)
+
+    return scores
+
+
+def spread_chunk_values(chunks, key: str, n_seconds: int) -> np.ndarray:
+    """
+    Assigns each chunk's value to every second the chunk covers.
+    """
+
+    values = np.zeros(n_seconds, dtype=np.float64)
+
+    for entry in chunks:
+        start = int(float(entry["start_time"]))
+        end = min(math.ceil(float(entry["end_time"])), n_seconds)
+        values[start:end] = float(entry.get(key, 0.0))
+
+    return values
+
+
+def _load_chat_per_second(logger, n_seconds: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (chat_score, messages) per video second; zeros when chat
+    influence is off or the chat metrics are missing.
+    """
+
+    chat = np.zeros(n_seconds, dtype=np.float64)
+    messages = np.zeros(n_seconds, dtype=np.float64)
+
+    if not config.ENABLE_CHAT_INFLUENCE:
+        logger.info("Chat influence disabled — dense scores without chat")
+        return chat, messages
+
+    chat_scores_path = config.CHAT_METRICS_DIR / "chat_scores_aligned.json"
+    aggregates = load_chat_aggregates()
+
+    if not chat_scores_path.exists() or aggregates is None:
+        logger.warning("Chat metrics not found — dense scores without chat")
+        return chat, messages
+
+    with open(chat_scores_path, "r", encoding="utf-8") as f:
+        chat_data = json.load(f)
+
+    for item in chat_data.get("timeline", []):
+        sec = int(item["video_second"])
+        if 0 <= sec < n_seconds:
+            chat[sec] = float(item["score"])
+
+    # Message counts are on the chat clock
+    chat_messages = aggregates["messages"][CHAT_TO_VIDEO_OFFSET_SECONDS:]
+    count = min(len(chat_messages), n_seconds)
+    messages[:count] = chat_messages[:count]
+
+    return chat, messages
+
+
+def _fit(values: np.ndarray, n_seconds: int) -> np.ndarray:
+    fitted = np.zeros(n_seconds, dtype=np.float64)
+    count = min(len(values), n_seconds)
+    fitted[:count] = values[:count]
+    return fitted
+
+
+# ─────────────────────────────────────────────
+# Sliding windows
+# ─────────────────────────────────────────────
+
+def window_starts(n_seconds: int, window_seconds: int, hop_seconds: int) -> np.ndarray:
+    last_start = max(n_seconds - window_seconds, 0)
+    starts = np.arange(0, last_start + 1, hop_seconds)
+
+    # Always cover the tail of the VOD
+    if starts[-1] != last_start:
+        starts = np.append(starts, last_start)
+
+    return starts
+
+
+def score_windows(
+    scores: dict[str, np.ndarray],
+    window_seconds: int | None = None,
+    hop_seconds: int | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns (starts, ends, window_score). Window score is the mean phase1
+    score plus the mean chat boost, the latter only where chat activity
+    is significant: the per-chunk chat boost thresholds, scaled from
+    CHUNK_DURATION_SECONDS to the window length so windows need the same
+    chat density as chunks.
+    """
+
+    window_seconds = window_seconds or config.SCORING_WINDOW_SECONDS
+    hop_seconds = hop_seconds or config.SCORING_HOP_SECONDS
+
+    phase1 = scores["phase1"]
+    n_seconds = len(phase1)
+
+    starts = window_starts(n_seconds, window_seconds, hop_seconds)
+    ends = np.minimum(starts + window_seconds, n_seconds)
+    lengths = np.maximum(ends - starts, 1)
+
+    phase1_mean = window_sums(phase1, starts, window_seconds) / lengths
+    chat_mean = window_sums(scores["chat"], starts, window_seconds) / lengths
+
+    total_messages = window_sums(scores["messages"], starts, window_seconds)
+    active_seconds = window_sums(
+        (scores["messages"] > 0).astype(np.float64), starts, window_seconds
+    )
+
+    chunk_fraction = lengths / config.CHUNK_DURATION_SECONDS
+    significant = (
+        (total_messages >= config.MIN_CHAT_MESSAGES_PER_CHUNK * chunk_fraction)
+        & (active_seconds >= config.MIN_CHAT_ACTIVE_SECONDS_PER_CHUNK * chunk_fraction)
+    )
+
+    window_score = np.minimum(1.0, phase1_mean + np.where(significant, chat_mean, 0.0))
+
+    return starts, ends, window_score
+
+
+# ─────────────────────────────────────────────
+# Highlight selection
+# ─────────────────────────────────────────────
+
+def select_window_highlights(logger, chat_weight: float):
+    """
+    Window-mode replacement for flag + merge: selects windows scoring
+    at least HIGHLIGHT_THRESHOLD and merges those within MERGE_GAP_SECONDS
+    into highlight_timeline.json.
+    """
+
+    scores = build_dense_scores(logger, chat_weight)
+    starts, ends, window_score = score_windows(scores)
+
+    selected = np.flatnonzero(window_score >= config.HIGHLIGHT_THRESHOLD)
+
+    logger.info(
+        f"Window scoring: {len(selected)}/{len(starts)} windows >= "
+        f"{config.HIGHLIGHT_THRESHOLD} (window={config.SCORING_WINDOW_SECONDS}s, "
+        f"hop={config.SCORING_HOP_SECONDS}s)"
+    )
+
+    merged = []
+    for idx in selected:
+        start, end, score = int(starts[idx]), int(ends[idx]), float(window_score[idx])
+
+        if merged and start <= merged[-1]["end_time"] + MERGE_GAP_SECONDS:
+            merged[-1]["end_time"] = max(merged[-1]["end_time"], end)
+            merged[-1]["score"] = max(merged[-1]["score"], score)
+        else:
+            merged.append({"start_time": start, "end_time": end, "score": score})
+
+    chunks = _load_chunks()
+
+    timeline = []
+    for idx, item in enumerate(merged):
+        timeline.append({
+            "id": f"hl_{idx:04d}",
+            "start_time": float(item["start_time"]),
+            "end_time": float(item["end_time"]),
+            "chunk_ids": _overlapping_chunk_ids(
+                chunks, item["start_time"], item["end_time"]
+            ),
+            "score": item["score"],
+            "enabled": True,
+            "trim_start_offset": 0.0,
+            "trim_end_offset": 0.0,
+            "order_index": idx,
+        })
+
+    save_timeline(TIMELINE_PATH, {"schema_version": SCHEMA_VERSION, "timeline": timeline})
+    return timeline
+
+
+def _overlapping_chunk_ids(chunks, start: float, end: float) -> list[int]:
+    return [
+        c["chunk_id"]
+        for c in chunks
+        if float(c["start_time"]) < end and float(c["end_time"]) > start
+    ]
+
+
+def _load_chunks():
+    chunks_path = config.CHUNKS_DIR / "chunks.json"
+
+    if not chunks_path.exists():
+        raise RuntimeError("chunks.json not found")
+
+    with open(chunks_path, "r", encoding="utf-8") as f:
+        chunks = json.load(f)
+
+    if not chunks:
+        raise RuntimeError("No chunks to score")
+
+    return sorted(chunks, key=lambda c: c["start_time"])
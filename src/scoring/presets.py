@@ -15,6 +15,16 @@ def save_preset(name: str):
 
         "highlight_threshold": config.HIGHLIGHT_THRESHOLD,
 
+        "scoring_mode": config.SCORING_MODE,
+        "scoring_window_seconds": config.SCORING_WINDOW_SECONDS,
+        "scoring_hop_seconds": config.SCORING_HOP_SECONDS,
+
+        "transcription_backend": config.TRANSCRIPTION_BACKEND,
+        "whisper_model_name": config.WHISPER_MODEL_NAME,
+        "transcription_language": config.TRANSCRIPTION_LANGUAGE,
+        "transcription_cascade": config.TRANSCRIPTION_CASCADE,
+        "cascade_fast_model_name": config.CASCADE_FAST_MODEL_NAME,
+
         "chat_only_min_score": config.CHAT_ONLY_MIN_SCORE,
         "min_chat_messages_per_chunk": config.MIN_CHAT_MESSAGES_PER_CHUNK,
         "min_chat_active_seconds_per_chunk": config.MIN_CHAT_ACTIVE_SECONDS_PER_CHUNK,
@@ -40,6 +50,30 @@ def load_preset(name: str):
 
     config.HIGHLIGHT_THRESHOLD = preset["highlight_threshold"]
 
+    # Added after version 1 presets were written
+    config.SCORING_MODE = preset.get("scoring_mode", config.SCORING_MODE)
+    config.SCORING_WINDOW_SECONDS = preset.get(
+        "scoring_window_seconds", config.SCORING_WINDOW_SECONDS
+    )
+    config.SCORING_HOP_SECONDS = preset.get(
+        "scoring_hop_seconds", config.SCORING_HOP_SECONDS
+    )
+    config.TRANSCRIPTION_BACKEND = preset.get(
+        "transcription_backend", config.TRANSCRIPTION_BACKEND
+    )
+    config.WHISPER_MODEL_NAME = preset.get(
+        "whisper_model_name", config.WHISPER_MODEL_NAME
+    )
+    config.TRANSCRIPTION_LANGUAGE = preset.get(
+        "transcription_language", config.TRANSCRIPTION_LANGUAGE
+    )
+    config.TRANSCRIPTION_CASCADE = preset.get(
+        "transcription_cascade", config.TRANSCRIPTION_CASCADE
+    )
+    config.CASCADE_FAST_MODEL_NAME = preset.get(
+        "cascade_fast_model_name", config.CASCADE_FAST_MODEL_NAME
+    )
+
     config.CHAT_ONLY_MIN_SCORE = preset["chat_only_min_score"]
     config.MIN_CHAT_MESSAGES_PER_CHUNK = preset["min_chat_messages_per_chunk"]
     config.MIN_CHAT_ACTIVE_SECONDS_PER_CHUNK = preset["min_chat_active_seconds_per_chunk"]
@@ -1,8 +1,28 @@
+import bisect
 import json
+import math
+from itertools import accumulate
+from pathlib import Path
+
+import numpy as np
+
 from infra.logger import setup_logger
-from infra.config import KEYWORDS_PATH, TRANSCRIPTS_DIR, DATA_DIR
+from infra.config import (
+    KEYWORDS_PATH,
+    TRANSCRIPTS_DIR,
+    CHUNKS_DIR,
+    DATA_DIR,
+    HIGHLIGHTS_DIR,
+    KEYWORD_WORD_BOUNDARY,
+)
+from processing.keyword_matcher import compiled_keyword_groups
 
 TEXT_FEATURES_PATH = DATA_DIR / "text_features.json"
+TEXT_SCORES_PATH = HIGHLIGHTS_DIR / "text_scores_per_second.npz"
+
+# Per-second text scores are scaled by this percentile of the seconds
+# that have any positive hit
+TEXT_SCORE_PERCENTILE = 99
 
 
 def load_keywords():
@@ -13,17 +33,11 @@ def load_keywords():
         return json.load(f)
 
 
-def count_keywords_in_text(text, keywords_by_category):
-    text_lower = text.lower()
-    counts = {}
-
-    for category, phrases in keywords_by_category.items():
-        count = 0
-        for phrase in phrases:
-            count += text_lower.count(phrase.lower())
-        counts[category] = count
-
-    return counts
+def count_keywords_in_text(group_counts, categories):
+    return {
+        category: group_counts.get(category, 0)
+        for category in categories
+    }
 
 
 def count_keyword_hits_per_chunk(logger=None):
@@ -37,10 +51,12 @@ def count_keyword_hits_per_chunk(logger=None):
 
     try:
         all_keywords = load_keywords()
-        keywords_by_category = {
-            k: v for k, v in all_keywords.items() if k != "sentiment"
-        }
-        sentiment_config = all_keywords.get("sentiment", {})
+        categories = [k for k in all_keywords if k != "sentiment"]
+
+        # All categories and sentiment phrases in one pass per transcript
+        keyword_groups = compiled_keyword_groups(
+            KEYWORDS_PATH, word_boundary=KEYWORD_WORD_BOUNDARY
+        )
 
         transcripts = sorted(TRANSCRIPTS_DIR.glob("chunk_*.json"))
         logger.info("Found %d transcript files", len(transcripts))
@@ -50,6 +66,15 @@ def count_keyword_hits_per_chunk(logger=None):
 
         all_features = {}
 
+        # Keyword hits placed in VOD time, for the per-second score
+        chunk_starts, vod_seconds = _chunk_timing()
+        phrase_weights = keyword_groups.phrase_weights({
+            **{category: 1.0 for category in categories},
+            "sentiment.positive": 1.0,
+            "sentiment.negative": -1.0,
+        })
+        hits = []
+
         for transcript_path in transcripts:
             logger.info("Processing transcript: %s", transcript_path)
 
@@ -58,8 +83,10 @@ def count_keyword_hits_per_chunk(logger=None):
 
             text = data.get("text", "")
 
-            counts = count_keywords_in_text(text, keywords_by_category)
-            sentiment = compute_sentiment(text, sentiment_config)
+            group_counts = keyword_groups.count_groups(text.lower())
+
+            counts = count_keywords_in_text(group_counts, categories)
+            sentiment = compute_sentiment(group_counts)
 
             raw_text_score = sum(counts.values()) + sentiment["sentiment_raw"]
 
@@ -70,8 +97,22 @@ def count_keyword_hits_per_chunk(logger=None):
                 "raw_text_score": raw_text_score,
             }
 
+            offset = chunk_starts.get(transcript_path.stem)
+            if offset is not None:
+                for segment in data.get("segments", []):
+                    for start, end, weight in segment_hits(
+                        segment, keyword_groups, phrase_weights
+                    ):
+                        hits.append((offset + start, offset + end, weight))
+
         all_features = normalize_text_scores(all_features)
 
+        if chunk_starts:
+            write_text_scores_per_second(hits, vod_seconds)
+        else:
+            # Never leave another run's array for dense scoring to pick up
+            TEXT_SCORES_PATH.unlink(missing_ok=True)
+
         with open(TEXT_FEATURES_PATH, "w", encoding="utf-8") as f:
             json.dump(all_features, f, indent=2)
 
@@ -83,14 +124,9 @@ def count_keyword_hits_per_chunk(logger=None):
         raise
 
 
-def compute_sentiment(text, sentiment_config):
-    text_lower = text.lower()
-
-    positive = sentiment_config.get("positive", [])
-    negative = sentiment_config.get("negative", [])
-
-    pos_hits = sum(text_lower.count(p.lower()) for p in positive)
-    neg_hits = sum(text_lower.count(n.lower()) for n in negative)
+def compute_sentiment(group_counts):
+    pos_hits = group_counts.get("sentiment.positive", 0)
+    neg_hits = group_counts.get("sentiment.negative", 0)
 
     return {
         "positive_hits": pos_hits,
@@ -118,3 +154,129 @@ def normalize_text_scores(all_features):
             )
 
     return all_features
+
+
+# ─────────────────────────────────────────────
+# Per-second text score
+# ─────────────────────────────────────────────
+
+def segment_hits(segment, keyword_groups, phrase_weights):
+    """
+    Yields (start, end, weight) per keyword hit in a transcript segment,
+    in the segment's time base. With word timestamps a hit spans the
+    words it was found in; otherwise it spans the whole segment.
+    """
+
+    matcher = keyword_groups.matcher
+    words = segment.get("words")
+
+    if words:
+        word_text = "".join(w.get("word", "") for w in words).lower()
+        word_offsets = [0, *accumulate(len(w.get("word", "")) for w in words)][:-1]
+
+        for start, end, index in matcher.occurrences(word_text):
+            if not phrase_weights[index]:
+                continue
+            first = bisect.bisect_right(word_offsets, start) - 1
+            last = bisect.bisect_right(word_offsets, end - 1) - 1
+            yield (
+                float(words[first]["start"]),
+                float(words[last]["end"]),
+                phrase_weights[index],
+            )
+        return
+
+    text = segment.get("text", "").lower()
+    for _, _, index in matcher.occurrences(text):
+        if phrase_weights[index]:
+            yield float(segment["start"]), float(segment["end"]), phrase_weights[index]
+
+
+def spread_hits(hits, n_seconds: int) -> np.ndarray:
+    """
+    Sums hit weights per second. A hit spanning [start, end) is spread
+    over the seconds it covers in proportion to the overlap; zero-length
+    hits land in their second.
+    """
+
+    raw = np.zeros(n_seconds, dtype=np.float64)
+    if not hits or n_seconds <= 0:
+        return raw
+
+    start, end, weight = (np.asarray(column, dtype=np.float64) for column in zip(*hits))
+    start = np.clip(start, 0.0, n_seconds)
+    end = np.clip(np.maximum(end, start), 0.0, n_seconds)
+
+    first = np.minimum(np.floor(start).astype(np.int64), n_seconds - 1)
+    last = np.minimum(np.floor(end).astype(np.int64), n_seconds - 1)
+    duration = end - start
+
+    # Points and hits inside a single second
+    single = (first == last) | (duration <= 0)
+    raw += np.bincount(first[single], weights=weight[single], minlength=n_seconds)
+
+    # Longer hits: partial first / last second, full seconds in between
+    multi = ~single
+    rate = weight[multi] / duration[multi]
+    first, last = first[multi], last[multi]
+    start, end = start[multi], end[multi]
+
+    raw += np.bincount(first, weights=rate * (first + 1 - start), minlength=n_seconds)
+    raw += np.bincount(last, weights=rate * (end - last), minlength=n_seconds)
+
+    inner = np.zeros(n_seconds + 1, dtype=np.float64)
+    np.add.at(inner, first + 1, rate)
+    np.add.at(inner, last, -rate)
+    raw += np.cumsum(inner)[:n_seconds]
+
+    return raw
+
+
+def write_text_scores_per_second(hits, n_seconds: int) -> np.ndarray:
+    """
+    Dense text score per VOD second (negative sentiment lowers a second
+    before clipping at 0), scaled to [0, 1].
+    """
+
+    raw = spread_hits(hits, n_seconds)
+
+    positive = raw[raw > 0]
+    scale = float(np.percentile(positive, TEXT_SCORE_PERCENTILE)) if positive.size else 0.0
+
+    if scale > 0:
+        score = np.clip(raw / scale, 0.0, 1.0)
+    else:
+        score = np.zeros(n_seconds, dtype=np.float64)
+
+    TEXT_SCORES_PATH.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(TEXT_SCORES_PATH, raw=raw, score=score)
+
+    return score
+
+
+def text_scores_per_second() -> np.ndarray | None:
+    if not TEXT_SCORES_PATH.exists():
+        return None
+
+    with np.load(TEXT_SCORES_PATH) as data:
+        return data["score"]
+
+
+def _chunk_timing() -> tuple[dict[str, float], int]:
+    """
+    ({chunk stem: start seconds}, VOD length in whole seconds) from
+    chunks.json; ({}, 0) when there are no chunks.
+    """
+
+    chunks_path = CHUNKS_DIR / "chunks.json"
+    if not chunks_path.exists():
+        return {}, 0
+
+    with open(chunks_path, "r", encoding="utf-8") as f:
+        chunks = json.load(f)
+
+    if not chunks:
+        return {}, 0
+
+    starts = {Path(c["file"]).stem: float(c["start_time"]) for c in chunks}
+    return starts, math.ceil(max(float(c["end_time"]) for c in chunks))
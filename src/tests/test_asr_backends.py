@@ -0,0 +1,145 @@
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import infra.config as config
+from processing import asr_backends, transcription_server
+from processing.asr_backends import (
+    FasterWhisperBackend,
+    OpenAIWhisperBackend,
+    TranscriptionBackend,
+)
+
+
+def _openai_segment(words):
+    segment = {
+        "id": 0,
+        "seek": 0,
+        "start": 0.0,
+        "end": 1.5,
+        "text": " lets go",
+        "tokens": [50364, 1374],
+        "temperature": 0.0,
+        "avg_logprob": -0.2,
+        "compression_ratio": 0.9,
+        "no_speech_prob": 0.01,
+    }
+    if words:
+        segment["words"] = [
+            {"word": " lets", "start": 0.0, "end": 0.6, "probability": 0.9},
+            {"word": " go", "start": 0.6, "end": 1.5, "probability": 0.8},
+        ]
+    return segment
+
+
+class FakeOpenAIModel:
+    def transcribe(self, audio, **options):
+        words = options["word_timestamps"]
+        return {"text": " lets go ", "segments": [_openai_segment(words)], "language": "en"}
+
+
+class FakeFasterModel:
+    def transcribe(self, audio, **options):
+        words = None
+        if options.get("word_timestamps"):
+            words = [
+                SimpleNamespace(word=" lets", start=0.0, end=0.6, probability=0.9),
+                SimpleNamespace(word=" go", start=0.6, end=1.5, probability=0.8),
+            ]
+
+        segment = SimpleNamespace(
+            id=0, seek=0, start=0.0, end=1.5, text=" lets go", tokens=(50364, 1374),
+            temperature=0.0, avg_logprob=-0.2, compression_ratio=0.9,
+            no_speech_prob=0.01, words=words,
+        )
+        info = SimpleNamespace(language="en", language_probability=0.97)
+
+        return iter([segment]), info
+
+
+def _backend(cls, model):
+    backend = cls("tiny", logging.getLogger("test"))
+    backend._model = model
+    return backend
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        TranscriptionBackend("tiny", logging.getLogger("test"))
+
+
+@pytest.mark.parametrize("word_timestamps", [False, True])
+def test_backends_produce_the_same_transcript_shape(monkeypatch, word_timestamps):
+    monkeypatch.setattr(config, "WHISPER_WORD_TIMESTAMPS", word_timestamps)
+    audio = np.zeros(16000, dtype=np.float32)
+
+    openai = _backend(OpenAIWhisperBackend, FakeOpenAIModel()).transcribe(audio, "en")
+    faster = _backend(FasterWhisperBackend, FakeFasterModel()).transcribe(audio, "en")
+
+    assert faster == openai
+    assert ("words" in faster["segments"][0]) == word_timestamps
+
+
+def test_faster_whisper_language_detection():
+    backend = _backend(FasterWhisperBackend, FakeFasterModel())
+    assert backend.detect_language(np.zeros(16000)) == ("en", 0.97)
+
+
+class FakeConnection:
+    def __init__(self, server_options):
+        self.server_options = server_options
+        self.sent = []
+        self.closed = False
+
+    def send(self, request):
+        self.sent.append(request)
+
+    def recv(self):
+        return {"ok": True, "result": self.server_options}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(config, "TRANSCRIPTION_SERVER_ENABLED", True)
+    monkeypatch.setattr(config, "TRANSCRIPTION_BACKEND", "faster-whisper")
+
+    def use(conn):
+        monkeypatch.setattr(transcription_server, "connect", lambda timeout=None: conn)
+        return conn
+
+    return use
+
+
+def test_server_is_used_when_decode_options_match(server):
+    conn = server(FakeConnection(FasterWhisperBackend.decode_options()))
+
+    backend = asr_backends.get_backend(logging.getLogger("test"), model_name="small")
+
+    assert isinstance(backend, transcription_server.RemoteBackend)
+    assert backend.cache_tag == "faster-whisper:small"
+    assert conn.sent[0]["op"] == "decode_options" and not conn.closed
+
+
+def test_local_backend_when_the_server_decodes_differently(server):
+    options = {**FasterWhisperBackend.decode_options(), "beam_size": 99}
+    conn = server(FakeConnection(options))
+
+    backend = asr_backends.get_backend(logging.getLogger("test"), model_name="small")
+
+    assert type(backend) is FasterWhisperBackend
+    assert backend.model_name == "small"
+    assert conn.closed
+
+
+def test_local_backend_without_a_server(server, monkeypatch):
+    server(None)
+    assert type(asr_backends.get_backend(logging.getLogger("test"))) is FasterWhisperBackend
+
+    monkeypatch.setattr(config, "TRANSCRIPTION_SERVER_ENABLED", False)
+    monkeypatch.setattr(config, "TRANSCRIPTION_BACKEND", "openai-whisper")
+    assert type(asr_backends.get_backend(logging.getLogger("test"))) is OpenAIWhisperBackend
@@ -0,0 +1,108 @@
+import io
+import logging
+
+import numpy as np
+import pytest
+
+from processing import audio_extractor, audio_store
+
+RATE = audio_extractor.AUDIO_SAMPLE_RATE
+
+CHUNKS = [
+    {"file": "chunk_0000", "start_time": 0.0, "end_time": 0.5},
+    {"file": "chunk_0001", "start_time": 0.5, "end_time": 1.25},
+    {"file": "chunk_0002", "start_time": 1.25, "end_time": 2.0},
+]
+
+
+class FakeDecoder:
+    """
+    Stands in for the ffmpeg process: serves the PCM from the -ss seek
+    position through a pipe-like stdout.
+    """
+
+    def __init__(self, pcm: np.ndarray, commands: list):
+        self.pcm = pcm
+        self.commands = commands
+
+    def __call__(self, command, stdout=None):
+        self.commands.append(command)
+        seek = float(command[command.index("-ss") + 1])
+        self.stdout = io.BufferedReader(io.BytesIO(self.pcm[round(seek * RATE):].tobytes()))
+        return self
+
+    def wait(self):
+        return 0
+
+    def kill(self):
+        pass
+
+
+@pytest.fixture
+def decoder(monkeypatch, tmp_path):
+    monkeypatch.setattr(audio_store, "AUDIO_DIR", tmp_path)
+    monkeypatch.setattr(audio_store, "AUDIO_STORE_PATH", tmp_path / "audio.pcm")
+    monkeypatch.setattr(audio_store, "AUDIO_INDEX_PATH", tmp_path / "audio_index.json")
+    monkeypatch.setattr(audio_extractor, "AUDIO_STORE_PATH", tmp_path / "audio.pcm")
+    monkeypatch.setattr(audio_extractor, "input_fingerprint", lambda path: "abc")
+
+    pcm = np.arange(2 * RATE, dtype=np.int16)
+    commands = []
+    monkeypatch.setattr(audio_extractor.subprocess, "Popen", FakeDecoder(pcm, commands))
+
+    return pcm, commands
+
+
+def test_decoded_stream_is_split_at_chunk_boundaries(decoder):
+    pcm, commands = decoder
+
+    decoded = list(audio_extractor._iter_decoded_chunks(
+        "input.mp4", CHUNKS, 1, RATE, 1, logging.getLogger("test")
+    ))
+
+    assert commands[0][commands[0].index("-ss") + 1] == "0.5"
+    assert [position for position, _ in decoded] == [1, 2]
+    assert [len(data) // 2 for _, data in decoded] == [12000, 12000]
+    assert np.array_equal(np.frombuffer(decoded[0][1], dtype=np.int16), pcm[8000:20000])
+
+
+def test_store_is_written_per_chunk_and_resumed(decoder):
+    pcm, commands = decoder
+    logger = logging.getLogger("test")
+
+    # Interrupted after the first chunk: the index already records it
+    extraction = audio_extractor.iter_extract_to_store("input.mp4", CHUNKS, logger)
+    assert next(extraction)[0] == "chunk_0000"
+    extraction.close()
+
+    index = audio_store.load_store_index()
+    assert list(index["chunks"]) == ["chunk_0000"]
+    assert index["total_samples"] == 8000 and not index["complete"]
+
+    # The resumed decode seeks past the stored prefix
+    stems = [stem for stem, _ in audio_extractor.iter_extract_to_store("input.mp4", CHUNKS, logger)]
+    assert stems == ["chunk_0000", "chunk_0001", "chunk_0002"]
+    assert commands[-1][commands[-1].index("-ss") + 1] == "0.5"
+
+    store = audio_store.open_audio_store()
+    assert [store.chunks[s]["length"] for s in stems] == [8000, 12000, 12000]
+    assert np.array_equal(store.samples, pcm)
+
+    # A complete store is reused without decoding
+    decodes = len(commands)
+    assert len(list(audio_extractor.iter_extract_to_store("input.mp4", CHUNKS, logger))) == 3
+    assert len(commands) == decodes
+
+
+def test_changed_chunk_times_invalidate_the_suffix(decoder):
+    pcm, commands = decoder
+    logger = logging.getLogger("test")
+    list(audio_extractor.iter_extract_to_store("input.mp4", CHUNKS, logger))
+
+    replanned = [dict(CHUNKS[0]), {**CHUNKS[1], "end_time": 1.5}, {**CHUNKS[2], "start_time": 1.5}]
+    list(audio_extractor.iter_extract_to_store("input.mp4", replanned, logger))
+
+    store = audio_store.open_audio_store()
+    assert commands[-1][commands[-1].index("-ss") + 1] == "0.5"
+    assert [store.chunks[f"chunk_000{i}"]["length"] for i in range(3)] == [8000, 16000, 8000]
+    assert np.array_equal(store.samples, pcm)
@@ -0,0 +1,72 @@
+import logging
+
+import numpy as np
+import pytest
+
+from processing import audio_features, audio_store
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(audio_store, "AUDIO_DIR", tmp_path)
+    monkeypatch.setattr(audio_store, "AUDIO_STORE_PATH", tmp_path / "audio.pcm")
+    monkeypatch.setattr(audio_store, "AUDIO_INDEX_PATH", tmp_path / "audio_index.json")
+    monkeypatch.setattr(audio_features, "AUDIO_STORE_PATH", tmp_path / "audio.pcm")
+    monkeypatch.setattr(audio_features, "FEATURE_CACHE_DIR", tmp_path / "features")
+
+    return _write_store
+
+
+def _write_store(seed=0, seconds=3):
+    rng = np.random.default_rng(seed)
+    rate = 16000
+    t = np.arange(seconds * rate) / rate
+
+    # Tone bursts over noise: onsets and flux change from second to second
+    signal = 0.05 * rng.standard_normal(len(t))
+    signal += np.where((t % 1.0) > 0.6, 0.5 * np.sin(2 * np.pi * 440 * t), 0.0)
+    samples = (signal * 32767).clip(-32768, 32767).astype(np.int16)
+
+    audio_store.AUDIO_STORE_PATH.write_bytes(samples.tobytes())
+    index = audio_store.new_store_index("input.mp4", f"vod{seed}")
+    index["total_samples"] = len(samples)
+    index["complete"] = True
+    audio_store.write_store_index(index)
+
+
+def test_block_size_does_not_change_features(store, monkeypatch, tmp_path):
+    store()
+    logger = logging.getLogger("test")
+
+    monkeypatch.setattr(audio_features, "AUDIO_FEATURE_BLOCK_FRAMES", 10_000)
+    whole = audio_features.compute_audio_features(logger, n_fft=512, hop=256)
+
+    # Flux / onset differences cross every block boundary
+    monkeypatch.setattr(audio_features, "FEATURE_CACHE_DIR", tmp_path / "blocked")
+    monkeypatch.setattr(audio_features, "AUDIO_FEATURE_BLOCK_FRAMES", 7)
+    blocked = audio_features.compute_audio_features(logger, n_fft=512, hop=256)
+
+    assert len(whole["onset"]) == 3
+    assert whole["flux"].any() and whole["onset"].any()
+    for name in audio_features.FEATURE_NAMES:
+        assert blocked[name] == pytest.approx(whole[name], rel=1e-4)
+
+
+def test_cache_is_keyed_on_audio_and_params(store, caplog, tmp_path):
+    store()
+    logger = logging.getLogger("test")
+    cache_dir = tmp_path / "features"
+
+    with caplog.at_level(logging.INFO, logger="test"):
+        first = audio_features.compute_audio_features(logger, n_fft=512, hop=256)
+        cached = audio_features.compute_audio_features(logger, n_fft=512, hop=256)
+        assert "cache hit" in caplog.records[-1].getMessage()
+        for name in audio_features.FEATURE_NAMES:
+            assert np.array_equal(cached[name], first[name])
+
+        audio_features.compute_audio_features(logger, n_fft=512, hop=128)
+        assert len(list(cache_dir.glob("*.npz"))) == 2
+
+        store(seed=1)
+        audio_features.compute_audio_features(logger, n_fft=512, hop=256)
+        assert len(list(cache_dir.glob("*.npz"))) == 3
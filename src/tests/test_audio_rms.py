@@ -0,0 +1,110 @@
+import logging
+
+import numpy as np
+import pytest
+
+from infra.config import SILENCE_RMS_THRESHOLD, SPIKE_THRESHOLD
+from processing import audio_rms, audio_store
+
+
+@pytest.fixture(autouse=True)
+def tmp_audio(monkeypatch, tmp_path):
+    monkeypatch.setattr(audio_store, "AUDIO_DIR", tmp_path)
+    monkeypatch.setattr(audio_store, "AUDIO_STORE_PATH", tmp_path / "audio.pcm")
+    monkeypatch.setattr(audio_store, "AUDIO_INDEX_PATH", tmp_path / "audio_index.json")
+    monkeypatch.setattr(audio_rms, "ENVELOPE_PATH", tmp_path / "envelope.npz")
+
+
+def _write_store(samples, fingerprint="abc"):
+    audio_store.AUDIO_STORE_PATH.write_bytes(samples.astype(np.int16).tobytes())
+
+    index = audio_store.new_store_index("input.mp4", fingerprint)
+    index["total_samples"] = len(samples)
+    index["complete"] = True
+    index["chunks"]["chunk_0000"] = {
+        "offset": 0,
+        "length": len(samples),
+        "start_time": 0.0,
+        "end_time": len(samples) / index["sample_rate"],
+    }
+    audio_store.write_store_index(index)
+
+    return audio_store.open_audio_store()
+
+
+def test_envelope_is_rebuilt_for_other_audio():
+    logger = logging.getLogger("test")
+    samples = np.tile(np.array([1000, -1000], dtype=np.int16), 8000)
+
+    store = _write_store(samples)
+    envelope, hop = audio_rms.compute_audio_envelope(store, logger, resume=True, hop_seconds=0.1)
+    assert len(envelope) == 10
+    assert np.allclose(envelope, 1000 / 32768)
+    assert audio_rms.load_audio_envelope()[1] == 0.1
+
+    # A different hop is not served from the cache
+    envelope, hop = audio_rms.compute_audio_envelope(store, logger, resume=True, hop_seconds=0.25)
+    assert (len(envelope), hop) == (4, 0.25)
+
+    # Another VOD (or a longer decode) invalidates the cached envelope
+    store = _write_store(np.concatenate((samples, samples)), fingerprint="def")
+    assert audio_rms.load_audio_envelope() is None
+    assert audio_rms.audio_scores_per_second() is None
+
+    envelope, _ = audio_rms.compute_audio_envelope(store, logger, resume=True, hop_seconds=0.25)
+    assert len(envelope) == 8
+    assert audio_rms.load_audio_envelope() is not None
+
+
+def test_envelope_without_store_is_not_used():
+    samples = np.full(1600, 1000, dtype=np.int16)
+    audio_rms.compute_audio_envelope(_write_store(samples), logging.getLogger("test"), resume=False)
+
+    audio_store.clear_audio_store()
+    assert audio_rms.load_audio_envelope() is None
+
+
+def test_aggregate_envelope_combines_power_per_bin():
+    envelope = np.array([1.0, 1.0, 3.0, 1.0, 2.0], dtype=np.float32)
+
+    assert audio_rms.aggregate_envelope(envelope, 0.5) == pytest.approx(
+        [1.0, np.sqrt(5.0), 2.0]
+    )
+    assert audio_rms.aggregate_envelope(envelope, 0.1, bin_seconds=0.1) == pytest.approx(envelope)
+
+
+def _reference_volume_spikes(metadata):
+    # Per-entry loop the vectorized scoring replaced
+    median_rms = np.median([entry["audio_rms"] for entry in metadata]) or 1e-9
+
+    for entry in metadata:
+        rms = entry["audio_rms"]
+        silent = rms < SILENCE_RMS_THRESHOLD
+        entry["is_silent"] = silent
+        entry["audio_spike_score"] = 0.0 if silent else float(rms / median_rms)
+        entry["is_volume_spike"] = not silent and entry["audio_spike_score"] >= SPIKE_THRESHOLD
+
+    active = [e["audio_spike_score"] for e in metadata if not e["is_silent"]]
+    for entry in metadata:
+        if entry["is_silent"] or max(active) == min(active):
+            entry["audio_score"] = 0.0
+        else:
+            entry["audio_score"] = (entry["audio_spike_score"] - min(active)) / (max(active) - min(active))
+
+    return metadata
+
+
+def test_volume_spikes_match_the_per_entry_scoring():
+    rms = np.random.default_rng(0).random(200) * 0.2
+    rms[::7] = 0.0
+
+    metadata = [{"audio_rms": float(value)} for value in rms]
+    expected = _reference_volume_spikes([dict(entry) for entry in metadata])
+
+    result = audio_rms.normalize_audio_scores(audio_rms.detect_volume_spikes(metadata))
+
+    for entry, reference in zip(result, expected):
+        assert entry["is_silent"] == reference["is_silent"]
+        assert entry["is_volume_spike"] == reference["is_volume_spike"]
+        assert entry["audio_spike_score"] == pytest.approx(reference["audio_spike_score"])
+        assert entry["audio_score"] == pytest.approx(reference["audio_score"])
@@ -0,0 +1,86 @@
+import numpy as np
+
+from processing import audio_store
+
+
+def _use_tmp_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(audio_store, "AUDIO_DIR", tmp_path)
+    monkeypatch.setattr(audio_store, "AUDIO_STORE_PATH", tmp_path / "audio.pcm")
+    monkeypatch.setattr(audio_store, "AUDIO_INDEX_PATH", tmp_path / "audio_index.json")
+
+
+def _write_chunk(index, stem, samples, start_time):
+    with open(audio_store.AUDIO_STORE_PATH, "ab") as f:
+        f.write(samples.astype(np.int16).tobytes())
+
+    index["chunks"][stem] = {
+        "offset": index["total_samples"],
+        "length": len(samples),
+        "start_time": start_time,
+        "end_time": start_time + len(samples) / index["sample_rate"],
+    }
+    index["total_samples"] += len(samples)
+    audio_store.write_store_index(index)
+
+
+def test_partial_store_grows_without_reopening(monkeypatch, tmp_path):
+    _use_tmp_store(monkeypatch, tmp_path)
+
+    index = audio_store.new_store_index("input.mp4", "abc")
+    first = np.arange(16000, dtype=np.int16)
+    _write_chunk(index, "chunk_0000", first, 0.0)
+
+    assert audio_store.open_audio_store() is None
+    store = audio_store.open_partial_audio_store()
+    assert store.chunk_stems() == ["chunk_0000"]
+
+    second = -np.arange(8000, dtype=np.int16)
+    _write_chunk(index, "chunk_0001", second, 1.0)
+
+    store.append_chunk("chunk_0001", index["chunks"]["chunk_0001"])
+
+    assert store.duration_seconds == 1.5
+    assert np.array_equal(store.chunk("chunk_0001"), second)
+    assert np.array_equal(store.time_range(0.5, 1.25), np.concatenate((first[8000:], second[:4000])))
+    assert store.source_key == audio_store.open_partial_audio_store().source_key
+
+
+def test_complete_store_round_trip(monkeypatch, tmp_path):
+    _use_tmp_store(monkeypatch, tmp_path)
+
+    index = audio_store.new_store_index("input.mp4", "abc")
+    samples = np.array([-32768, -16384, 0, 16384, 32767] * 3200, dtype=np.int16)
+    _write_chunk(index, "chunk_0000", samples[:8000], 0.0)
+    _write_chunk(index, "chunk_0001", samples[8000:], 0.5)
+
+    index["complete"] = True
+    audio_store.write_store_index(index)
+
+    store = audio_store.open_audio_store()
+
+    assert isinstance(store.samples, np.memmap)
+    assert store.duration_seconds == 1.0
+    assert store.source_key == "abc:16000:16000"
+    assert np.array_equal(store.chunk("chunk_0001"), samples[8000:])
+    assert np.array_equal(store.time_range(0.25, 0.75), samples[4000:12000])
+    assert np.array_equal(store.time_range(-1.0, 0.0001), samples[:2])
+    assert len(store.time_range(0.9, 5.0)) == 1600
+    assert len(store.time_range(0.8, 0.2)) == 0
+    assert store.chunk_float("chunk_0000")[:5].tolist() == [-1.0, -0.5, 0.0, 0.5, 32767 / 32768]
+
+    audio_store.clear_audio_store()
+    assert audio_store.open_partial_audio_store() is None
+
+
+def test_empty_store_has_no_samples(monkeypatch, tmp_path):
+    _use_tmp_store(monkeypatch, tmp_path)
+
+    audio_store.AUDIO_STORE_PATH.touch()
+    index = audio_store.new_store_index("input.mp4")
+    index["complete"] = True
+    audio_store.write_store_index(index)
+
+    store = audio_store.open_audio_store()
+
+    assert store.duration_seconds == 0.0
+    assert len(store.time_range(0.0, 10.0)) == 0
@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+
+import infra.config as config
+from processing.chat import chat_aggregates, chat_keywords, chat_store
+
+
+def _use_tmp_paths(monkeypatch, tmp_path):
+    store_dir = tmp_path / "store"
+    monkeypatch.setattr(chat_store, "CHAT_STORE_DIR", store_dir)
+    for name in (
+        "CHAT_INDEX_PATH",
+        "TIMES_PATH",
+        "TEXT_PATH",
+        "TEXT_OFFSETS_PATH",
+        "EMOTE_IDS_PATH",
+        "EMOTE_OFFSETS_PATH",
+    ):
+        monkeypatch.setattr(chat_store, name, store_dir / getattr(chat_store, name).name)
+
+    monkeypatch.setattr(chat_aggregates, "CHAT_METRICS_DIR", tmp_path / "metrics")
+    monkeypatch.setattr(
+        chat_aggregates, "CHAT_AGGREGATES_PATH", tmp_path / "metrics" / "chat_per_second.npz"
+    )
+
+
+def test_per_second_aggregates(monkeypatch, tmp_path):
+    _use_tmp_paths(monkeypatch, tmp_path)
+
+    chat_store.write_chat_store("1", [
+        {"vod_time_sec": 0.2, "text_userless": "lets go", "emote_tokens": ["Pog"]},
+        {"vod_time_sec": 0.9, "text_userless": "omg no way", "emote_tokens": ["LUL", "Pog", "LUL"]},
+        {"vod_time_sec": 2.5, "text_userless": "", "emote_tokens": ["Pog"]},
+        {"vod_time_sec": 2.7, "text_userless": "lets go", "emote_tokens": []},
+    ])
+
+    aggregates = chat_aggregates.require_chat_aggregates(logging.getLogger("test"))
+    names = aggregates["emote_names"]
+
+    assert aggregates["vod_id"] == "1"
+    assert aggregates["messages"].tolist() == [2, 0, 2]
+    assert aggregates["text_messages"].tolist() == [2, 0, 1]
+    assert aggregates["emotes"].tolist() == [4, 0, 1]
+    assert aggregates["unique_emotes"].tolist() == [2, 0, 1]
+    assert aggregates["top_emote_count"].tolist() == [2, 0, 1]
+    # Ties go to the emote seen first in the second
+    assert names[aggregates["top_emote"][0]] == "Pog"
+    assert aggregates["top_emote"][1] == -1
+
+    assert aggregates["keyword_hits"].tolist() == [3, 0, 1]
+    assert chat_aggregates.keywords_by_second(aggregates) == {
+        0: ["lets go", "no way", "omg"],
+        2: ["lets go"],
+    }
+
+
+def test_cache_follows_the_store_vod(monkeypatch, tmp_path):
+    _use_tmp_paths(monkeypatch, tmp_path)
+    logger = logging.getLogger("test")
+
+    chat_store.write_chat_store("1", [{"vod_time_sec": 0.0, "text_userless": "a", "emote_tokens": []}])
+    assert chat_aggregates.require_chat_aggregates(logger)["messages"].tolist() == [1]
+
+    chat_store.write_chat_store("2", [{"vod_time_sec": 1.0, "text_userless": "b", "emote_tokens": []}])
+    aggregates = chat_aggregates.require_chat_aggregates(logger)
+
+    assert aggregates["vod_id"] == "2"
+    assert aggregates["messages"].tolist() == [0, 1]
+
+
+def test_cache_follows_the_chat_keywords(monkeypatch, tmp_path):
+    _use_tmp_paths(monkeypatch, tmp_path)
+    logger = logging.getLogger("test")
+
+    keywords_path = tmp_path / "chat_keywords.json"
+    keywords_path.write_text(json.dumps({"hype": ["go"]}), encoding="utf-8")
+    monkeypatch.setattr(chat_keywords, "CHAT_KEYWORDS_PATH", keywords_path)
+    monkeypatch.setattr(config, "KEYWORD_WORD_BOUNDARY", False)
+
+    chat_store.write_chat_store("1", [
+        {"vod_time_sec": 0.0, "text_userless": "lets go", "emote_tokens": []},
+        {"vod_time_sec": 0.5, "text_userless": "good game", "emote_tokens": []},
+    ])
+    assert chat_aggregates.require_chat_aggregates(logger)["keyword_hits"].tolist() == [2]
+
+    monkeypatch.setattr(config, "KEYWORD_WORD_BOUNDARY", True)
+    assert chat_aggregates.require_chat_aggregates(logger)["keyword_hits"].tolist() == [1]
+
+    keywords_path.write_text(json.dumps({"hype": ["go", "game"]}), encoding="utf-8")
+    os.utime(keywords_path, ns=(0, keywords_path.stat().st_mtime_ns + 1_000_000))
+
+    aggregates = chat_aggregates.require_chat_aggregates(logger)
+    assert aggregates["keyword_hits"].tolist() == [2]
+    assert aggregates["keyword_phrases"] == ["go", "game"]
+
+
+def test_messages_before_the_vod_are_not_counted(monkeypatch, tmp_path):
+    _use_tmp_paths(monkeypatch, tmp_path)
+
+    chat_store.write_chat_store("1", [
+        {"vod_time_sec": -3.0, "text_userless": "lets go", "emote_tokens": ["Pog"]},
+        {"vod_time_sec": 1.2, "text_userless": "lets go", "emote_tokens": ["Pog"]},
+    ])
+    aggregates = chat_aggregates.require_chat_aggregates(logging.getLogger("test"))
+
+    assert aggregates["messages"].tolist() == [0, 1]
+    assert aggregates["emotes"].tolist() == [0, 1]
+    assert aggregates["keyword_hits"].tolist() == [0, 1]
@@ -0,0 +1,57 @@
+import json
+import logging
+
+import pytest
+
+from processing.chat import chat_ingest, chat_store
+
+
+def _use_tmp_dirs(monkeypatch, tmp_path):
+    store_dir = tmp_path / "store"
+    monkeypatch.setattr(chat_store, "CHAT_STORE_DIR", store_dir)
+    for name in (
+        "CHAT_INDEX_PATH",
+        "TIMES_PATH",
+        "TEXT_PATH",
+        "TEXT_OFFSETS_PATH",
+        "EMOTE_IDS_PATH",
+        "EMOTE_OFFSETS_PATH",
+    ):
+        monkeypatch.setattr(chat_store, name, store_dir / getattr(chat_store, name).name)
+
+    monkeypatch.setattr(chat_ingest, "CHAT_STORE_DIR", store_dir)
+    monkeypatch.setattr(chat_ingest, "TWITCH_CHAT_RAW_DIR", tmp_path)
+    monkeypatch.setattr(chat_ingest.config, "CHAT_INGEST_DEBUG", False)
+
+
+def test_ingest_reuses_store_of_same_vod(monkeypatch, tmp_path):
+    _use_tmp_dirs(monkeypatch, tmp_path)
+
+    raw_path = tmp_path / "42.json"
+    raw_path.write_text(json.dumps({
+        "video": {"id": "42"},
+        "comments": [
+            {
+                "content_offset_seconds": 3.0,
+                "commenter": {"name": "viewer"},
+                "message": {"body": "LETS GO", "emotes": []},
+            },
+            {"commenter": {"name": "viewer"}, "message": {"body": "no offset"}},
+        ],
+    }), encoding="utf-8")
+
+    logger = logging.getLogger("test")
+    chat_ingest.ingest_chat("42", logger)
+
+    store = chat_store.open_chat_store()
+    assert store.vod_id == "42"
+    assert list(store.texts(slice(None))) == ["lets go"]
+
+    # Same VOD: the store is reused without reading the replay again
+    raw_path.unlink()
+    chat_ingest.ingest_chat("42", logger)
+    assert list(chat_store.open_chat_store().texts(slice(None))) == ["lets go"]
+
+    # Another VOD is ingested from its own replay
+    with pytest.raises(FileNotFoundError):
+        chat_ingest.ingest_chat("43", logger)
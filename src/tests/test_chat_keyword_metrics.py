@@ -0,0 +1,79 @@
+import json
+import logging
+import math
+
+import infra.config as config
+from processing.chat import (
+    chat_aggregates,
+    chat_keywords,
+    chat_store,
+    keyword_metrics,
+    keyword_score,
+)
+
+
+def _use_tmp_paths(monkeypatch, tmp_path):
+    store_dir = tmp_path / "store"
+    monkeypatch.setattr(chat_store, "CHAT_STORE_DIR", store_dir)
+    for name in (
+        "CHAT_INDEX_PATH",
+        "TIMES_PATH",
+        "TEXT_PATH",
+        "TEXT_OFFSETS_PATH",
+        "EMOTE_IDS_PATH",
+        "EMOTE_OFFSETS_PATH",
+    ):
+        monkeypatch.setattr(chat_store, name, store_dir / getattr(chat_store, name).name)
+
+    metrics_dir = tmp_path / "metrics"
+    monkeypatch.setattr(chat_aggregates, "CHAT_METRICS_DIR", metrics_dir)
+    monkeypatch.setattr(chat_aggregates, "CHAT_AGGREGATES_PATH", metrics_dir / "chat_per_second.npz")
+    monkeypatch.setattr(keyword_metrics, "CHAT_METRICS_DIR", metrics_dir)
+    monkeypatch.setattr(keyword_score, "CHAT_METRICS_DIR", metrics_dir)
+
+    keywords_path = tmp_path / "chat_keywords.json"
+    keywords_path.write_text(
+        json.dumps({"hype": ["lets go", "pog"], "shock": ["no way"]}), encoding="utf-8"
+    )
+    monkeypatch.setattr(chat_keywords, "CHAT_KEYWORDS_PATH", keywords_path)
+    monkeypatch.setattr(config, "KEYWORD_WORD_BOUNDARY", False)
+    monkeypatch.setattr(config, "CHAT_METRICS_JSON_VIEWS", True)
+
+    return metrics_dir
+
+
+def test_keyword_hits_per_second_from_the_chat_text(monkeypatch, tmp_path):
+    metrics_dir = _use_tmp_paths(monkeypatch, tmp_path)
+    logger = logging.getLogger("test")
+
+    # Each message counts every distinct keyword it contains once
+    chat_store.write_chat_store("1", [
+        {"vod_time_sec": 0.1, "text_userless": "lets go lets go", "emote_tokens": []},
+        {"vod_time_sec": 0.8, "text_userless": "pog no way", "emote_tokens": []},
+        {"vod_time_sec": 1.5, "text_userless": "hello", "emote_tokens": []},
+        {"vod_time_sec": 3.2, "text_userless": "", "emote_tokens": ["Pog"]},
+        {"vod_time_sec": 3.9, "text_userless": "pog", "emote_tokens": []},
+    ])
+
+    keyword_metrics.compute_chat_keyword_hits(logger)
+
+    with open(metrics_dir / "chat_keyword_hits.json", "r", encoding="utf-8") as f:
+        hits = json.load(f)
+
+    assert hits["vod_id"] == "1"
+    assert hits["timeline"] == [
+        {"second": 0, "messages": 2, "keyword_hits": 3, "keywords": ["lets go", "no way", "pog"]},
+        {"second": 1, "messages": 1, "keyword_hits": 0, "keywords": []},
+        {"second": 3, "messages": 1, "keyword_hits": 1, "keywords": ["pog"]},
+    ]
+
+    keyword_score.compute_chat_keyword_score(logger)
+
+    with open(metrics_dir / "chat_keyword_score.json", "r", encoding="utf-8") as f:
+        score = json.load(f)
+
+    scale = keyword_score.KEYWORD_SCORE_SCALE
+    assert [(item["second"], item["score"]) for item in score["timeline"]] == [
+        (0, math.tanh(1.5 / scale)),
+        (3, math.tanh(1.0 / scale)),
+    ]
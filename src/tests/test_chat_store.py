@@ -0,0 +1,72 @@
+import processing.chat.chat_store as chat_store
+
+
+def _use_tmp_store(monkeypatch, tmp_path):
+    store_dir = tmp_path / "store"
+    monkeypatch.setattr(chat_store, "CHAT_STORE_DIR", store_dir)
+    for name in (
+        "CHAT_INDEX_PATH",
+        "TIMES_PATH",
+        "TEXT_PATH",
+        "TEXT_OFFSETS_PATH",
+        "EMOTE_IDS_PATH",
+        "EMOTE_OFFSETS_PATH",
+    ):
+        monkeypatch.setattr(chat_store, name, store_dir / getattr(chat_store, name).name)
+
+
+def test_round_trip_sorts_by_time(monkeypatch, tmp_path):
+    _use_tmp_store(monkeypatch, tmp_path)
+
+    messages = [
+        {"vod_time_sec": 5.5, "text_userless": "lets go ✨", "emote_tokens": ["Pog", "Pog"]},
+        {"vod_time_sec": 1.0, "text_userless": "no way", "emote_tokens": []},
+        {"vod_time_sec": 3.2, "text_userless": "", "emote_tokens": ["LUL"]},
+        {"vod_time_sec": 3.2, "text_userless": "wait what", "emote_tokens": ["Pog"]},
+    ]
+
+    assert chat_store.write_chat_store("42", messages) == 4
+
+    store = chat_store.open_chat_store()
+    assert store.vod_id == "42"
+    assert store.times.tolist() == [1.0, 3.200000047683716, 3.200000047683716, 5.5]
+    assert store.seconds().tolist() == [1, 3, 3, 5]
+    assert list(store.texts()) == ["no way", "", "wait what", "lets go ✨"]
+    assert store.emote_counts().tolist() == [0, 1, 1, 2]
+    assert [
+        [store.emote_names[i] for i in store.message_emote_ids(m)]
+        for m in range(len(store))
+    ] == [[], ["LUL"], ["Pog"], ["Pog", "Pog"]]
+
+    window = store.time_slice(3.0, 5.5)
+    assert list(store.texts(window)) == ["", "wait what"]
+
+
+def test_empty_store(monkeypatch, tmp_path):
+    _use_tmp_store(monkeypatch, tmp_path)
+
+    assert chat_store.open_chat_store() is None
+    assert chat_store.write_chat_store(None, []) == 0
+
+    store = chat_store.open_chat_store()
+    assert len(store) == 0
+    assert list(store.texts()) == []
+    assert store.time_slice(0, 10) == slice(0, 0)
+
+
+def test_messages_before_the_vod_are_dropped(monkeypatch, tmp_path):
+    _use_tmp_store(monkeypatch, tmp_path)
+
+    messages = [
+        {"vod_time_sec": -2.5, "text_userless": "early", "emote_tokens": ["Pog"]},
+        {"vod_time_sec": 0.5, "text_userless": "first", "emote_tokens": []},
+        {"vod_time_sec": -0.1, "text_userless": "late early", "emote_tokens": []},
+        {"vod_time_sec": 2.0, "text_userless": "second", "emote_tokens": ["LUL"]},
+    ]
+
+    assert chat_store.write_chat_store("42", messages) == 2
+
+    store = chat_store.open_chat_store()
+    assert store.seconds().tolist() == [0, 2]
+    assert list(store.texts()) == ["first", "second"]
+    assert [store.emote_names[i] for i in store.emote_ids] == ["LUL"]
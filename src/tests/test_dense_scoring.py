@@ -0,0 +1,85 @@
+import json
+import logging
+
+import numpy as np
+import pytest
+
+import infra.config as config
+from scoring import dense_scoring
+
+
+@pytest.fixture
+def chat_thresholds(monkeypatch):
+    monkeypatch.setattr(config, "CHUNK_DURATION_SECONDS", 40)
+    monkeypatch.setattr(config, "MIN_CHAT_MESSAGES_PER_CHUNK", 8)
+    monkeypatch.setattr(config, "MIN_CHAT_ACTIVE_SECONDS_PER_CHUNK", 4)
+
+
+def test_window_starts_cover_the_tail():
+    assert dense_scoring.window_starts(25, 10, 5).tolist() == [0, 5, 10, 15]
+    assert dense_scoring.window_starts(27, 10, 5).tolist() == [0, 5, 10, 15, 17]
+    assert dense_scoring.window_starts(4, 10, 5).tolist() == [0]
+
+
+def test_score_windows_match_brute_force(chat_thresholds):
+    rng = np.random.default_rng(0)
+    n = 53
+    scores = {
+        "phase1": rng.random(n) * 0.5,
+        "chat": rng.random(n) * 0.3,
+        "messages": rng.integers(0, 3, n).astype(float),
+    }
+
+    starts, ends, window_score = dense_scoring.score_windows(scores, 10, 3)
+
+    for start, end, score in zip(starts, ends, window_score):
+        window = slice(start, end)
+        messages = scores["messages"][window]
+        significant = messages.sum() >= 2 and np.count_nonzero(messages) >= 1
+        expected = scores["phase1"][window].mean()
+        if significant:
+            expected += scores["chat"][window].mean()
+
+        assert end - start == 10
+        assert score == pytest.approx(min(1.0, expected))
+
+
+def test_chat_gate_scales_with_the_window_length(chat_thresholds):
+    # 10s windows need a quarter of the per-chunk chat activity
+    messages = np.zeros(20)
+    messages[[1, 3]] = 1.0
+    scores = {"phase1": np.zeros(20), "chat": np.full(20, 0.5), "messages": messages}
+
+    _, _, window_score = dense_scoring.score_windows(scores, 10, 10)
+
+    assert window_score.tolist() == [0.5, 0.0]
+
+
+def test_build_dense_scores_spreads_chunk_scores(monkeypatch, tmp_path):
+    chunks = [
+        {"chunk_id": 0, "start_time": 0.0, "end_time": 3.0, "audio_score": 0.2, "text_score": 0.4},
+        {"chunk_id": 1, "start_time": 3.0, "end_time": 4.5, "audio_score": 0.6, "text_score": 0.0},
+    ]
+    (tmp_path / "chunks.json").write_text(json.dumps(chunks), encoding="utf-8")
+
+    monkeypatch.setattr(config, "CHUNKS_DIR", tmp_path)
+    monkeypatch.setattr(config, "ENABLE_CHAT_INFLUENCE", False)
+    monkeypatch.setattr(config, "AUDIO_WEIGHT", 0.5)
+    monkeypatch.setattr(config, "TEXT_WEIGHT", 0.5)
+    for name in ("ONSET_WEIGHT", "SPECTRAL_FLUX_WEIGHT", "SPECTRAL_CENTROID_WEIGHT"):
+        monkeypatch.setattr(config, name, 0.0)
+
+    monkeypatch.setattr(dense_scoring, "HIGHLIGHTS_DIR", tmp_path)
+    monkeypatch.setattr(dense_scoring, "DENSE_SCORES_PATH", tmp_path / "dense_scores.npz")
+    monkeypatch.setattr(dense_scoring, "audio_scores_per_second", lambda: None)
+    monkeypatch.setattr(dense_scoring, "text_scores_per_second", lambda: np.ones(8))
+
+    scores = dense_scoring.build_dense_scores(logging.getLogger("test"), chat_weight=1.0)
+
+    assert scores["audio"].tolist() == [0.2, 0.2, 0.2, 0.6, 0.6]
+    assert scores["text"].tolist() == [1.0] * 5
+    assert scores["phase1"] == pytest.approx([0.6, 0.6, 0.6, 0.8, 0.8])
+    assert not scores["chat"].any()
+
+    with np.load(tmp_path / "dense_scores.npz") as saved:
+        assert np.array_equal(saved["phase1"], scores["phase1"])
@@ -0,0 +1,40 @@
+import random
+
+from processing.keyword_matcher import KeywordGroups, KeywordMatcher
+
+
+def test_counts_match_str_count():
+    phrases = ["what", "wait what", "no way", "aa", "a", "let's go", "go"]
+    matcher = KeywordMatcher(phrases)
+
+    rng = random.Random(0)
+    alphabet = "aw h tgo'lesnyi"
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        text += " wait what no way aaa let's go"
+
+        assert matcher.count(text) == [text.count(p) for p in phrases]
+        assert matcher.present(text) == [
+            i for i, p in enumerate(phrases) if p in text
+        ]
+
+        counts = [0] * len(phrases)
+        for start, end, index in matcher.occurrences(text):
+            assert text[start:end] == phrases[index]
+            counts[index] += 1
+        assert counts == matcher.count(text)
+
+
+def test_word_boundary():
+    matcher = KeywordMatcher(["what", "no way", "what?"], word_boundary=True)
+
+    assert matcher.count("whatever, what? nowhere no way!") == [1, 1, 1]
+    assert matcher.count("somewhat noway what?!") == [1, 0, 1]
+    assert matcher.present("somewhat noway") == []
+
+
+def test_groups_share_phrases():
+    groups = KeywordGroups({"hype": ["lets go", "go"], "shock": ["go"]})
+
+    assert groups.count_groups("lets go go") == {"hype": 3, "shock": 2}
+    assert groups.present_phrases("ok lets go") == {"lets go", "go"}
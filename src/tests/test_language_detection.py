@@ -0,0 +1,62 @@
+import logging
+
+import numpy as np
+import pytest
+
+import infra.config as config
+from processing import language_detection
+
+
+class FakeBackend:
+    def __init__(self, votes):
+        self.votes = list(votes)
+
+    def detect_language(self, sample):
+        return self.votes.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def language_path(monkeypatch, tmp_path):
+    path = tmp_path / "language.json"
+    monkeypatch.setattr(language_detection, "LANGUAGE_PATH", path)
+    monkeypatch.setattr(config, "TRANSCRIPTION_LANGUAGE", "auto")
+    return path
+
+
+@pytest.mark.parametrize("setting, expected", [("auto", None), ("", None), (None, None), ("de", "de")])
+def test_configured_language(monkeypatch, setting, expected):
+    monkeypatch.setattr(config, "TRANSCRIPTION_LANGUAGE", setting)
+    assert language_detection.configured_language() == expected
+
+
+def test_detection_sums_probabilities_and_is_cached_for_resume():
+    logger = logging.getLogger("test")
+    backend = FakeBackend([("en", 0.6), ("de", 0.9), ("en", 0.5)])
+    samples = [np.ones(10), np.ones(10), np.zeros(0), np.ones(10)]
+
+    assert language_detection.detect_language(backend, samples, logger) == "en"
+
+    assert language_detection.known_language(logger, resume=False) is None
+    assert language_detection.known_language(logger, resume=True) == "en"
+
+
+def test_config_wins_over_the_cached_language(monkeypatch):
+    language_detection.write_language("en")
+    monkeypatch.setattr(config, "TRANSCRIPTION_LANGUAGE", "fr")
+
+    assert language_detection.known_language(logging.getLogger("test"), resume=True) == "fr"
+
+
+def test_no_speech_leaves_detection_to_whisper(language_path):
+    backend = FakeBackend([])
+
+    assert language_detection.detect_language(backend, [np.zeros(0)], logging.getLogger("test")) is None
+    assert not language_path.exists()
+
+
+def test_speech_heavy_windows_keep_vod_order():
+    regions = [(0.0, 5.0), (31.0, 59.0), (61.0, 80.0), (95.0, 100.0)]
+
+    windows = language_detection.speech_heavy_windows(regions, 100.0, 2)
+
+    assert windows == [[(31.0, 59.0)], [(61.0, 80.0)]]
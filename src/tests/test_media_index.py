@@ -0,0 +1,51 @@
+import logging
+
+import numpy as np
+
+from processing import media_index
+from processing.media_index import KeyframeIndex
+
+
+def test_segment_boundaries_cut_on_keyframes():
+    index = KeyframeIndex([0.0, 4.0, 8.0, 10.5, 13.0, 21.0, 29.0], duration=30.0)
+
+    # Each cut is the first keyframe at or past the next multiple of 10s
+    assert index.segment_boundaries(10.0) == [0.0, 10.5, 21.0]
+
+
+def test_segment_boundaries_advance_past_long_gops():
+    # One keyframe covers several nominal segments; it is used once
+    index = KeyframeIndex([0.0, 25.0, 27.0], duration=40.0)
+    assert index.segment_boundaries(10.0) == [0.0, 25.0, 27.0]
+
+
+def test_segment_boundaries_without_keyframes_follow_the_grid():
+    index = KeyframeIndex([], duration=25.0)
+    assert index.segment_boundaries(10.0) == [0.0, 10.0, 20.0]
+
+
+def test_keyframe_lookups():
+    index = KeyframeIndex([0.0, 2.0, 4.0], duration=5.0)
+
+    assert index.keyframe_at_or_before(3.9) == 2.0
+    assert index.keyframe_at_or_before(4.0) == 4.0
+    assert index.keyframe_at_or_after(2.1) == 4.0
+    assert index.keyframe_at_or_after(4.5) == 5.0
+
+
+def test_load_keyframe_index_uses_the_cached_index(monkeypatch, tmp_path):
+    monkeypatch.setattr(media_index, "KEYFRAME_INDEX_DIR", tmp_path)
+    monkeypatch.setattr(media_index, "input_fingerprint", lambda path: "abc")
+
+    def no_probe(*args):
+        raise AssertionError("cached index should not be probed")
+
+    monkeypatch.setattr(media_index, "_probe_keyframes", no_probe)
+    monkeypatch.setattr(media_index, "probe_duration_seconds", no_probe)
+
+    np.savez(tmp_path / "abc.npz", keyframes=np.array([0.0, 2.0]), duration=np.float64(3.0))
+
+    index = media_index.load_keyframe_index("input.mp4", logging.getLogger("test"))
+
+    assert index.keyframes.tolist() == [0.0, 2.0]
+    assert index.duration == 3.0
@@ -0,0 +1,43 @@
+import json
+
+from processing.chat.raw_chat_reader import iter_raw_comments
+
+
+def _write(tmp_path, payload, **dump_kwargs):
+    path = tmp_path / "chat.json"
+    path.write_text(json.dumps(payload, **dump_kwargs), encoding="utf-8")
+    return path
+
+
+def test_streams_comments_across_block_boundaries(tmp_path):
+    comments = [
+        {
+            "content_offset_seconds": i * 1.5,
+            "commenter": {"name": f"user{i}"},
+            "message": {"body": f"msg {i} ✨ \"quoted\" [x] {{y}}", "emotes": []},
+        }
+        for i in range(200)
+    ]
+    payload = {
+        "FileInfo": {"Version": 1},
+        "video": {"id": "123", "length": 3600},
+        "comments": comments,
+        "embeddedData": {"emotes": ["x" * 5000]},
+    }
+
+    for kwargs in ({}, {"indent": 2}, {"ensure_ascii": False}):
+        path = _write(tmp_path, payload, **kwargs)
+
+        for block_chars in (7, 64, 1 << 20):
+            header = {}
+            streamed = list(iter_raw_comments(path, header, block_chars=block_chars))
+
+            assert streamed == comments
+            assert header == {"FileInfo": {"Version": 1}, "video": {"id": "123", "length": 3600}}
+
+
+def test_missing_or_empty_comments(tmp_path):
+    assert list(iter_raw_comments(_write(tmp_path, {"video": {"id": 1}}))) == []
+    assert list(iter_raw_comments(_write(tmp_path, {"comments": []}))) == []
+    assert list(iter_raw_comments(_write(tmp_path, {"comments": None}))) == []
+    assert list(iter_raw_comments(_write(tmp_path, {}))) == []
@@ -0,0 +1,24 @@
+from pipeline import reset
+
+
+def test_reset_keeps_the_fingerprinted_audio_store(monkeypatch, tmp_path):
+    audio_dir = tmp_path / "audio"
+    chunks_dir = tmp_path / "chunks"
+    store_path = audio_dir / "audio.pcm"
+    index_path = audio_dir / "audio_index.json"
+
+    monkeypatch.setattr(reset, "DERIVED_DIRS", [chunks_dir, audio_dir])
+    monkeypatch.setattr(reset, "FINGERPRINTED_FILES", [store_path, index_path])
+
+    (audio_dir / "speech").mkdir(parents=True)
+    chunks_dir.mkdir()
+    for path in (store_path, index_path, audio_dir / "envelope.npz", chunks_dir / "chunk_0000.mp4"):
+        path.write_bytes(b"x")
+
+    reset.reset_derived_state(resume=True)
+    assert (audio_dir / "envelope.npz").exists()
+
+    reset.reset_derived_state(resume=False)
+
+    assert sorted(p.name for p in audio_dir.iterdir()) == ["audio.pcm", "audio_index.json"]
+    assert not chunks_dir.exists()
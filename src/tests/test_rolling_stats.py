@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from processing.rolling_stats import (
+    ALIGNMENTS,
+    ratio_to_baseline,
+    rolling_max,
+    rolling_mean,
+    rolling_sum,
+)
+
+
+def _windows(n, window, align):
+    offset = {"trailing": window - 1, "causal": window, "centered": window // 2}[align]
+    for t in range(n):
+        start = t - offset
+        yield slice(max(start, 0), max(min(start + window, n), 0))
+
+
+@pytest.mark.parametrize("align", ALIGNMENTS)
+@pytest.mark.parametrize("window", [1, 2, 3, 30])
+def test_matches_brute_force(align, window):
+    values = np.random.default_rng(0).integers(0, 10, 41).astype(float)
+    windows = [values[s] for s in _windows(len(values), window, align)]
+
+    assert np.allclose(rolling_sum(values, window, align), [w.sum() for w in windows])
+    assert np.allclose(
+        rolling_mean(values, window, align),
+        [w.mean() if len(w) else 0.0 for w in windows],
+    )
+    assert np.array_equal(
+        rolling_max(values, window, align),
+        [w.max() if len(w) else -np.inf for w in windows],
+    )
+
+
+def test_ratio_to_baseline_masks_low_baselines():
+    ratio = ratio_to_baseline([2.0, 3.0, 4.0], [1.0, 0.05, 0.0], min_baseline=0.1)
+    assert ratio.tolist() == [2.0, 0.0, 0.0]
+
+
+def test_rejects_bad_windows():
+    with pytest.raises(ValueError):
+        rolling_sum(np.ones(3), 0)
+    with pytest.raises(ValueError):
+        rolling_mean(np.ones(3), 2, "forward")
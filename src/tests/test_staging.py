@@ -0,0 +1,59 @@
+import logging
+
+import pytest
+
+from infra import staging
+from infra.fingerprint import file_fingerprint
+
+
+@pytest.fixture
+def source(monkeypatch, tmp_path):
+    monkeypatch.setattr(staging, "INPUT_DIR", tmp_path / "input")
+
+    path = tmp_path / "vod.MP4"
+    path.write_bytes(b"video bytes")
+    return path
+
+
+def _unavailable(source, target):
+    raise OSError("unavailable")
+
+
+def test_stages_via_hardlink_under_the_fingerprint(source):
+    staged = staging.stage_input(source, logging.getLogger("test"))
+
+    assert staged == staging.INPUT_DIR / f"{file_fingerprint(source)}.mp4"
+    assert staged.stat().st_ino == source.stat().st_ino
+    assert staging.input_fingerprint(staged) == staged.stem
+
+
+def test_falls_back_to_a_copy_before_a_symlink(monkeypatch, source):
+    monkeypatch.setattr(staging, "_hardlink", _unavailable)
+    monkeypatch.setattr(staging, "_reflink", _unavailable)
+
+    staged = staging.stage_input(source, logging.getLogger("test"))
+
+    assert not staged.is_symlink()
+    assert staged.stat().st_ino != source.stat().st_ino
+    assert staged.read_bytes() == b"video bytes"
+    assert not list(staging.INPUT_DIR.glob("*.partial"))
+
+
+def test_symlink_is_the_last_resort(monkeypatch, source):
+    for method in ("_hardlink", "_reflink", "_streamed_copy"):
+        monkeypatch.setattr(staging, method, _unavailable)
+
+    staged = staging.stage_input(source, logging.getLogger("test"))
+
+    assert staged.is_symlink()
+    assert staged.resolve() == source.resolve()
+
+
+def test_restaging_is_a_no_op(monkeypatch, source):
+    logger = logging.getLogger("test")
+    staged = staging.stage_input(source, logger)
+
+    for method in ("_hardlink", "_reflink", "_streamed_copy", "_symlink"):
+        monkeypatch.setattr(staging, method, _unavailable)
+
+    assert staging.stage_input(source, logger) == staged
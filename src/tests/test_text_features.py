@@ -0,0 +1,123 @@
+import json
+import logging
+
+import numpy as np
+import pytest
+
+from processing.keyword_matcher import KeywordGroups
+from scoring import text_features
+
+
+@pytest.fixture
+def groups():
+    return KeywordGroups({
+        "hype": ["lets go"],
+        "sentiment.positive": ["nice"],
+        "sentiment.negative": ["bad"],
+    })
+
+
+def _weights(groups):
+    return groups.phrase_weights(
+        {"hype": 1.0, "sentiment.positive": 1.0, "sentiment.negative": -1.0}
+    )
+
+
+def test_segment_hits_span_the_segment_without_words(groups):
+    segment = {"start": 10.0, "end": 12.0, "text": " Lets go, nice and bad"}
+
+    assert list(text_features.segment_hits(segment, groups, _weights(groups))) == [
+        (10.0, 12.0, 1.0),
+        (10.0, 12.0, 1.0),
+        (10.0, 12.0, -1.0),
+    ]
+
+
+def test_segment_hits_span_their_words(groups):
+    segment = {
+        "start": 10.0,
+        "end": 12.0,
+        "text": " Lets go so nice",
+        "words": [
+            {"word": " Lets", "start": 10.0, "end": 10.4},
+            {"word": " go", "start": 10.4, "end": 10.6},
+            {"word": " so", "start": 10.6, "end": 11.0},
+            {"word": " nice", "start": 11.5, "end": 12.0},
+        ],
+    }
+
+    assert list(text_features.segment_hits(segment, groups, _weights(groups))) == [
+        (10.0, 10.6, 1.0),
+        (11.5, 12.0, 1.0),
+    ]
+
+
+def test_spread_hits_splits_partial_seconds():
+    hits = [
+        (0.5, 2.5, 2.0),   # half a second, a full second, half a second
+        (1.2, 1.7, -1.0),  # negative sentiment inside one second
+        (3.0, 3.0, 1.0),   # zero length
+        (3.5, 10.0, 1.0),  # clipped to the VOD end
+    ]
+
+    assert text_features.spread_hits(hits, 4) == pytest.approx([0.5, 0.0, 0.5, 2.0])
+    assert text_features.spread_hits([], 4).tolist() == [0.0] * 4
+
+
+def test_text_scores_are_scaled_clipped_and_saved(monkeypatch, tmp_path):
+    path = tmp_path / "text_scores_per_second.npz"
+    monkeypatch.setattr(text_features, "TEXT_SCORES_PATH", path)
+
+    hits = [(0.0, 1.0, 2.0), (1.0, 2.0, -1.0), (2.0, 3.0, 1.0)]
+    score = text_features.write_text_scores_per_second(hits, 4)
+
+    scale = np.percentile([2.0, 1.0], text_features.TEXT_SCORE_PERCENTILE)
+    assert score == pytest.approx([1.0, 0.0, 1.0 / scale, 0.0])
+
+    with np.load(path) as data:
+        assert data["raw"].tolist() == [2.0, -1.0, 1.0, 0.0]
+        assert np.array_equal(data["score"], score)
+    assert np.array_equal(text_features.text_scores_per_second(), score)
+
+    # Only negative sentiment: nothing to scale by
+    assert text_features.write_text_scores_per_second([(0.0, 1.0, -1.0)], 2).tolist() == [0.0, 0.0]
+
+
+def test_keyword_hits_are_placed_in_vod_time(monkeypatch, tmp_path):
+    keywords_path = tmp_path / "keywords.json"
+    keywords_path.write_text(json.dumps({
+        "hype": ["lets go"],
+        "sentiment": {"positive": ["nice"], "negative": ["bad"]},
+    }), encoding="utf-8")
+
+    transcripts_dir = tmp_path / "transcripts"
+    transcripts_dir.mkdir()
+    for stem, segments in (
+        ("chunk_0000", [{"start": 1.0, "end": 2.0, "text": "lets go"}]),
+        ("chunk_0001", [{"start": 0.0, "end": 1.0, "text": "nice"}]),
+    ):
+        (transcripts_dir / f"{stem}.json").write_text(json.dumps({
+            "text": " ".join(s["text"] for s in segments),
+            "segments": segments,
+        }), encoding="utf-8")
+
+    chunks_dir = tmp_path / "chunks"
+    chunks_dir.mkdir()
+    (chunks_dir / "chunks.json").write_text(json.dumps([
+        {"file": "chunk_0000.mp4", "start_time": 0.0, "end_time": 3.0},
+        {"file": "chunk_0001.mp4", "start_time": 3.0, "end_time": 5.5},
+    ]), encoding="utf-8")
+
+    monkeypatch.setattr(text_features, "KEYWORDS_PATH", keywords_path)
+    monkeypatch.setattr(text_features, "TRANSCRIPTS_DIR", transcripts_dir)
+    monkeypatch.setattr(text_features, "CHUNKS_DIR", chunks_dir)
+    monkeypatch.setattr(text_features, "TEXT_FEATURES_PATH", tmp_path / "text_features.json")
+    monkeypatch.setattr(text_features, "TEXT_SCORES_PATH", tmp_path / "text_scores_per_second.npz")
+
+    features = text_features.count_keyword_hits_per_chunk(logging.getLogger("test"))
+
+    assert features["chunk_0000"]["keyword_counts"] == {"hype": 1}
+    assert features["chunk_0001"]["sentiment"]["positive_hits"] == 1
+
+    with np.load(tmp_path / "text_scores_per_second.npz") as data:
+        assert data["raw"].tolist() == [0.0, 1.0, 0.0, 1.0, 0.0, 0.0]
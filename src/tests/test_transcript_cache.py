@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+import pytest
+
+import infra.config as config
+from processing import transcript_cache
+
+
+class FakeBackend:
+    cache_tag = "fake:tiny"
+
+    def __init__(self):
+        self.calls = 0
+        self.options = {"beam_size": 1}
+
+    def decode_options(self):
+        return self.options
+
+    def transcribe(self, audio, language=None):
+        self.calls += 1
+        return {"text": f"call {self.calls}", "language": language}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "TRANSCRIPT_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(config, "TRANSCRIPT_CACHE_ENABLED", True)
+    monkeypatch.setattr(transcript_cache, "_cache_bytes", None)
+    return tmp_path
+
+
+def test_key_covers_audio_language_and_options():
+    audio = np.zeros(160, dtype=np.float32)
+    key = transcript_cache.transcript_key(audio, "fake", "en", {"beam_size": 1})
+
+    assert key == transcript_cache.transcript_key(audio.astype(np.float64), "fake", "en", {"beam_size": 1})
+    assert key != transcript_cache.transcript_key(audio + 1e-3, "fake", "en", {"beam_size": 1})
+    assert key != transcript_cache.transcript_key(audio, "fake", "de", {"beam_size": 1})
+    assert key != transcript_cache.transcript_key(audio, "fake", "en", {"beam_size": 5})
+
+
+def test_hits_skip_the_backend():
+    backend = FakeBackend()
+    audio = np.ones(160, dtype=np.float32)
+
+    assert transcript_cache.transcribe_with_cache(backend, audio, "en") == (
+        {"text": "call 1", "language": "en"},
+        False,
+    )
+    assert transcript_cache.transcribe_with_cache(backend, audio, "en") == (
+        {"text": "call 1", "language": "en"},
+        True,
+    )
+
+    backend.options = {"beam_size": 5}
+    assert transcript_cache.cached_transcribe(backend, audio, "en")["text"] == "call 2"
+
+
+def test_disabled_cache_always_transcribes(monkeypatch, cache_dir):
+    monkeypatch.setattr(config, "TRANSCRIPT_CACHE_ENABLED", False)
+    backend = FakeBackend()
+    audio = np.ones(160, dtype=np.float32)
+
+    transcript_cache.cached_transcribe(backend, audio)
+    transcript_cache.cached_transcribe(backend, audio)
+
+    assert backend.calls == 2
+    assert not list(cache_dir.iterdir())
+
+
+def test_eviction_removes_least_recently_used_entries(cache_dir):
+    for i in range(10):
+        transcript_cache.put_cached(f"k{i}", {"text": "x" * 90})
+        os.utime(cache_dir / f"k{i}.json", (i, i))
+
+    # A hit refreshes recency
+    assert transcript_cache.get_cached("k0") is not None
+
+    entry_bytes = (cache_dir / "k0.json").stat().st_size
+    removed = transcript_cache.evict_transcript_cache(8 * entry_bytes, 5 * entry_bytes)
+
+    assert removed == 5
+    assert sorted(p.stem for p in cache_dir.iterdir()) == ["k0", "k6", "k7", "k8", "k9"]
+    assert transcript_cache.transcript_cache_size() == 5 * entry_bytes
+    assert transcript_cache._cache_bytes == 5 * entry_bytes
+
+
+def test_put_evicts_once_over_the_limit(monkeypatch, cache_dir):
+    entry_bytes = len('{"text": "xxxx"}')
+    monkeypatch.setattr(config, "TRANSCRIPT_CACHE_MAX_MB", 10 * entry_bytes / (1024 * 1024))
+
+    for i in range(11):
+        transcript_cache.put_cached(f"k{i:02d}", {"text": "xxxx"})
+        os.utime(cache_dir / f"k{i:02d}.json", (i, i))
+
+    # Trimmed to EVICT_TARGET_RATIO of the limit
+    assert len(list(cache_dir.iterdir())) == 9
+    assert not (cache_dir / "k00.json").exists()
@@ -0,0 +1,69 @@
+import json
+import logging
+
+import pytest
+
+import infra.config as config
+from processing import transcript_refiner
+
+
+@pytest.fixture
+def dirs(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "CHUNKS_DIR", tmp_path / "chunks")
+    monkeypatch.setattr(config, "TRANSCRIPTS_DIR", tmp_path / "transcripts")
+    monkeypatch.setattr(transcript_refiner, "FAST_TRANSCRIPTS_DIR", tmp_path / "transcripts" / "fast")
+    config.CHUNKS_DIR.mkdir()
+    config.TRANSCRIPTS_DIR.mkdir()
+    return tmp_path
+
+
+def test_candidate_spans_are_buffered_and_merged(monkeypatch, dirs):
+    monkeypatch.setattr(config, "PRE_BUFFER_SECONDS", 5)
+    monkeypatch.setattr(config, "POST_BUFFER_SECONDS", 10)
+
+    chunks = [
+        {"start_time": 0.0, "end_time": 10.0, "is_highlight": True},
+        {"start_time": 10.0, "end_time": 20.0},
+        {"start_time": 22.0, "end_time": 30.0, "is_highlight": True},
+        {"start_time": 60.0, "end_time": 70.0, "is_highlight": True},
+        {"start_time": 90.0, "end_time": 98.0, "is_highlight": True},
+    ]
+    (config.CHUNKS_DIR / "chunks.json").write_text(json.dumps(chunks), encoding="utf-8")
+
+    assert transcript_refiner.candidate_spans(100.0) == [
+        (0.0, 40.0),
+        (55.0, 80.0),
+        (85.0, 100.0),
+    ]
+
+
+def test_candidate_spans_need_chunks(dirs):
+    with pytest.raises(RuntimeError):
+        transcript_refiner.candidate_spans(100.0)
+
+
+def test_fast_segments_inside_refined_spans_are_dropped(dirs):
+    transcript = {
+        "language": "en",
+        "segments": [
+            {"start": 1.0, "end": 2.0, "text": "kept", "language": "en"},
+            {"start": 4.0, "end": 8.0, "text": "refined"},
+        ],
+    }
+    (config.TRANSCRIPTS_DIR / "chunk_0001.json").write_text(json.dumps(transcript), encoding="utf-8")
+
+    kept = transcript_refiner._fast_segments_outside(
+        {"chunk_0000": (0.0, 10.0), "chunk_0001": (10.0, 20.0)}, [(14.0, 30.0)]
+    )
+
+    assert kept == [{"language": "en", "segments": [{"start": 11.0, "end": 12.0, "text": "kept"}]}]
+
+    # The fast tier is preserved before the chunk transcript is overwritten
+    (config.TRANSCRIPTS_DIR / "chunk_0001.json").write_text("{}", encoding="utf-8")
+    fast = transcript_refiner._load_fast_transcript("chunk_0001")
+    assert fast == transcript
+
+
+def test_refinement_is_off_without_the_cascade(monkeypatch):
+    monkeypatch.setattr(config, "TRANSCRIPTION_CASCADE", False)
+    assert transcript_refiner.refine_highlight_transcripts(logging.getLogger("test")) is False
@@ -0,0 +1,58 @@
+import logging
+
+import pytest
+
+import infra.config as config
+from processing import transcription_pool
+
+
+@pytest.fixture
+def cores(monkeypatch):
+    monkeypatch.setattr(transcription_pool, "physical_cpu_count", lambda: 16)
+    monkeypatch.setattr(config, "TRANSCRIPTION_WORKERS", 0)
+    monkeypatch.setattr(config, "TRANSCRIPTION_THREADS_PER_WORKER", 0)
+    monkeypatch.setattr(config, "TRANSCRIPTION_CPU_THREADS", 0)
+
+
+def test_auto_layout_splits_physical_cores(cores):
+    assert transcription_pool.pool_layout() == (4, 4)
+
+
+def test_layout_threads_fall_back_to_cpu_threads(monkeypatch, cores):
+    monkeypatch.setattr(config, "TRANSCRIPTION_CPU_THREADS", 8)
+    assert transcription_pool.pool_layout() == (2, 8)
+
+    monkeypatch.setattr(config, "TRANSCRIPTION_THREADS_PER_WORKER", 2)
+    monkeypatch.setattr(config, "TRANSCRIPTION_WORKERS", 3)
+    assert transcription_pool.pool_layout() == (3, 2)
+
+
+def test_single_worker_means_no_pool(monkeypatch, cores):
+    monkeypatch.setattr(config, "TRANSCRIPTION_WORKERS", 1)
+    assert transcription_pool.open_pool(logging.getLogger("test")) is None
+
+
+def test_workers_receive_the_runtime_config(monkeypatch):
+    monkeypatch.setattr(config, "WHISPER_MODEL_NAME", "preset-model")
+    monkeypatch.setattr(config, "TRANSCRIPTION_CPU_THREADS", 0)
+
+    settings = transcription_pool._worker_settings()
+    assert settings["WHISPER_MODEL_NAME"] == "preset-model"
+    assert all(name.isupper() for name in settings)
+
+    loaded = []
+
+    class FakeBackend:
+        def load(self):
+            loaded.append(config.TRANSCRIPTION_CPU_THREADS)
+
+    monkeypatch.setattr(
+        transcription_pool, "build_local_backend", lambda logger, backend, model: FakeBackend()
+    )
+    monkeypatch.setattr(transcription_pool, "_worker_backend", None)
+    monkeypatch.setattr(config, "WHISPER_MODEL_NAME", "module-default")
+
+    transcription_pool._init_worker("openai-whisper", "preset-model", 3, settings)
+
+    assert config.WHISPER_MODEL_NAME == "preset-model"
+    assert loaded == [3]
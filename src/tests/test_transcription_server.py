@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import infra.config as config
+from processing import transcription_server
+from processing.asr_backends import BACKENDS
+
+
+class StubBackend:
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def load(self):
+        pass
+
+    def transcribe(self, audio, language=None):
+        if len(audio) == 0:
+            raise ValueError("no audio")
+        return {"text": f"{len(audio)} samples", "segments": [], "language": language}
+
+    def detect_language(self, audio):
+        return "en", 0.9
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "TRANSCRIPTION_SERVER_KEY_PATH", tmp_path / "server.key")
+    monkeypatch.setattr(config, "TRANSCRIPTION_SERVER_PORT", 0)
+    monkeypatch.setattr(
+        transcription_server,
+        "build_local_backend",
+        lambda logger, name, model: StubBackend(model),
+    )
+
+    server = transcription_server.TranscriptionServer(logging.getLogger("test"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 5
+    while server.address is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Clients connect to the ephemeral port the listener got
+    monkeypatch.setattr(config, "TRANSCRIPTION_SERVER_PORT", server.address[1])
+
+    yield server, thread
+
+    server._shutdown()
+
+
+def _remote(conn, backend="openai-whisper"):
+    return transcription_server.RemoteBackend(backend, "tiny", logging.getLogger("test"), conn)
+
+
+def test_transcribe_and_detect_language(server):
+    conn = transcription_server.connect(timeout=2.0)
+    remote = _remote(conn)
+
+    assert remote.server_decode_options() == BACKENDS["openai-whisper"].decode_options()
+    assert remote.transcribe(np.zeros(160, dtype=np.float32), "de") == {
+        "text": "160 samples",
+        "segments": [],
+        "language": "de",
+    }
+    assert remote.detect_language(np.zeros(160)) == ("en", 0.9)
+
+    # A failing request is reported without taking the server down
+    with pytest.raises(RuntimeError, match="no audio"):
+        remote.transcribe(np.zeros(0, dtype=np.float32))
+    assert remote.transcribe(np.zeros(8, dtype=np.float32))["text"] == "8 samples"
+
+    conn.close()
+
+
+def test_mismatched_decode_options_are_refused(server):
+    conn = transcription_server.connect(timeout=2.0)
+
+    conn.send({
+        "op": "transcribe",
+        "backend": "openai-whisper",
+        "model": "tiny",
+        "audio": np.zeros(160, dtype=np.float32),
+        "decode_options": {"fp16": True},
+    })
+    reply = conn.recv()
+
+    assert not reply["ok"] and "Decode options differ" in reply["error"]
+    conn.close()
+
+
+def test_malformed_requests_get_an_error_reply(server):
+    conn = transcription_server.connect(timeout=2.0)
+
+    conn.send("transcribe please")
+    assert not conn.recv()["ok"]
+
+    conn.send({"op": "transcribe", "backend": "openai-whisper"})
+    assert not conn.recv()["ok"]
+
+    # Not a pickle at all: the connection stays usable
+    conn.send_bytes(b"\x00garbage")
+    assert not conn.recv()["ok"]
+
+    conn.send({"op": "ping"})
+    assert conn.recv() == {"ok": True}
+    conn.close()
+
+
+def test_shutdown_stops_the_server(server):
+    _, thread = server
+    conn = transcription_server.connect(timeout=2.0)
+
+    conn.send({"op": "shutdown"})
+    assert conn.recv() == {"ok": True}
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert transcription_server.connect(timeout=0.5) is None
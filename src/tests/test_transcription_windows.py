@@ -0,0 +1,98 @@
+import json
+import logging
+
+import numpy as np
+
+import infra.config as config
+from processing import transcription_windows
+from processing.transcription_windows import TranscriptionWindower
+
+
+class FakeStore:
+    sample_rate = 100
+
+    def time_range_float(self, start, end):
+        return np.arange(int(start * 100), int(end * 100), dtype=np.float32)
+
+
+class FakeBackend:
+    cache_tag = "fake"
+
+    def __init__(self, segments):
+        self.segments = segments
+        self.calls = []
+
+    def decode_options(self):
+        return {}
+
+    def transcribe(self, audio, language=None):
+        self.calls.append((audio, language))
+        return {"language": "en", "segments": self.segments}
+
+
+def test_windower_packs_spans_into_windows():
+    windower = TranscriptionWindower(30)
+
+    # Nearly touching spans are joined
+    assert windower.feed([(0.0, 10.0), (10.02, 25.0)]) == []
+
+    # A span that does not fit a half-full window starts the next one
+    assert windower.feed([(26.0, 36.0)]) == [[(0.0, 25.0)]]
+
+    # Spans longer than a window are split at the window edge
+    assert windower.feed([(40.0, 75.0)]) == [[(26.0, 36.0), (40.0, 60.0)]]
+    assert windower.finish() == [[(60.0, 75.0)]]
+    assert windower.finish() == []
+
+
+def test_windower_splits_spans_into_mostly_empty_windows():
+    windower = TranscriptionWindower(30)
+
+    assert windower.feed([(0.0, 10.0), (20.0, 45.0)]) == [[(0.0, 10.0), (20.0, 40.0)]]
+    assert windower.finish() == [[(40.0, 45.0)]]
+
+
+def test_transcribe_window_maps_segments_to_vod_time(monkeypatch):
+    monkeypatch.setattr(config, "TRANSCRIPT_CACHE_ENABLED", False)
+    backend = FakeBackend([{"start": 0.5, "end": 1.5, "text": "hi"}])
+
+    window_data = transcription_windows.transcribe_window(
+        backend, FakeStore(), [(1.0, 2.0), (5.0, 6.0)], logging.getLogger("test"), "en"
+    )
+
+    audio, language = backend.calls[0]
+    assert len(audio) == 200 and language == "en"
+    assert window_data["language"] == "en"
+    assert window_data["segments"] == [{"start": 1.5, "end": 5.5, "text": "hi"}]
+
+
+def test_write_chunk_transcripts_assigns_segments_by_midpoint(monkeypatch, tmp_path):
+    monkeypatch.setattr(transcription_windows, "TRANSCRIPTS_DIR", tmp_path)
+    monkeypatch.setattr(transcription_windows, "SEGMENTS_PATH", tmp_path / "segments.json")
+
+    windows_data = [{
+        "spans": [(0.0, 20.0)],
+        "language": "en",
+        "segments": [
+            {"start": 15.0, "end": 16.0, "text": "late"},
+            {"start": 1.0, "end": 3.0, "text": " hi"},
+            {"start": 9.0, "end": 12.0, "text": "edge"},
+        ],
+    }]
+
+    results = transcription_windows.write_chunk_transcripts(
+        {"chunk_0000": (0.0, 10.0), "chunk_0001": (10.0, 20.0)}, windows_data
+    )
+
+    assert results["chunk_0000"]["text"] == "hi"
+    assert results["chunk_0001"]["text"] == "edge late"
+    assert [(s["start"], s["end"]) for s in results["chunk_0001"]["segments"]] == [
+        (0.0, 2.0),
+        (5.0, 6.0),
+    ]
+    assert results["chunk_0001"]["language"] == "en"
+
+    with open(tmp_path / "chunk_0001.json", "r", encoding="utf-8") as f:
+        assert json.load(f) == results["chunk_0001"]
+    with open(tmp_path / "segments.json", "r", encoding="utf-8") as f:
+        assert [s["start"] for s in json.load(f)["segments"]] == [1.0, 9.0, 15.0]
@@ -0,0 +1,89 @@
+import logging
+
+import numpy as np
+import pytest
+
+from processing import audio_rms, vad
+from processing.audio_store import AudioStore
+
+
+def _store(tmp_path, samples, fingerprint="abc"):
+    pcm_path = tmp_path / "audio.pcm"
+    samples.astype(np.int16).tofile(pcm_path)
+    return AudioStore(pcm_path, {
+        "sample_rate": 16000,
+        "total_samples": len(samples),
+        "source_fingerprint": fingerprint,
+        "chunks": {},
+    })
+
+
+def _speech_in_noise(seconds=20, speech=(5, 8)):
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0, 30, 16000 * seconds)
+    samples[16000 * speech[0]:16000 * speech[1]] = rng.normal(0, 3000, 16000 * (speech[1] - speech[0]))
+    return samples
+
+
+def test_regions_from_envelope_pads_and_merges(monkeypatch):
+    monkeypatch.setattr(vad.config, "VAD_PAD_SECONDS", 0.5)
+    monkeypatch.setattr(vad.config, "VAD_MIN_SILENCE_SECONDS", 1.0)
+    monkeypatch.setattr(vad.config, "VAD_MIN_SPEECH_SECONDS", 0.5)
+
+    envelope = np.full(100, 0.001)
+    envelope[10:20] = 0.1   # 1.0 – 2.0 s
+    envelope[25:30] = 0.1   # 2.5 – 3.0 s: gap under a second after padding
+    envelope[80:81] = 0.1   # 8.0 – 8.1 s: padded to 1.1 s, kept
+
+    assert vad.regions_from_envelope(envelope, 0.1, 10.0) == [(0.5, 3.5), (7.5, 8.6)]
+
+
+def test_speech_regions_cache_follows_params_and_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(vad, "SPEECH_REGIONS_PATH", tmp_path / "speech_regions.json")
+    monkeypatch.setattr(audio_rms, "ENVELOPE_PATH", tmp_path / "envelope.npz")
+    logger = logging.getLogger("test")
+
+    store = _store(tmp_path, _speech_in_noise())
+    regions = vad.detect_speech_regions(store, logger, resume=True)
+    assert len(regions) == 1
+    start, end = regions[0]
+    assert 4.5 <= start <= 5.0 and 8.0 <= end <= 8.5
+
+    # Cached file is returned as long as nothing changed
+    vad.SPEECH_REGIONS_PATH.write_text(
+        vad.SPEECH_REGIONS_PATH.read_text().replace(str(end), "9.99")
+    )
+    assert vad.detect_speech_regions(store, logger, resume=True)[0][1] == 9.99
+
+    # Another VAD setting or another input recomputes
+    monkeypatch.setattr(vad.config, "VAD_PAD_SECONDS", 1.0)
+    assert vad.detect_speech_regions(store, logger, resume=True)[0][1] == pytest.approx(end + 0.7)
+
+    other = _store(tmp_path, _speech_in_noise(speech=(10, 12)), fingerprint="other")
+    assert vad.detect_speech_regions(other, logger, resume=True)[0][0] < 10.0
+
+
+def test_gather_and_map_back(tmp_path):
+    store = _store(tmp_path, np.arange(16000 * 4) % 1000)
+    spans = [(0.5, 1.0), (2.0, 3.0)]
+
+    audio, concat_offsets, span_starts = vad.gather_speech(store, spans)
+
+    assert len(audio) == 16000 * 3 // 2
+    assert concat_offsets.tolist() == [0.0, 0.5]
+    assert vad.map_to_source_time(0.25, concat_offsets, span_starts) == 0.75
+    assert vad.map_to_source_time(0.5, concat_offsets, span_starts) == 2.0
+    assert vad.map_to_source_time(0.5, concat_offsets, span_starts, side="left") == 1.0
+    assert vad.speech_spans_in_range(spans, 0.75, 2.5) == [(0.75, 1.0), (2.0, 2.5)]
+
+
+def test_streaming_noise_floor_matches_whole_envelope():
+    rng = np.random.default_rng(1)
+    envelope = np.abs(rng.normal(0.01, 0.02, 5000)).astype(np.float32)
+    envelope[::7] = 0.0
+
+    noise_floor = vad.NoiseFloorEstimator()
+    for piece in np.array_split(envelope, 13):
+        noise_floor.add(piece)
+
+    assert noise_floor.threshold() == vad.speech_threshold(envelope)
@@ -0,0 +1,73 @@
+import json
+import logging
+
+import pytest
+
+from processing import audio_extractor, video_chunker
+from processing.media_index import KeyframeIndex
+
+
+@pytest.fixture
+def planner(monkeypatch, tmp_path):
+    monkeypatch.setattr(video_chunker, "CHUNKS_DIR", tmp_path)
+    monkeypatch.setattr(video_chunker, "CHUNK_DURATION_SECONDS", 10)
+
+    state = {"fingerprint": "abc", "probes": 0}
+
+    def load_index(path, logger):
+        state["probes"] += 1
+        return KeyframeIndex([0.0, 4.0, 10.5, 18.0, 21.0, 26.0], duration=28.0)
+
+    monkeypatch.setattr(video_chunker, "load_keyframe_index", load_index)
+    monkeypatch.setattr(video_chunker, "input_fingerprint", lambda path: state["fingerprint"])
+
+    return state
+
+
+def test_virtual_chunks_start_on_keyframes(planner, tmp_path):
+    source = tmp_path / "vod.mp4"
+    (tmp_path / "chunk_0000.mp4").write_bytes(b"old physical chunk")
+
+    chunks = video_chunker.plan_virtual_chunks(str(source), logging.getLogger("test"))
+
+    assert [(c["start_time"], c["end_time"]) for c in chunks] == [
+        (0.0, 10.5),
+        (10.5, 21.0),
+        (21.0, 28.0),
+    ]
+    assert [c["file"] for c in chunks] == ["chunk_0000", "chunk_0001", "chunk_0002"]
+    assert all(c["virtual"] and c["source"] == str(source.resolve()) for c in chunks)
+    assert not list(tmp_path.glob("chunk_*.mp4"))
+
+    with open(tmp_path / "chunks.json", "r", encoding="utf-8") as f:
+        assert json.load(f) == chunks
+
+
+def test_plan_is_reused_for_the_same_input_only(planner, tmp_path):
+    logger = logging.getLogger("test")
+    source = str(tmp_path / "vod.mp4")
+
+    first = video_chunker.plan_virtual_chunks(source, logger)
+    assert video_chunker.plan_virtual_chunks(source, logger) == first
+    assert planner["probes"] == 1
+
+    planner["fingerprint"] = "def"
+    replanned = video_chunker.plan_virtual_chunks(source, logger)
+
+    assert planner["probes"] == 2
+    assert {c["source_fingerprint"] for c in replanned} == {"def"}
+
+
+def test_virtual_chunks_decode_their_range_of_the_source(planner, monkeypatch, tmp_path):
+    monkeypatch.setattr(audio_extractor, "CHUNKS_DIR", tmp_path)
+
+    source = tmp_path / "vod.mp4"
+    video_chunker.plan_virtual_chunks(str(source), logging.getLogger("test"))
+
+    sources = audio_extractor._chunk_audio_sources()
+
+    assert sources[1] == (
+        "chunk_0001",
+        ["-ss", "10.5", "-t", "10.5", "-i", str(source.resolve())],
+    )
+    assert [stem for stem, _ in sources] == ["chunk_0000", "chunk_0001", "chunk_0002"]
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import traceback
 from enum import Enum
@@ -27,7 +28,10 @@ from PySide6.QtCore import Qt, QThread, Signal
 
 from pipeline.pipeline_runner import run_pipeline_from_ui
 from ui.timeline_inspector import TimelineInspector
+import infra.config as config
 from infra.config import PRESETS_DIR
+from infra.logger import setup_logger
+from processing.transcription_server import start_server_process
 from scoring.presets import load_preset
 from scoring.presets import save_preset
 
@@ -355,10 +359,17 @@ class VODEngineWindow(QMainWindow):
 
 def run():
     app = QApplication(sys.argv)
+
+    # Warm Whisper once per session instead of once per run
+    if config.TRANSCRIPTION_SERVER_ENABLED:
+        start_server_process(setup_logger())
+
     window = VODEngineWindow()
     window.show()
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # The server runs in a child process, also in the frozen build
+    multiprocessing.freeze_support()
     run()
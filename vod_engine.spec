@@ -16,6 +16,9 @@ hiddenimports = [
     "whisper.model",
     "whisper.tokenizer",
 
+    "faster_whisper",
+    "ctranslate2",
+
     "torch",
     "torch.nn",
     "torch.nn.functional",